@@ -0,0 +1,281 @@
+# aggregates.py
+# Running totals behind the analytics charts: category counts, sums and cross-products.
+# Updated in O(batch) when responses are appended, instead of rescanning the history.
+
+import numpy as np
+import pandas as pd
+
+from components.schema import COLUMN_RANGES, FLOAT_COLUMNS, SURVEY_COLUMNS
+from components.sketch import QuantileSketch
+
+
+# columns whose codes are counted (everything except the float sleep hours)
+COUNT_COLUMNS = [c for c in SURVEY_COLUMNS if c not in FLOAT_COLUMNS]
+
+# two-way counts the charts need (waffle chart: wellness level per gender)
+CROSSTABS = [("Gender", "Depressed_Anxious")]
+
+# continuous columns with quantile sketches, overall and per wellness level
+SKETCH_COLUMNS = ["Sleep_Hours_Per_Night", "Study_Hours_Per_Week", "Age"]
+SKETCH_LEVEL_COLUMN = "Depressed_Anxious"
+SKETCH_LEVELS = list(range(COLUMN_RANGES[SKETCH_LEVEL_COLUMN][0], COLUMN_RANGES[SKETCH_LEVEL_COLUMN][1] + 1))
+
+# bumped whenever save() gains arrays, so files written before are rebuilt
+AGGREGATES_FORMAT = 2
+
+# int8 codes -> at most 128 distinct non-negative values per column
+CODE_SLOTS = 128
+
+# rows turned into a float64 matrix at a time (bounds memory on very large columns)
+CHUNK_ROWS = 250_000
+
+
+def _codes(values) -> np.ndarray:
+    codes = np.asarray(values).astype(np.int64)
+    if len(codes) and (codes.min() < 0 or codes.max() >= CODE_SLOTS):
+        raise ValueError(f"Survey codes must be between 0 and {CODE_SLOTS - 1}")
+    return codes
+
+
+class Moments:
+    """
+    n, per-column sums and the cross-product matrix of the survey columns
+    (the diagonal holds the sums of squares): enough for every Pearson
+    correlation between them in O(columns^2), whatever the number of rows.
+    Appended rows are folded in with update(); moments of disjoint row sets
+    (partitions, batches, cohort cells) merge by adding them.
+    """
+
+    def __init__(self, n=0, sums=None, cross=None):
+        p = len(SURVEY_COLUMNS)
+        self.n = n
+        self.sums = np.zeros(p, dtype=np.float64) if sums is None else sums
+        self.cross = np.zeros((p, p), dtype=np.float64) if cross is None else cross
+
+    # ---------- BUILD / UPDATE ----------
+    @classmethod
+    def from_arrays(cls, arrays):
+        return cls().update(arrays)
+
+    def update(self, arrays):
+        """
+        Add a batch of rows (mapping of survey column -> array). Cost is
+        O(batch rows x columns^2), independent of how many rows came before.
+        """
+        rows = len(arrays[SURVEY_COLUMNS[0]])
+        for start in range(0, rows, CHUNK_ROWS):
+            self._update_chunk(
+                {col: arrays[col][start:start + CHUNK_ROWS] for col in SURVEY_COLUMNS}
+            )
+        return self
+
+    def _update_chunk(self, arrays):
+        X = np.column_stack(
+            [np.asarray(arrays[col], dtype=np.float64) for col in SURVEY_COLUMNS]
+        )
+        self.n += len(X)
+        self.sums += X.sum(axis=0)
+        self.cross += X.T @ X
+
+    def merge(self, other: "Moments"):
+        """Add the moments of other, disjoint rows (e.g. another partition or batch)."""
+        self.n += other.n
+        self.sums += other.sums
+        self.cross += other.cross
+        return self
+
+    # ---------- PERSISTENCE ----------
+    def to_dict(self) -> dict:
+        return {"n": int(self.n), "sums": self.sums.tolist(), "cross": self.cross.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Moments":
+        return cls(data["n"], np.array(data["sums"], dtype=np.float64), np.array(data["cross"], dtype=np.float64))
+
+    # ---------- QUERIES ----------
+    def covariance(self) -> np.ndarray:
+        """
+        Sample covariance matrix. A column that does not vary (e.g. the one a
+        cohort is filtered on) gets exactly 0 in its row and column, not the
+        rounding left over from cross - n * mean^2, so its correlations are NaN.
+        """
+        mean = self.sums / self.n
+        cov = (self.cross - self.n * np.outer(mean, mean)) / (self.n - 1)
+        constant = np.diag(cov) <= 1e-12 * np.abs(np.diag(self.cross)) / max(self.n - 1, 1)
+        cov[constant, :] = 0.0
+        cov[:, constant] = 0.0
+        return cov
+
+    def corr(self, columns=None) -> pd.DataFrame:
+        """Pearson correlation matrix, same as DataFrame.corr() on the rows."""
+        columns = list(columns or SURVEY_COLUMNS)
+        idx = [SURVEY_COLUMNS.index(c) for c in columns]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = self.covariance()[np.ix_(idx, idx)]
+            std = np.sqrt(np.diag(cov))
+            corr = cov / np.outer(std, std)
+        np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+        return pd.DataFrame(corr, index=columns, columns=columns)
+
+    def corrwith(self, columns, target: str) -> pd.Series:
+        """Correlation of each column with target, same as df[columns].corrwith(df[target])."""
+        corr = self.corr(list(columns) + [target])
+        return corr[target].iloc[:-1]
+
+    def partial_corr(self, columns=None) -> pd.DataFrame:
+        """
+        Partial correlation of every pair of columns with all the other
+        columns held fixed, from one inversion of their covariance matrix:
+        -P[i, j] / sqrt(P[i, i] P[j, j]) for the precision matrix P. Columns
+        that do not vary get NaN; collinear ones are handled by the pseudo-inverse.
+        """
+        columns = list(columns or SURVEY_COLUMNS)
+        idx = [SURVEY_COLUMNS.index(c) for c in columns]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = self.covariance()[np.ix_(idx, idx)]
+        varying = np.diag(cov) > 0
+        partial = np.full((len(columns), len(columns)), np.nan)
+        if varying.any():
+            precision = np.linalg.pinv(cov[np.ix_(varying, varying)], hermitian=True)
+            scale = np.sqrt(np.diag(precision))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                block = -precision / np.outer(scale, scale)
+            np.fill_diagonal(block, 1.0)
+            partial[np.ix_(varying, varying)] = block
+        return pd.DataFrame(partial, index=columns, columns=columns)
+
+    def partial_corrwith(self, columns, target: str) -> pd.Series:
+        """Partial correlation of each column with target, the other columns held fixed."""
+        partial = self.partial_corr(list(columns) + [target])
+        return partial[target].iloc[:-1]
+
+
+class SurveyAggregates(Moments):
+    """
+    Sufficient statistics of the survey for the counting and correlation charts.
+
+    n, per-column sums and the cross-product matrix give every Pearson
+    correlation; code counts and crosstabs give every bar, donut and waffle
+    chart; quantile sketches give percentiles of the continuous columns.
+    Two aggregates over disjoint rows can be merged by adding them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.counts = np.zeros((len(COUNT_COLUMNS), CODE_SLOTS), dtype=np.int64)
+        self.crosstabs = {
+            pair: np.zeros((CODE_SLOTS, CODE_SLOTS), dtype=np.int64) for pair in CROSSTABS
+        }
+        # (column, wellness level or None for everyone) -> sketch
+        self.sketches = {
+            (col, level): QuantileSketch() for col in SKETCH_COLUMNS for level in [None] + SKETCH_LEVELS
+        }
+
+    # ---------- BUILD / UPDATE ----------
+    def _update_chunk(self, arrays):
+        super()._update_chunk(arrays)
+
+        for i, col in enumerate(COUNT_COLUMNS):
+            self.counts[i] += np.bincount(_codes(arrays[col]), minlength=CODE_SLOTS)
+
+        for (a, b), table in self.crosstabs.items():
+            flat = _codes(arrays[a]) * CODE_SLOTS + _codes(arrays[b])
+            table += np.bincount(flat, minlength=CODE_SLOTS * CODE_SLOTS).reshape(
+                CODE_SLOTS, CODE_SLOTS
+            )
+
+        levels = np.asarray(arrays[SKETCH_LEVEL_COLUMN])
+        for (col, level), sketch in self.sketches.items():
+            values = np.asarray(arrays[col])
+            sketch.update(values if level is None else values[levels == level])
+
+    def merge(self, other: "SurveyAggregates"):
+        super().merge(other)
+        self.counts += other.counts
+        for pair, table in other.crosstabs.items():
+            self.crosstabs[pair] += table
+        for key, sketch in other.sketches.items():
+            self.sketches[key].merge(sketch)
+        return self
+
+    # ---------- PERSISTENCE ----------
+    def save(self, path, **meta):
+        tables = {f"crosstab__{a}__{b}": t for (a, b), t in self.crosstabs.items()}
+        sketches = {
+            f"sketch__{col}__{level or 'all'}__{part}": values
+            for (col, level), sketch in self.sketches.items()
+            for part, values in sketch.to_arrays().items()
+        }
+        meta = dict(meta, format=AGGREGATES_FORMAT)
+        meta_arrays = {f"meta__{k}": np.asarray(v) for k, v in meta.items()}
+        np.savez(
+            path,
+            n=np.asarray(self.n),
+            sums=self.sums,
+            cross=self.cross,
+            counts=self.counts,
+            **tables,
+            **sketches,
+            **meta_arrays,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Return (aggregates, meta dict) saved by save(). meta["format"] tells
+        whether the file has everything this version keeps (AGGREGATES_FORMAT).
+        """
+        agg = cls()
+        meta = {}
+        sketches = {}
+        with np.load(path) as data:
+            agg.n = int(data["n"])
+            agg.sums = data["sums"]
+            agg.cross = data["cross"]
+            agg.counts = data["counts"]
+            for key in data.files:
+                if key.startswith("crosstab__"):
+                    _, a, b = key.split("__")
+                    agg.crosstabs[(a, b)] = data[key]
+                elif key.startswith("sketch__"):
+                    _, col, level, part = key.split("__")
+                    sketches.setdefault((col, None if level == "all" else int(level)), {})[part] = data[key]
+                elif key.startswith("meta__"):
+                    meta[key[len("meta__"):]] = data[key].item()
+        for key, arrays in sketches.items():
+            agg.sketches[key] = QuantileSketch.from_arrays(arrays)
+        meta.setdefault("format", 1)
+        return agg, meta
+
+    # ---------- QUERIES ----------
+    def value_counts(self, col: str, labels: dict = None) -> pd.Series:
+        """
+        Respondents per code (sorted by code, zero counts dropped), optionally
+        relabelled with a code -> label map.
+        """
+        counts = self.counts[COUNT_COLUMNS.index(col)]
+        codes = np.flatnonzero(counts)
+        series = pd.Series(counts[codes], index=codes, name="count")
+        if labels is not None:
+            series.index = series.index.map(labels)
+        return series
+
+    def quantiles(self, col: str, qs, level: int = None) -> np.ndarray:
+        """
+        Approximate values at fractions qs (0..1) of col, over everyone or one
+        wellness level; each is within about 1% of the responses of its true rank.
+        """
+        return self.sketches[(col, level)].quantiles(qs)
+
+    def box_stats(self, col: str) -> pd.DataFrame:
+        """Box-plot statistics of col per wellness level (rows), from the sketches."""
+        return pd.DataFrame(
+            {level: self.sketches[(col, level)].box_stats() for level in SKETCH_LEVELS}
+        ).T
+
+    def crosstab(self, a: str, b: str) -> pd.DataFrame:
+        """Counts per (a code, b code); only codes that occur are kept."""
+        table = self.crosstabs[(a, b)]
+        rows = np.flatnonzero(table.sum(axis=1))
+        cols = np.flatnonzero(table.sum(axis=0))
+        return pd.DataFrame(table[np.ix_(rows, cols)], index=rows, columns=cols)
@@ -0,0 +1,208 @@
+# association.py
+# Association measures between survey columns, from pairwise contingency tables.
+#
+# Almost every survey column is a code on a small scale (Likert items,
+# categories), so the full joint distribution of any two columns is a small
+# table. The tables for every pair are counted once, one np.bincount over
+# the combined codes per pair, and every measure is then computed from them
+# without going back to the rows:
+#
+#     tables = PairTables.from_arrays(arrays, SURVEY_COLUMNS)
+#     tables.matrix("spearman", ["Social_Support", "Depressed_Anxious"])
+#     tables.with_target("cramers_v", predictors, "Depressed_Anxious")
+
+import numpy as np
+import pandas as pd
+
+from components.schema import COLUMN_RANGES, FLOAT_COLUMNS
+
+
+# measure -> display name
+MEASURES = {
+    "pearson": "Pearson r",
+    "spearman": "Spearman ρ",
+    "kendall": "Kendall τ-b",
+    "cramers_v": "Cramér's V",
+    "mutual_info": "Mutual information (normalised)",
+}
+
+# measures with a direction (-1 .. 1); the others run from 0 (independent) to 1
+SIGNED_MEASURES = {"pearson", "spearman", "kendall"}
+
+
+def _categories(col, values):
+    # (category index per row, value of each category); codes map straight
+    # to their slot in the column's declared range, floats are sorted first
+    values = np.asarray(values)
+    if col in FLOAT_COLUMNS:
+        categories, index = np.unique(values, return_inverse=True)
+        return index.reshape(-1), categories
+    lo, hi = COLUMN_RANGES[col]
+    return values.astype(np.int64) - lo, np.arange(lo, hi + 1)
+
+
+def _midranks(margin):
+    # average rank of each category when the responses are sorted (ties share the mean rank)
+    return np.cumsum(margin) - margin + (margin + 1) / 2
+
+
+def _pearson(x, y, table):
+    n = table.sum()
+    mx, my = table.sum(axis=1) @ x / n, table.sum(axis=0) @ y / n
+    dx, dy = x - mx, y - my
+    cov = dx @ table @ dy
+    var_x, var_y = table.sum(axis=1) @ dx**2, table.sum(axis=0) @ dy**2
+    if var_x <= 0 or var_y <= 0:
+        return np.nan
+    return cov / np.sqrt(var_x * var_y)
+
+
+def _kendall_tau_b(table):
+    # concordant pairs: the other response is higher on both; discordant: higher on one only
+    n = table.sum()
+    below_right = np.zeros_like(table)
+    below_left = np.zeros_like(table)
+    after_rows = np.cumsum(table[::-1], axis=0)[::-1]  # rows >= i
+    after_rows = np.vstack([after_rows[1:], np.zeros((1, table.shape[1]))])  # rows > i
+    below_right[:, :-1] = np.cumsum(after_rows[:, ::-1], axis=1)[:, ::-1][:, 1:]  # cols > j
+    below_left[:, 1:] = np.cumsum(after_rows, axis=1)[:, :-1]  # cols < j
+    concordant = (table * below_right).sum()
+    discordant = (table * below_left).sum()
+
+    pairs = n * (n - 1) / 2
+    ties_x = (table.sum(axis=1) * (table.sum(axis=1) - 1)).sum() / 2
+    ties_y = (table.sum(axis=0) * (table.sum(axis=0) - 1)).sum() / 2
+    denominator = np.sqrt((pairs - ties_x) * (pairs - ties_y))
+    return (concordant - discordant) / denominator if denominator > 0 else np.nan
+
+
+def _cramers_v(table):
+    n = table.sum()
+    k = min(table.shape) - 1
+    if k == 0:
+        return np.nan
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / n
+    chi2 = (table**2 / expected).sum() - n
+    return np.sqrt(max(chi2, 0) / (n * k))
+
+
+def _entropy(p):
+    p = p[p > 0]
+    return -(p * np.log(p)).sum()
+
+
+def _normalised_mutual_info(table):
+    p = table / table.sum()
+    px, py = p.sum(axis=1), p.sum(axis=0)
+    hx, hy = _entropy(px), _entropy(py)
+    if hx <= 0 or hy <= 0:
+        return np.nan
+    nz = p > 0
+    mi = (p[nz] * np.log(p[nz] / np.outer(px, py)[nz])).sum()
+    return mi / np.sqrt(hx * hy)
+
+
+def association(measure: str, x, y, table) -> float:
+    """`measure` between two columns from their table (rows: values x, columns: values y)."""
+    table = np.asarray(table, dtype=np.float64)
+    if table.sum() < 2:
+        return np.nan
+    if measure == "pearson":
+        return _pearson(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), table)
+    if measure == "spearman":
+        return _pearson(_midranks(table.sum(axis=1)), _midranks(table.sum(axis=0)), table)
+    if measure == "kendall":
+        return _kendall_tau_b(table)
+    if measure == "cramers_v":
+        return _cramers_v(table)
+    if measure == "mutual_info":
+        return _normalised_mutual_info(table)
+    raise ValueError(f"Unknown association measure {measure!r}; expected one of {list(MEASURES)}")
+
+
+class PairTables:
+    """
+    Contingency tables of every pair of `columns`. arrays holds:
+      values__<col>         value of each category of col
+      table__<a>__<b>       responses per (a category, b category), a before b in columns
+    """
+
+    def __init__(self, arrays: dict):
+        self.arrays = arrays
+        self.columns = [key.split("__")[1] for key in arrays if key.startswith("values__")]
+
+    @classmethod
+    def from_arrays(cls, arrays, columns, weights=None) -> "PairTables":
+        """
+        Count the tables over the rows of arrays (column name -> values), one
+        bincount per pair; with weights (one per row) the tables hold weighted counts.
+        """
+        columns = list(columns)
+        index, out = {}, {}
+        for col in columns:
+            index[col], out[f"values__{col}"] = _categories(col, arrays[col])
+        for i, a in enumerate(columns):
+            for b in columns[i + 1:]:
+                size_a, size_b = len(out[f"values__{a}"]), len(out[f"values__{b}"])
+                flat = index[a] * size_b + index[b]
+                out[f"table__{a}__{b}"] = np.bincount(flat, weights=weights, minlength=size_a * size_b).reshape(
+                    size_a, size_b
+                )
+        return cls(out)
+
+    def merge(self, other: "PairTables"):
+        """Add the tables of other, disjoint rows over the same columns; categories seen on either side are united."""
+        values = {
+            col: np.union1d(self.arrays[f"values__{col}"], other.arrays[f"values__{col}"]) for col in self.columns
+        }
+        out = {f"values__{col}": categories for col, categories in values.items()}
+        for i, a in enumerate(self.columns):
+            for b in self.columns[i + 1:]:
+                key = f"table__{a}__{b}"
+                total = np.zeros((len(values[a]), len(values[b])), dtype=self.arrays[key].dtype)
+                for tables in (self, other):
+                    rows = np.searchsorted(values[a], tables.arrays[f"values__{a}"])
+                    cols = np.searchsorted(values[b], tables.arrays[f"values__{b}"])
+                    total[np.ix_(rows, cols)] += tables.arrays[key]
+                out[key] = total
+        self.arrays = out
+        return self
+
+    @property
+    def n(self) -> int:
+        first, second = self.columns[:2]
+        return round(self.arrays[f"table__{first}__{second}"].sum())
+
+    def table(self, a: str, b: str):
+        """(a values, b values, counts) with categories no response has dropped."""
+        if self.columns.index(a) < self.columns.index(b):
+            counts = self.arrays[f"table__{a}__{b}"]
+        else:
+            counts = self.arrays[f"table__{b}__{a}"].T
+        rows = np.flatnonzero(counts.sum(axis=1))
+        cols = np.flatnonzero(counts.sum(axis=0))
+        return (
+            self.arrays[f"values__{a}"][rows],
+            self.arrays[f"values__{b}"][cols],
+            counts[np.ix_(rows, cols)],
+        )
+
+    def measure(self, measure: str, a: str, b: str) -> float:
+        if a == b:
+            # a column against itself: 1 unless it never varies
+            other = next(col for col in self.columns if col != a)
+            values, _, _ = self.table(a, other)
+            return 1.0 if len(values) > 1 else np.nan
+        return association(measure, *self.table(a, b))
+
+    def matrix(self, measure: str, columns) -> pd.DataFrame:
+        columns = list(columns)
+        values = np.empty((len(columns), len(columns)))
+        for i, a in enumerate(columns):
+            values[i, i] = self.measure(measure, a, a)
+            for j in range(i + 1, len(columns)):
+                values[i, j] = values[j, i] = self.measure(measure, a, columns[j])
+        return pd.DataFrame(values, index=columns, columns=columns)
+
+    def with_target(self, measure: str, columns, target: str) -> pd.Series:
+        return pd.Series([self.measure(measure, col, target) for col in columns], index=list(columns))
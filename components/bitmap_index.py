@@ -0,0 +1,135 @@
+# bitmap_index.py
+# Bitmap index over the coded survey columns, for fast cohort counts.
+#
+# For every (column, code) pair the index keeps one packed bitset: bit i of
+# the uint64 words is set when row i has that code. A cohort such as
+# "Female AND Diploma AND Financial_Stress >= 4" is then an OR of bitsets
+# within each column, an AND across columns, and a popcount:
+#
+#     index = BitmapIndex.from_arrays(arrays)
+#     bits = index.select({"Gender": [1], "Current_Level_of_Studies": [2], "Financial_Stress": [4, 5]})
+#     index.count(bits)
+#
+# Cost is O(rows / 64) word operations per predicate instead of O(rows).
+
+import numpy as np
+
+from components.schema import COLUMN_RANGES, FLOAT_COLUMNS, SURVEY_COLUMNS
+
+
+# every coded column: the categorical / Likert items plus Age (at most 71 codes,
+# needed for age-range filters). Study hours and sleep hours are measurements.
+INDEXED_COLUMNS = [
+    c for c in SURVEY_COLUMNS if c not in FLOAT_COLUMNS and c != "Study_Hours_Per_Week"
+]
+
+WORD_BITS = 64
+
+
+def pack_mask(mask: np.ndarray) -> np.ndarray:
+    """Boolean row mask -> bitset (uint64 words, bit i = row i, zero padded)."""
+    packed = np.packbits(mask, bitorder="little")
+    padded = np.zeros(-(-len(packed) // 8) * 8, dtype=np.uint8)
+    padded[: len(packed)] = packed
+    return padded.view(np.uint64)
+
+
+def popcount(bits: np.ndarray) -> int:
+    return int(np.bitwise_count(bits).sum())
+
+
+class BitmapIndex:
+    """
+    One bitset per (column, code) of INDEXED_COLUMNS over the same rows.
+    Bitsets are read-only; combine them with the methods below, which return
+    new bitsets.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.bitsets = {
+            col: {code: np.zeros(0, dtype=np.uint64) for code in range(lo, hi + 1)}
+            for col, (lo, hi) in ((c, COLUMN_RANGES[c]) for c in INDEXED_COLUMNS)
+        }
+
+    # ---------- BUILD / UPDATE ----------
+    @classmethod
+    def from_arrays(cls, arrays) -> "BitmapIndex":
+        return cls().update(arrays)
+
+    def update(self, arrays):
+        """
+        Append a batch of rows (mapping of column -> codes). The batch's bits
+        continue the last, partly filled word, so appending costs O(batch).
+        """
+        rows = len(arrays[INDEXED_COLUMNS[0]])
+        offset = self.rows % WORD_BITS
+        lead = np.zeros(offset, dtype=bool)
+        for col, codes in self.bitsets.items():
+            values = np.asarray(arrays[col])
+            for code, bits in codes.items():
+                new = pack_mask(np.concatenate([lead, values == code]))
+                if offset:
+                    # the first new word overlaps the old last word
+                    bits = bits.copy()
+                    bits[-1] |= new[0]
+                    new = new[1:]
+                merged = np.concatenate([bits, new])
+                merged.flags.writeable = False
+                codes[code] = merged
+        self.rows += rows
+        return self
+
+    # ---------- PREDICATES ----------
+    def _empty(self) -> np.ndarray:
+        return np.zeros(-(-self.rows // WORD_BITS), dtype=np.uint64)
+
+    def all_rows(self) -> np.ndarray:
+        return self.not_(self._empty())
+
+    def isin(self, col: str, codes) -> np.ndarray:
+        """Rows whose `col` code is any of `codes` (OR of the code bitsets)."""
+        bits = self._empty()
+        for code in codes:
+            if code in self.bitsets[col]:
+                bits |= self.bitsets[col][code]
+        return bits
+
+    def between(self, col: str, lo, hi) -> np.ndarray:
+        """Rows with lo <= col <= hi (inclusive), e.g. Financial_Stress >= 4 is between(.., 4, 5)."""
+        return self.isin(col, [code for code in self.bitsets[col] if lo <= code <= hi])
+
+    def select(self, filters=None) -> np.ndarray:
+        """AND over columns of the allowed codes per column (column -> codes)."""
+        bits = self.all_rows()
+        for col, codes in (filters or {}).items():
+            bits &= self.isin(col, codes)
+        return bits
+
+    def not_(self, bits: np.ndarray) -> np.ndarray:
+        out = ~bits
+        tail = self.rows % WORD_BITS
+        if tail and len(out):
+            # bits past the last row stay clear so counts stay right
+            out[-1] &= np.uint64((1 << tail) - 1)
+        return out
+
+    # ---------- RESULTS ----------
+    def count(self, bits: np.ndarray) -> int:
+        return popcount(bits)
+
+    def counts_by(self, col: str, bits: np.ndarray = None) -> dict:
+        """Rows per code of `col` within bits (all rows when None); zero counts dropped."""
+        counts = {}
+        for code, code_bits in self.bitsets[col].items():
+            n = popcount(code_bits if bits is None else code_bits & bits)
+            if n:
+                counts[code] = n
+        return counts
+
+    def mask(self, bits: np.ndarray) -> np.ndarray:
+        """Bitset -> boolean row mask, to pull the matching rows out of the columns."""
+        return np.unpackbits(bits.view(np.uint8), count=self.rows, bitorder="little").astype(bool)
+
+    def nbytes(self) -> int:
+        return sum(bits.nbytes for codes in self.bitsets.values() for bits in codes.values())
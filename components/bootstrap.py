@@ -0,0 +1,118 @@
+# bootstrap.py
+# Bootstrap confidence intervals for correlations, from joint counts.
+#
+# A correlation between two coded columns only depends on how many responses
+# fall in each (x, y) cell. Resampling n responses with replacement is then a
+# multinomial draw of n over those cells, so a batch of replicates is one
+# (replicates x cells) count matrix and five matrix-vector products, at a
+# cost set by the number of cells rather than the number of responses.
+# Many correlations at once (bootstrap_corrs) are spread over a process pool.
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+
+RESAMPLES = 2000
+CONFIDENCE = 0.95
+
+# replicates drawn per count matrix (bounds memory on wide tables)
+BATCH = 500
+
+WORKERS = min(os.cpu_count() or 1, 8)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _executor() -> ProcessPoolExecutor:
+    # one pool per server process, started on first use; "spawn" because the
+    # Streamlit server is multi-threaded and forking it is not safe
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard(pool: ProcessPoolExecutor):
+    # a worker died (OOM kill, failed spawn): drop the broken pool so the next call starts a fresh one
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def bootstrap_corr(x, y, counts, resamples=RESAMPLES, seed=0) -> np.ndarray:
+    """
+    Pearson r of `resamples` bootstrap resamples of the responses, where
+    counts[i, j] responses have (x[i], y[j]). NaN where a resample has no
+    spread in x or y, and all NaN when there are no responses (e.g. a
+    cohort whose weights are all 0). Weighted (fractional) counts are
+    resampled as the rounded total drawn from the weighted shares.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    if counts.sum() <= 0:
+        return np.full(resamples, np.nan)
+    xs = np.repeat(np.asarray(x, dtype=np.float64), len(y))
+    ys = np.tile(np.asarray(y, dtype=np.float64), len(x))
+    cells = counts.ravel() > 0
+    xs, ys, p = xs[cells], ys[cells], counts.ravel()[cells] / counts.sum()
+    n = round(counts.sum())
+
+    rng = np.random.default_rng(seed)
+    out = np.empty(resamples)
+    for start in range(0, resamples, BATCH):
+        draws = rng.multinomial(n, p, size=min(BATCH, resamples - start)).astype(np.float64)
+        sx, sy = draws @ xs, draws @ ys
+        sxx, syy, sxy = draws @ (xs * xs), draws @ (ys * ys), draws @ (xs * ys)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[start:start + len(draws)] = (sxy - sx * sy / n) / np.sqrt(
+                (sxx - sx * sx / n) * (syy - sy * sy / n)
+            )
+    return out
+
+
+def bootstrap_corrs(tables: dict, resamples=RESAMPLES, seed=0) -> dict:
+    """
+    bootstrap_corr for every name -> (x, y, counts) in tables, one task per
+    table on the process pool (in this process when there is one worker).
+    Each table gets its own seed, so results do not depend on scheduling.
+    """
+    jobs = {name: (x, y, counts, resamples, (seed, i)) for i, (name, (x, y, counts)) in enumerate(tables.items())}
+    if WORKERS > 1 and len(jobs) > 1:
+        pool = _executor()
+        try:
+            futures = {name: pool.submit(bootstrap_corr, *args) for name, args in jobs.items()}
+            return {name: future.result() for name, future in futures.items()}
+        except BrokenProcessPool:
+            _discard(pool)
+    return {name: bootstrap_corr(*args) for name, args in jobs.items()}
+
+
+def percentile_interval(replicates, confidence=CONFIDENCE):
+    """(low, high) percentile interval of the finite replicates; NaNs when there are none."""
+    finite = replicates[np.isfinite(replicates)]
+    if len(finite) == 0:
+        return np.nan, np.nan
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(finite, [tail, 100 - tail])
+    return low, high
+
+
+def flag_ties(ranked: pd.DataFrame) -> pd.Series:
+    """
+    For rows sorted by strength (columns low / high): True where a row's
+    interval overlaps the next row's, i.e. the order of the two is not settled.
+    """
+    overlaps = ranked["low"].to_numpy()[:-1] <= ranked["high"].to_numpy()[1:]
+    ties = np.zeros(len(ranked), dtype=bool)
+    ties[:-1] |= overlaps
+    ties[1:] |= overlaps
+    return pd.Series(ties, index=ranked.index, name="tied")
@@ -0,0 +1,213 @@
+# cohort.py
+# Per-cohort sufficient statistics behind the cross-filter panel.
+#
+# Rows are grouped into cells, one per combination of the filterable
+# demographic codes (age, gender, level of study, field, institution type).
+# Each occupied cell keeps its row count, column sums and cross-products
+# (for correlations) plus small per-wellness-level histograms of the charted
+# columns and, optionally, the pairwise contingency tables of the other
+# columns. Any filter on those columns selects whole cells, so a filtered
+# chart is a sum over at most a few thousand cells, however many rows there are:
+#
+#     stats = CohortStats.from_arrays(arrays, {"sleep": ["Sleep_Hours_Per_Night"]}, ["Social_Support", ...])
+#     cells = stats.select({"Gender": [1], "Age": range(18, 25)})
+#     stats.moments(cells).corr(), stats.histogram("sleep", cells), stats.pair_tables(cells)
+
+import numpy as np
+
+from components.aggregates import Moments
+from components.association import PairTables
+from components.groupby import group_index
+from components.schema import COLUMN_RANGES, SURVEY_COLUMNS
+
+
+# the sidebar filters; every other column is summarised inside the cells
+FILTER_DIMS = [
+    "Age",
+    "Gender",
+    "Current_Level_of_Studies",
+    "Field_of_Study",
+    "Type_of_Institution",
+]
+
+WELLNESS_COLUMN = "Depressed_Anxious"
+
+
+class CohortStats:
+    """
+    Statistics of every occupied filter cell. arrays holds:
+      cells                 (cells, len(FILTER_DIMS)) codes of each cell
+      n, sums, cross        row count, column sums, cross-product matrix per cell
+      axis__<name>__<col>   distinct values of col in histogram <name>
+      hist__<name>          counts per (cell, value of each col..., wellness level)
+      values__<col>         distinct values of a pair column col
+      pair__<a>__<b>        counts per (cell, value of a, value of b), a before b in the pair columns
+    """
+
+    def __init__(self, arrays: dict):
+        self.arrays = arrays
+        self.cells = arrays["cells"]
+        self.histograms = {}
+        for key in arrays:
+            if key.startswith("axis__"):
+                _, name, col = key.split("__")
+                self.histograms.setdefault(name, []).append(col)
+        self.pairs = [col for col in SURVEY_COLUMNS if f"values__{col}" in arrays]
+
+    # ---------- BUILD ----------
+    @classmethod
+    def from_arrays(cls, arrays, histograms: dict, pairs=()) -> "CohortStats":
+        """
+        Build from survey columns (column name -> codes); histograms maps a
+        name to the columns counted jointly per wellness level, and every two
+        of the pair columns (none of FILTER_DIMS) get a contingency table per cell.
+        """
+        cell, cells = group_index(arrays, FILTER_DIMS)
+        m = len(cells)
+
+        out = {"cells": cells.to_numpy().astype(np.int16), "n": np.bincount(cell, minlength=m)}
+        x = [np.asarray(arrays[c], dtype=np.float64) for c in SURVEY_COLUMNS]
+        p = len(SURVEY_COLUMNS)
+        sums = np.empty((m, p))
+        cross = np.empty((m, p, p))
+        for i in range(p):
+            sums[:, i] = np.bincount(cell, weights=x[i], minlength=m)
+            for j in range(i, p):
+                cross[:, i, j] = cross[:, j, i] = np.bincount(cell, weights=x[i] * x[j], minlength=m)
+        out["sums"], out["cross"] = sums, cross
+
+        lo, hi = COLUMN_RANGES[WELLNESS_COLUMN]
+        level = np.asarray(arrays[WELLNESS_COLUMN]).astype(np.int64) - lo
+        for name, columns in histograms.items():
+            flat, shape = cell, [m]
+            for col in columns:
+                values, index = np.unique(np.asarray(arrays[col]), return_inverse=True)
+                out[f"axis__{name}__{col}"] = values
+                flat = flat * len(values) + index.reshape(-1)
+                shape.append(len(values))
+            flat = flat * (hi - lo + 1) + level
+            shape.append(hi - lo + 1)
+            out[f"hist__{name}"] = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+
+        pairs = [col for col in SURVEY_COLUMNS if col in pairs]
+        index = {}
+        for col in pairs:
+            out[f"values__{col}"], index[col] = np.unique(np.asarray(arrays[col]), return_inverse=True)
+        for i, a in enumerate(pairs):
+            for b in pairs[i + 1:]:
+                shape = (m, len(out[f"values__{a}"]), len(out[f"values__{b}"]))
+                flat = (cell * shape[1] + index[a].reshape(-1)) * shape[2] + index[b].reshape(-1)
+                # int32: the per-cell tables are the bulk of the snapshot, and no cell holds 2**31 rows
+                counts = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+                out[f"pair__{a}__{b}"] = counts.astype(np.int32)
+        return cls(out)
+
+    def merge(self, other: "CohortStats"):
+        """
+        Add the statistics of other, disjoint rows (e.g. the next batch of a
+        chunked pass) with the same histograms; cells and histogram values
+        seen on either side are united, in the same sorted order as from_arrays.
+        """
+        cells, index = np.unique(np.concatenate([self.cells, other.cells]), axis=0, return_inverse=True)
+        index = index.reshape(-1)
+        sides = [(self, index[: len(self.cells)]), (other, index[len(self.cells):])]
+
+        out = {"cells": cells}
+        for key in ("n", "sums", "cross"):
+            total = np.zeros((len(cells),) + self.arrays[key].shape[1:], dtype=self.arrays[key].dtype)
+            for stats, rows in sides:
+                total[rows] += stats.arrays[key]
+            out[key] = total
+
+        for name, columns in self.histograms.items():
+            axes = [np.union1d(mine, theirs) for mine, theirs in zip(self.axes(name), other.axes(name))]
+            out.update({f"axis__{name}__{col}": values for col, values in zip(columns, axes)})
+            levels = np.arange(self.arrays[f"hist__{name}"].shape[-1])
+            total = np.zeros((len(cells), *map(len, axes), len(levels)), dtype=np.int64)
+            for stats, rows in sides:
+                slots = [np.searchsorted(values, own) for values, own in zip(axes, stats.axes(name))]
+                total[np.ix_(rows, *slots, levels)] += stats.arrays[f"hist__{name}"]
+            out[f"hist__{name}"] = total
+
+        values = {col: np.union1d(self.arrays[f"values__{col}"], other.arrays[f"values__{col}"]) for col in self.pairs}
+        out.update({f"values__{col}": categories for col, categories in values.items()})
+        for i, a in enumerate(self.pairs):
+            for b in self.pairs[i + 1:]:
+                key = f"pair__{a}__{b}"
+                total = np.zeros((len(cells), len(values[a]), len(values[b])), dtype=self.arrays[key].dtype)
+                for stats, rows in sides:
+                    slots_a = np.searchsorted(values[a], stats.arrays[f"values__{a}"])
+                    slots_b = np.searchsorted(values[b], stats.arrays[f"values__{b}"])
+                    total[np.ix_(rows, slots_a, slots_b)] += stats.arrays[key]
+                out[key] = total
+
+        self.__init__(out)
+        return self
+
+    # ---------- QUERIES ----------
+    def select(self, filters=None) -> np.ndarray:
+        """Boolean mask of the cells whose codes are all allowed by filters (column -> codes)."""
+        keep = np.ones(len(self.cells), dtype=bool)
+        for col, codes in (filters or {}).items():
+            keep &= np.isin(self.cells[:, FILTER_DIMS.index(col)], list(codes))
+        return keep
+
+    def count(self, cells: np.ndarray) -> int:
+        return int(self.arrays["n"][cells].sum())
+
+    def _total(self, per_cell: np.ndarray, cells: np.ndarray, weights=None) -> np.ndarray:
+        # total of per_cell (one entry per selected cell), each scaled by its cell's weight when given
+        if weights is None:
+            return per_cell.sum(axis=0)
+        return np.tensordot(weights[cells], per_cell, axes=1)
+
+    def _sum(self, key: str, cells: np.ndarray, weights=None) -> np.ndarray:
+        return self._total(self.arrays[key][cells], cells, weights)
+
+    def moments(self, cells: np.ndarray, weights=None) -> Moments:
+        """Moments of the selected cells; weights (one per cell) turns them into weighted moments."""
+        n = self.count(cells) if weights is None else float(weights[cells] @ self.arrays["n"][cells])
+        return Moments(n, self._sum("sums", cells, weights), self._sum("cross", cells, weights))
+
+    def axes(self, name: str) -> list:
+        """Distinct values of each column of histogram name, in its axis order."""
+        return [self.arrays[f"axis__{name}__{col}"] for col in self.histograms[name]]
+
+    def histogram(self, name: str, cells: np.ndarray, weights=None) -> np.ndarray:
+        """Counts per (value of each column..., wellness level) over the selected cells, optionally weighted."""
+        return self._sum(f"hist__{name}", cells, weights)
+
+    def _pair_counts(self, col: str, cells: np.ndarray) -> np.ndarray:
+        # responses per (selected cell, value of pair column col), from one of its pair tables
+        other = next(c for c in self.pairs if c != col)
+        a, b = sorted([col, other], key=self.pairs.index)
+        return self.arrays[f"pair__{a}__{b}"][cells].sum(axis=2 if a == col else 1)
+
+    def pair_tables(self, cells: np.ndarray, weights=None) -> PairTables:
+        """
+        Contingency tables of every pair of FILTER_DIMS and pair columns over
+        the selected cells, i.e. of the cohort's rows; weighted counts with
+        weights (one per cell). A filter column has one code per cell, so its
+        tables are the cells' counts of the other column placed at that code.
+        """
+        columns = FILTER_DIMS + self.pairs
+        arrays, per_cell = {}, {}
+        for i, col in enumerate(FILTER_DIMS):
+            codes = self.cells[cells, i]
+            arrays[f"values__{col}"] = np.unique(codes)
+            per_cell[col] = (codes[:, None] == arrays[f"values__{col}"]).astype(np.int64)
+        for col in self.pairs:
+            arrays[f"values__{col}"] = self.arrays[f"values__{col}"]
+            per_cell[col] = self._pair_counts(col, cells)
+
+        n = self.arrays["n"][cells]
+        for i, a in enumerate(columns):
+            for b in columns[i + 1:]:
+                if b in self.pairs and a in self.pairs:
+                    table = self.arrays[f"pair__{a}__{b}"][cells]
+                elif b in self.pairs:
+                    table = per_cell[a][:, :, None] * per_cell[b][:, None, :]
+                else:
+                    table = per_cell[a][:, :, None] * (per_cell[b] * n[:, None])[:, None, :]
+                arrays[f"table__{a}__{b}"] = self._total(table, cells, weights)
+        return PairTables(arrays)
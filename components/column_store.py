@@ -0,0 +1,193 @@
+# column_store.py
+# On-disk survey store: one fixed-width binary file per column, opened with np.memmap.
+#
+# Build (or rebuild) it from the cleaned CSV with:
+#     python -m components.column_store [--csv PATH] [--store DIR]
+#
+# Batches appended with components/ingest.py are added to the end of the
+# column files when the store is next opened, without rewriting it.
+
+import argparse
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from components.features import DERIVED_SOURCES, derive_column
+from components.fileio import atomic_write_json, file_lock, file_stamp, read_json
+from components.ingest import INGEST_DIR, read_log, read_segment, segment_paths
+from components.schema import SURVEY_COLUMNS, column_dtype, to_compact_arrays
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_CSV = BASE_DIR / "assets" / "data" / "Cleaned_Form_Responses.csv"
+STORE_DIR = BASE_DIR / "assets" / "data" / "column_store"
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = ".column_store.lock"
+
+# rows parsed per CSV chunk while building; bounds memory for multi-million-row exports
+CHUNK_ROWS = 250_000
+
+
+def build_column_store(csv_path=DEFAULT_CSV, store_dir=STORE_DIR, chunksize=CHUNK_ROWS) -> Path:
+    """
+    Stream the cleaned CSV in chunks and write every column to <store>/<column>.bin.
+
+    Each chunk is validated and compacted with the same rules as the in-memory
+    loader, then appended to the column files, so memory stays at one chunk no
+    matter how many rows the export has. The store is built in a temp folder
+    and swapped in at the end, so readers never see a half-written store.
+    """
+    csv_path = Path(csv_path)
+    store_dir = Path(store_dir)
+    tmp_dir = store_dir.with_name(store_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    files = {col: open(tmp_dir / f"{col}.bin", "wb") for col in SURVEY_COLUMNS}
+    rows = 0
+    try:
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            for col, values in to_compact_arrays(chunk).items():
+                files[col].write(values.tobytes())
+            rows += len(chunk)
+    finally:
+        for f in files.values():
+            f.close()
+
+    manifest = {
+        "rows": rows,
+        "columns": {col: column_dtype(col).str for col in SURVEY_COLUMNS},
+        "source": file_stamp(csv_path),
+        "segments": 0,
+    }
+    with open(tmp_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    # open memmaps of an older store stay valid after the old files are unlinked
+    shutil.rmtree(store_dir, ignore_errors=True)
+    os.replace(tmp_dir, store_dir)
+    return store_dir
+
+
+def is_store_current(csv_path=DEFAULT_CSV, store_dir=STORE_DIR) -> bool:
+    manifest = read_json(Path(store_dir) / MANIFEST_NAME)
+    return manifest is not None and manifest.get("source") == file_stamp(csv_path)
+
+
+def sync_segments(store_dir=STORE_DIR, ingest_dir=INGEST_DIR) -> int:
+    """
+    Append ingested batches the store does not hold yet. Only the new rows are
+    read and written, so this is O(new rows). Returns the number of batches added.
+    """
+    store_dir = Path(store_dir)
+    manifest = read_json(store_dir / MANIFEST_NAME)
+    pending = segment_paths(read_log(ingest_dir), ingest_dir)[manifest.get("segments", 0):]
+
+    for path in pending:
+        arrays = read_segment(path)
+        for col in SURVEY_COLUMNS:
+            with open(store_dir / f"{col}.bin", "r+b") as f:
+                # drop bytes left behind by an append that crashed before the manifest update
+                f.truncate(manifest["rows"] * column_dtype(col).itemsize)
+                f.seek(0, os.SEEK_END)
+                f.write(arrays[col].tobytes())
+        manifest["rows"] += len(arrays[SURVEY_COLUMNS[0]])
+        manifest["segments"] = manifest.get("segments", 0) + 1
+        atomic_write_json(store_dir / MANIFEST_NAME, manifest)
+
+    return len(pending)
+
+
+class ColumnStore:
+    """
+    Read-only mapping of column name -> array backed by the files of one store.
+
+    Raw columns are np.memmap views (nothing is read until a chart touches the
+    pages); derived columns are computed from them on first access. Both are
+    kept for the life of the process, so resident memory grows with the set of
+    columns the tabs use, not with the number of columns in the survey.
+    """
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = Path(store_dir)
+        with open(self.store_dir / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.rows = int(self.manifest["rows"])
+        self._columns = {}
+        self._lock = threading.RLock()  # derived columns re-enter to open their sources
+
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, name):
+        return name in self.manifest["columns"] or name in DERIVED_SOURCES
+
+    def __getitem__(self, name):
+        column = self._columns.get(name)
+        if column is None:
+            with self._lock:
+                column = self._columns.get(name)
+                if column is None:
+                    column = self._open(name)
+                    self._columns[name] = column
+        return column
+
+    def _open(self, name):
+        if name in self.manifest["columns"]:
+            dtype = np.dtype(self.manifest["columns"][name])
+            if self.rows == 0:
+                return np.empty(0, dtype=dtype)
+            return np.memmap(
+                self.store_dir / f"{name}.bin", dtype=dtype, mode="r", shape=(self.rows,)
+            )
+        if name in DERIVED_SOURCES:
+            return derive_column(name, self)
+        raise KeyError(name)
+
+    def loaded_columns(self):
+        """Columns opened so far (handy when checking what a tab pages in)."""
+        return list(self._columns)
+
+    def chunks(self, columns, chunksize=CHUNK_ROWS):
+        """
+        The rows as batches of chunksize (column name -> array), each copied
+        out of the mapped pages; a single empty batch when there are no rows.
+        """
+        for start in range(0, max(self.rows, 1), chunksize):
+            yield {col: np.array(self[col][start:start + chunksize]) for col in columns}
+
+
+def open_column_store(csv_path=DEFAULT_CSV, store_dir=STORE_DIR, ingest_dir=INGEST_DIR) -> ColumnStore:
+    """
+    Open the column store for csv_path, (re)building it first when it is
+    missing or older than the CSV, and appending any newly ingested batches.
+    """
+    store_dir = Path(store_dir)
+    store_dir.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(store_dir.with_name(LOCK_NAME)):
+        if not is_store_current(csv_path, store_dir):
+            build_column_store(csv_path, store_dir)
+        sync_segments(store_dir, ingest_dir)
+    return ColumnStore(store_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the memory-mapped survey column store.")
+    parser.add_argument("--csv", default=str(DEFAULT_CSV), help="cleaned survey CSV")
+    parser.add_argument("--store", default=str(STORE_DIR), help="output folder")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="rows per CSV chunk")
+    args = parser.parse_args(argv)
+
+    store_dir = build_column_store(args.csv, args.store, args.chunksize)
+    sync_segments(store_dir)
+    store = ColumnStore(store_dir)
+    print(f"Wrote {store.rows} rows x {len(SURVEY_COLUMNS)} columns to {store_dir}")
+
+
+if __name__ == "__main__":
+    main()
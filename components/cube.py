@@ -0,0 +1,113 @@
+# cube.py
+# Dense count cube over the demographic columns of the WHO WE ARE tab.
+#
+# One cell per (age, gender, level of study, field, institution type, wellness
+# level), holding the number of respondents. Every chart on the tab is a sum
+# over some axes of the cube, so its cost depends on the cube's fixed shape
+# (about 12.8k cells), not on the number of rows.
+
+import numpy as np
+import pandas as pd
+
+from components.schema import COLUMN_RANGES
+
+
+# Age is kept in one-year buckets so the age distribution chart stays exact
+CUBE_DIMS = [
+    "Age",
+    "Gender",
+    "Current_Level_of_Studies",
+    "Field_of_Study",
+    "Type_of_Institution",
+    "Depressed_Anxious",
+]
+
+
+def _whole(totals: np.ndarray) -> np.ndarray:
+    # weighted cubes hold fractional respondents; charts show them rounded
+    return np.rint(totals).astype(np.int64) if totals.dtype.kind == "f" else totals
+
+
+class CountCube:
+    """
+    Respondent counts per combination of CUBE_DIMS codes. Offers the same
+    value_counts / crosstab queries as SurveyAggregates, where() narrows it
+    to a sub-cohort and weighted() applies survey weights (counts are then
+    rounded in the queries). Cubes over disjoint rows can be merged by adding them.
+    """
+
+    def __init__(self, counts: np.ndarray = None):
+        self.lows = np.array([COLUMN_RANGES[d][0] for d in CUBE_DIMS])
+        shape = tuple(COLUMN_RANGES[d][1] - COLUMN_RANGES[d][0] + 1 for d in CUBE_DIMS)
+        self.counts = np.zeros(shape, dtype=np.int64) if counts is None else counts
+
+    # ---------- BUILD / UPDATE ----------
+    @classmethod
+    def from_arrays(cls, arrays) -> "CountCube":
+        return cls().update(arrays)
+
+    def update(self, arrays):
+        """Add a batch of rows (mapping of column -> codes); one bincount over the batch."""
+        index = tuple(
+            np.asarray(arrays[d]).astype(np.int64) - lo for d, lo in zip(CUBE_DIMS, self.lows)
+        )
+        flat = np.ravel_multi_index(index, self.counts.shape)
+        self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+        return self
+
+    def merge(self, other: "CountCube"):
+        self.counts += other.counts
+        return self
+
+    # ---------- QUERIES ----------
+    @property
+    def n(self) -> int:
+        return int(np.rint(self.counts.sum()))
+
+    def weighted(self, weights: np.ndarray) -> "CountCube":
+        """The cube with every cell's count multiplied by weights (broadcast against counts)."""
+        return CountCube(self.counts * weights)
+
+    def _axis(self, col: str) -> int:
+        return CUBE_DIMS.index(col)
+
+    def where(self, filters) -> "CountCube":
+        """
+        The cube restricted to rows whose codes are in filters (column -> allowed
+        codes); cells outside the selection become 0.
+        """
+        counts = self.counts
+        for col, codes in (filters or {}).items():
+            axis = self._axis(col)
+            values = np.arange(counts.shape[axis]) + self.lows[axis]
+            keep = np.isin(values, list(codes))
+            shape = [1] * counts.ndim
+            shape[axis] = -1
+            counts = counts * keep.reshape(shape)
+        return CountCube(counts)
+
+    def value_counts(self, col: str, labels: dict = None) -> pd.Series:
+        """Respondents per code (sorted by code, zero counts dropped), optionally relabelled."""
+        axis = self._axis(col)
+        others = tuple(i for i in range(self.counts.ndim) if i != axis)
+        totals = _whole(self.counts.sum(axis=others))
+        codes = np.flatnonzero(totals)
+        series = pd.Series(totals[codes], index=codes + self.lows[axis], name="count")
+        if labels is not None:
+            series.index = series.index.map(labels)
+        return series
+
+    def crosstab(self, a: str, b: str) -> pd.DataFrame:
+        """Counts per (a code, b code); only codes that occur are kept."""
+        ia, ib = self._axis(a), self._axis(b)
+        others = tuple(i for i in range(self.counts.ndim) if i not in (ia, ib))
+        table = _whole(self.counts.sum(axis=others))
+        if ia > ib:
+            table = table.T
+        rows = np.flatnonzero(table.sum(axis=1))
+        cols = np.flatnonzero(table.sum(axis=0))
+        return pd.DataFrame(
+            table[np.ix_(rows, cols)],
+            index=rows + self.lows[ia],
+            columns=cols + self.lows[ib],
+        )
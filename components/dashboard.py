@@ -0,0 +1,448 @@
+# dashboard.py
+# Prebuilt snapshot of everything the analytics tabs draw.
+#
+# Every chart on WHO WE ARE and THE UNTOLD SIDE is a pure function of the data,
+# so it can be computed once and shipped as a single file:
+#     python -m components.dashboard            # writes assets/data/dashboard_snapshot.npz
+#
+# At runtime the tabs read only from the snapshot; the survey rows are not
+# parsed at all while the snapshot matches the data. Batches ingested since it
+# was built are folded in (only their rows are read); a missing snapshot, or
+# one of another base CSV, is recomputed in-process from the rows instead. Charts and the
+# pairwise tables behind the association measures are kept as per-cohort
+# statistics (components.cohort), so the sidebar filters re-slice them without
+# going back to the rows either.
+
+import argparse
+import io
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from components.aggregates import SurveyAggregates
+from components.association import PairTables
+from components.bootstrap import CONFIDENCE, RESAMPLES, bootstrap_corrs, flag_ties, percentile_interval
+from components.cohort import FILTER_DIMS, CohortStats
+from components.cube import CountCube
+from components.density import density_curve
+from components.fileio import file_digest, file_stamp
+from components.ingest import INGEST_DIR, read_log, read_segment, segment_paths
+from components.lru import LRUCache
+from components.permutation import ALPHA, permutation_pvalues
+from components.schema import SURVEY_COLUMNS, column_dtype, read_survey_csv
+from components.weighting import SurveyWeights, effective_n, targets_key
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_CSV = BASE_DIR / "assets" / "data" / "Cleaned_Form_Responses.csv"
+SNAPSHOT_PATH = BASE_DIR / "assets" / "data" / "dashboard_snapshot.npz"
+
+# bump whenever what is stored (or how it is computed) changes
+SNAPSHOT_FORMAT = 7
+
+WELLNESS_COLUMN = "Depressed_Anxious"
+WELLNESS_LEVELS = [1, 2, 3]
+
+# density curves per wellness level: column -> fixed grid, or None for
+# 200 points between the level's own min and max (as the charts always did)
+KDE_GRIDS = {
+    "Social_Support": np.linspace(0.8, 5.2, 300),
+    "Financial_Stress": None,
+}
+
+# scatter charts that draw one marker per response: stored as the distinct
+# points per wellness level plus how many responses sit on each
+POINT_CHARTS = {
+    "sleep": ["Sleep_Hours_Per_Night"],
+    "stress_3d": ["Coursework_Pressure", "Academic_Workload"],
+}
+
+# above this many responses in a cohort, those charts get one marker per
+# distinct point instead of one per response (level of detail, see points())
+POINT_LOD_ROWS = 10_000
+
+ENGAGEMENT_COLUMN = "Academic_Engagement"
+
+# columns ranked by correlation with the wellness level (Top 5 factors)
+PREDICTOR_COLUMNS = [c for c in SURVEY_COLUMNS if c != WELLNESS_COLUMN]
+
+# per-cohort histograms (name -> columns) the charts above are drawn from;
+# every predictor's one doubles as the (value, wellness) table its
+# bootstrap interval is resampled from
+HISTOGRAMS = {col: [col] for col in KDE_GRIDS}
+HISTOGRAMS.update(POINT_CHARTS)
+HISTOGRAMS[ENGAGEMENT_COLUMN] = [ENGAGEMENT_COLUMN]
+HISTOGRAMS.update({col: [col] for col in PREDICTOR_COLUMNS})
+
+# columns whose pairwise contingency tables are kept per cohort cell, for the
+# association measures; the filter columns' tables follow from the cells themselves
+PAIR_COLUMNS = [c for c in SURVEY_COLUMNS if c not in FILTER_DIMS]
+
+# results kept per snapshot, i.e. per data version, by cohort and arguments
+# (resampling, pairwise tables, raked weights); least recently used dropped first
+RESULT_CACHE_SIZE = 64
+
+
+class DashboardSnapshot:
+    """
+    Read-only results behind the analytics tabs: the survey aggregates
+    (counts, crosstabs, correlations), the demographic count cube of WHO WE
+    ARE, and the per-cohort statistics every chart of THE UNTOLD SIDE is
+    drawn from, pairwise tables for its other association measures included.
+    view() narrows them to the cohort picked in the filter panel.
+    """
+
+    def __init__(self, aggregates: SurveyAggregates, arrays: dict, meta: dict):
+        self.aggregates = aggregates
+        self.arrays = arrays
+        self.meta = meta
+        self.cube = CountCube(arrays["cube"])
+        self.cohort = CohortStats(
+            {key[len("cohort__"):]: values for key, values in arrays.items() if key.startswith("cohort__")}
+        )
+        self.results = LRUCache(RESULT_CACHE_SIZE)  # shared by every session's thread
+        self.version = None  # data version this snapshot is served as (set by components.dataset)
+
+    def view(self, filters=None, weights: SurveyWeights = None) -> "DashboardView":
+        return DashboardView(self, filters or {}, weights)
+
+    def weights(self, targets: dict) -> SurveyWeights:
+        """
+        Weights raking every respondent to targets (see components/weighting.py),
+        kept per targets with the other cached results (so bounded by RESULT_CACHE_SIZE).
+        """
+        return self.results.get(("weights", targets_key(targets)), lambda: SurveyWeights.from_cube(self.cube, targets))
+
+    def extended(self, chunks, aggregates: SurveyAggregates, meta: dict) -> "DashboardSnapshot":
+        """
+        A new snapshot with the rows of chunks (e.g. newly ingested batches)
+        added, given the aggregates over all the rows. This one is left as it
+        is: sessions may still be reading it.
+        """
+        cohort = CohortStats(dict(self.cohort.arrays))
+        return _fold(chunks, CountCube(self.cube.counts.copy()), cohort, aggregates, meta)
+
+    # ---------- PERSISTENCE ----------
+    def save(self, path):
+        buffer = io.BytesIO()
+        self.aggregates.save(buffer)
+        meta = {f"meta__{k}": np.asarray(v) for k, v in self.meta.items()}
+        path = Path(path)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez(tmp, aggregates=np.frombuffer(buffer.getvalue(), dtype=np.uint8), **self.arrays, **meta)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path) -> "DashboardSnapshot":
+        arrays, meta = {}, {}
+        with np.load(path) as data:
+            aggregates, _ = SurveyAggregates.load(io.BytesIO(data["aggregates"].tobytes()))
+            for key in data.files:
+                if key.startswith("meta__"):
+                    meta[key[len("meta__"):]] = data[key].item()
+                elif key != "aggregates":
+                    arrays[key] = data[key]
+        for values in arrays.values():
+            values.flags.writeable = False
+        return cls(aggregates, arrays, meta)
+
+
+class DashboardView:
+    """
+    The charts' inputs for one cohort (column -> allowed codes over
+    FILTER_DIMS; empty for everyone), optionally survey-weighted. Every
+    query sums the selected cohort cells, so it costs the same at any
+    number of rows. Weights are constant within a cell, so a weighted
+    query is the same sum with each cell scaled by its weight.
+    """
+
+    def __init__(self, snapshot: DashboardSnapshot, filters: dict, weights: SurveyWeights = None):
+        self.filters = filters
+        self.weights = weights
+        self.cohort = snapshot.cohort
+        self.cells = self.cohort.select(filters)
+        self.cell_weights = None if weights is None else weights.cells(self.cohort.cells, FILTER_DIMS)
+        self.cube = snapshot.cube.where(filters)
+        if weights is not None:
+            self.cube = self.cube.weighted(weights.cube(self.cube))
+        self.n = self.cohort.count(self.cells)  # respondents, weighted or not
+        self.moments = self.cohort.moments(self.cells, self.cell_weights)
+        self.version = snapshot.version
+        self._results = snapshot.results
+
+    @property
+    def effective_n(self) -> float:
+        """Kish effective sample size of the cohort (n when unweighted)."""
+        if self.weights is None:
+            return float(self.n)
+        return effective_n(self.cell_weights[self.cells], self.cohort.arrays["n"][self.cells])
+
+    def _histogram(self, name: str) -> np.ndarray:
+        return self.cohort.histogram(name, self.cells, self.cell_weights)
+
+    def kde(self, col: str, level: int):
+        """(x grid, density) for one wellness level, or None when it has fewer than 2 distinct responses."""
+        (values,) = self.cohort.axes(col)
+        counts = self._histogram(col)[:, WELLNESS_LEVELS.index(level)]
+        grid = KDE_GRIDS[col]
+        if grid is None:
+            present = values[counts > 0]
+            if len(present) == 0:
+                return None
+            grid = np.linspace(present.min(), present.max(), 200)
+        density = density_curve(values, counts, grid)
+        return None if density is None else (grid, density)
+
+    def points(self, chart: str, level: int, max_rows=POINT_LOD_ROWS) -> pd.DataFrame:
+        """
+        One row per response of the level (distinct points repeated by their
+        count): the chart's columns, the wellness code, and `count`, the
+        number of responses sharing that point (weighted and rounded when
+        the view is weighted).
+
+        When the cohort has more than max_rows responses in the chart, every
+        level gets one row per distinct point instead. The repeated markers
+        of a point are drawn on top of each other anyway, so the chart reads
+        the same while its size is set by the distinct points, not the rows.
+        """
+        columns = POINT_CHARTS[chart]
+        level_index = WELLNESS_LEVELS.index(level)
+        histogram = self.cohort.histogram(chart, self.cells)
+        counts = histogram[..., level_index]
+        points = np.nonzero(counts)
+        counts = counts[points]
+        sizes = counts if self.weights is None else np.rint(self._histogram(chart)[..., level_index][points])
+        repeats = counts if histogram.sum() <= max_rows else np.ones_like(counts)
+        frame = {
+            col: np.repeat(axis[index], repeats)
+            for col, axis, index in zip(columns, self.cohort.axes(chart), points)
+        }
+        frame[WELLNESS_COLUMN] = np.full(repeats.sum(), level, dtype=column_dtype(WELLNESS_COLUMN))
+        frame["count"] = np.repeat(sizes.astype(counts.dtype), repeats)
+        return pd.DataFrame(frame)
+
+    @property
+    def key(self) -> tuple:
+        """Hashable (cohort, weighting) of this view, for caching results per view."""
+        cohort = tuple(sorted((col, tuple(sorted(codes))) for col, codes in self.filters.items()))
+        return cohort, None if self.weights is None else self.weights.key
+
+    def _cached(self, name: str, args: tuple, compute):
+        return self._results.get((name, *self.key, args), compute)
+
+    def associations(self) -> PairTables:
+        """
+        Contingency tables of every pair of survey columns in this cohort
+        (weighted counts when weighted), summed from its cells; for Spearman,
+        Kendall, Cramér's V and mutual information. Cached per cohort.
+        """
+        return self._cached("associations", (), lambda: self.cohort.pair_tables(self.cells, self.cell_weights))
+
+    def _wellness_tables(self, columns, weighted=True) -> dict:
+        # column -> (its values, wellness levels, responses per (value, level)) in this cohort
+        tables = {}
+        for col in columns:
+            (values,) = self.cohort.axes(col)
+            counts = self._histogram(col) if weighted else self.cohort.histogram(col, self.cells)
+            tables[col] = (values, WELLNESS_LEVELS, counts)
+        return tables
+
+    def correlation_intervals(self, columns=None, resamples=RESAMPLES, confidence=CONFIDENCE) -> pd.DataFrame:
+        """
+        Strength of each column's link with the wellness level (|Pearson r|)
+        with a bootstrap percentile interval (low, high), strongest first.
+        `tied` marks columns whose interval overlaps a neighbour's in that
+        order, i.e. ranks that could swap on another sample. Cached per
+        cohort for the life of the snapshot.
+        """
+        columns = list(columns or PREDICTOR_COLUMNS)
+
+        def compute():
+            replicates = bootstrap_corrs(self._wellness_tables(columns), resamples)
+            intervals = pd.DataFrame(
+                [percentile_interval(np.abs(replicates[col]), confidence) for col in columns],
+                index=columns,
+                columns=["low", "high"],
+            )
+            intervals.insert(0, "strength", self.moments.corrwith(columns, WELLNESS_COLUMN).abs())
+            intervals = intervals.sort_values("strength", ascending=False)
+            intervals["tied"] = flag_ties(intervals)
+            return intervals
+
+        return self._cached("intervals", (tuple(columns), resamples, confidence), compute)
+
+    def correlation_significance(self, columns=None, alpha=ALPHA) -> pd.DataFrame:
+        """
+        Permutation p-value of each column's correlation with the wellness
+        level, Holm-adjusted across the columns (see components/permutation.py).
+        Shuffles need whole responses, so the test always runs on the
+        unweighted counts. Cached per cohort like correlation_intervals().
+        """
+        columns = list(columns or PREDICTOR_COLUMNS)
+        return self._cached(
+            "significance",
+            (tuple(columns), alpha),
+            lambda: permutation_pvalues(self._wellness_tables(columns, weighted=False), alpha),
+        )
+
+    def partial_correlations(self, columns=None) -> pd.Series:
+        """
+        |Partial r| of each column with the wellness level, every other column
+        held fixed, strongest first; collinear factors (workload, coursework
+        pressure) share their common part instead of each getting it. Cached
+        per cohort like correlation_intervals().
+        """
+        columns = list(columns or PREDICTOR_COLUMNS)
+        return self._cached(
+            "partial",
+            (tuple(columns),),
+            lambda: self.moments.partial_corrwith(columns, WELLNESS_COLUMN).abs().sort_values(ascending=False),
+        )
+
+    def engagement_stats(self) -> pd.DataFrame:
+        """Average wellness code and response count (weighted and rounded when weighted) per engagement level."""
+        (codes,) = self.cohort.axes(ENGAGEMENT_COLUMN)
+        table = self._histogram(ENGAGEMENT_COLUMN)
+        counts = table.sum(axis=1)
+        present = counts > 0
+        return pd.DataFrame(
+            {
+                "Engagement": codes[present].astype(np.int64),
+                "Avg_Wellness": (table @ np.array(WELLNESS_LEVELS, dtype=np.float64))[present] / counts[present],
+                "Count": np.rint(counts[present]).astype(np.int64) if self.weights is not None else counts[present],
+            }
+        )
+
+
+# -------------------------------------------------------------------
+# VERSIONING
+# -------------------------------------------------------------------
+def source_meta(csv_path=DEFAULT_CSV, ingest_dir=INGEST_DIR, digest=True) -> dict:
+    stamp = file_stamp(csv_path)
+    meta = {
+        "format": SNAPSHOT_FORMAT,
+        "base_size": stamp["size"],
+        "base_mtime_ns": stamp["mtime_ns"],
+        "segments": len(read_log(ingest_dir)["segments"]),
+    }
+    if digest:
+        meta["base_sha256"] = file_digest(csv_path)
+    return meta
+
+
+def pending_segments(meta: dict, csv_path=DEFAULT_CSV, ingest_dir=INGEST_DIR):
+    """
+    Segment files ingested since a snapshot built with `meta`, or None when
+    it was built from another base CSV or format and cannot be brought up
+    to date. The stamp check is two stat calls; the content digest is only
+    read when the stamp moved, e.g. on a fresh replica where the CSV was
+    copied with a new mtime.
+    """
+    current = source_meta(csv_path, ingest_dir, digest=False)
+    if meta.get("format") != current["format"] or meta.get("base_size") != current["base_size"]:
+        return None
+    if meta.get("base_mtime_ns") != current["base_mtime_ns"] and meta.get("base_sha256") != file_digest(csv_path):
+        return None
+    paths = segment_paths(read_log(ingest_dir), ingest_dir)
+    done = meta.get("segments", 0)
+    return paths[done:] if done <= len(paths) else None
+
+
+def is_current(meta: dict, csv_path=DEFAULT_CSV, ingest_dir=INGEST_DIR) -> bool:
+    """Whether a snapshot built with `meta` matches the data on disk."""
+    return pending_segments(meta, csv_path, ingest_dir) == []
+
+
+def update_snapshot(snapshot: DashboardSnapshot, csv_path=DEFAULT_CSV, ingest_dir=INGEST_DIR):
+    """
+    snapshot with the batches ingested since it was built folded in, reading
+    only those (itself when there are none), or None when it has to be
+    rebuilt from the rows (see pending_segments).
+    """
+    pending = pending_segments(snapshot.meta, csv_path, ingest_dir)
+    if not pending:
+        return None if pending is None else snapshot
+    batches = [read_segment(path) for path in pending]
+    aggregates = SurveyAggregates().merge(snapshot.aggregates)
+    for batch in batches:
+        aggregates.update(batch)
+    meta = dict(snapshot.meta, segments=snapshot.meta["segments"] + len(pending))
+    return snapshot.extended(batches, aggregates, meta)
+
+
+def load_current_snapshot(path=SNAPSHOT_PATH, csv_path=DEFAULT_CSV, ingest_dir=INGEST_DIR):
+    """
+    The snapshot at path brought up to date with any batches ingested since
+    (see update_snapshot), or None when it is missing, from an older format
+    or of another base CSV.
+    """
+    if not Path(path).exists():
+        return None
+    return update_snapshot(DashboardSnapshot.load(path), csv_path, ingest_dir)
+
+
+# -------------------------------------------------------------------
+# BUILDING
+# -------------------------------------------------------------------
+def compute_dashboard(source, aggregates: SurveyAggregates, meta: dict) -> DashboardSnapshot:
+    """
+    Compute every tab input from the survey columns (any column name -> array
+    mapping) and their aggregates.
+    """
+    return compute_dashboard_chunks([source], aggregates, meta)
+
+
+def compute_dashboard_chunks(chunks, aggregates: SurveyAggregates, meta: dict) -> DashboardSnapshot:
+    """
+    compute_dashboard over batches of rows (an iterable of column name ->
+    array mappings, at least one), counted one batch at a time and merged,
+    so only one batch of rows is in memory at once.
+    """
+    return _fold(chunks, CountCube(), None, aggregates, meta)
+
+
+def _fold(chunks, cube: CountCube, cohort, aggregates: SurveyAggregates, meta: dict) -> DashboardSnapshot:
+    # add each batch of rows to the cube and the cohort statistics (None: start from the first batch)
+    for chunk in chunks:
+        cube.update(chunk)
+        part = CohortStats.from_arrays(chunk, HISTOGRAMS, PAIR_COLUMNS)
+        cohort = part if cohort is None else cohort.merge(part)
+
+    arrays = {"cube": cube.counts}
+    arrays.update({f"cohort__{key}": values for key, values in cohort.arrays.items()})
+
+    meta = dict(meta, built_at=datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    return DashboardSnapshot(aggregates, arrays, meta)
+
+
+def _read_survey(csv_path, ingest_dir) -> dict:
+    # compact arrays (1 byte per code) for the base CSV plus every segment
+    parts = [read_survey_csv(csv_path)]
+    parts += [read_segment(path) for path in segment_paths(read_log(ingest_dir), ingest_dir)]
+    return {col: np.concatenate([part[col] for part in parts]) for col in SURVEY_COLUMNS}
+
+
+def build_dashboard_snapshot(csv_path=DEFAULT_CSV, out_path=SNAPSHOT_PATH, ingest_dir=INGEST_DIR) -> DashboardSnapshot:
+    meta = source_meta(csv_path, ingest_dir)
+    survey = _read_survey(csv_path, ingest_dir)
+    snapshot = compute_dashboard(survey, SurveyAggregates.from_arrays(survey), meta)
+    snapshot.save(out_path)
+    return snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the analytics tabs into one snapshot file.")
+    parser.add_argument("--csv", default=str(DEFAULT_CSV), help="cleaned survey CSV")
+    parser.add_argument("--ingest-dir", default=str(INGEST_DIR), help="ingested batches to include")
+    parser.add_argument("--out", default=str(SNAPSHOT_PATH), help="snapshot file to write")
+    args = parser.parse_args(argv)
+
+    snapshot = build_dashboard_snapshot(args.csv, args.out, args.ingest_dir)
+    size_kb = Path(args.out).stat().st_size / 1024
+    print(f"Wrote snapshot of {snapshot.aggregates.n} responses to {args.out} ({size_kb:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
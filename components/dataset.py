@@ -0,0 +1,429 @@
+# dataset.py
+# Shared survey dataset: parsed once per process, handed to every tab read-only.
+
+import logging
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from pathlib import Path
+
+from components.aggregates import Moments, SurveyAggregates
+from components.association import PairTables
+from components.bitmap_index import INDEXED_COLUMNS, BitmapIndex
+from components.cohort import FILTER_DIMS
+from components.dashboard import (
+    SNAPSHOT_PATH,
+    DashboardSnapshot,
+    compute_dashboard_chunks,
+    load_current_snapshot,
+    source_meta,
+    update_snapshot,
+)
+from components.features import DERIVED_COLUMNS, DERIVED_SOURCES, derive_column, derive_columns
+from components.figure_cache import retain_version
+from components.fileio import file_stamp
+from components.ingest import log_version, read_log, read_segment, saved_aggregates, segment_paths
+from components.lru import LRUCache
+from components.schema import SURVEY_COLUMNS, column_memory_report, nbytes, read_survey_csv
+from components.versioning import HotReloader, data_version
+from components.weighting import SurveyWeights
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DATA_PATH = BASE_DIR / "assets" / "data" / "Cleaned_Form_Responses.csv"
+
+# "memory": parse the CSV into RAM (default, fine for a few hundred thousand rows)
+# "memmap": page columns in from the on-disk column store (components/column_store.py)
+# "sqlite": query the local SQLite database (components/sqlite_store.py)
+# "partitioned": column files split by institution / field (components/partitions.py)
+STORAGE_MODE = os.environ.get("WELLNESS_STORAGE", "memory")
+
+ALL_COLUMNS = SURVEY_COLUMNS + DERIVED_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# cohorts (filtered beyond the sidebar columns) whose pairwise tables are kept per data version
+ASSOCIATION_CACHE_SIZE = 16
+
+# rows counted at a time when the dashboard has to be computed from the rows
+CHUNK_ROWS = 250_000
+
+
+def frame_from_arrays(arrays: dict) -> pd.DataFrame:
+    # copy=False keeps one block per column, so the frame keeps pointing at the
+    # read-only arrays and any in-place write raises instead of leaking to other sessions
+    return pd.DataFrame(arrays, copy=False)
+
+
+class SurveySnapshot:
+    """
+    One version of the dataset, replaced as a whole on reload. Everything is
+    opened on first use: the prebuilt dashboard snapshot, the aggregates, and
+    the column name -> read-only array source (only parsed when a chart needs
+    rows the dashboard snapshot does not hold).
+    """
+
+    def __init__(self, version, previous=None):
+        self.version = version
+        # memory mode only: parsed parts of the previous version that can be reused
+        if previous is not None and previous.base is not None:
+            self._reuse = (previous.version, previous.base, previous.segments)
+        else:
+            self._reuse = None
+        # the previous version's dashboard, to fold newly appended batches into
+        self._previous_dashboard = None if previous is None else previous._dashboard
+        self.base = None
+        self.segments = {}
+        self._source = None
+        self._aggregates = None
+        self._dashboard = None
+        self._bitmaps = None
+        self._associations = LRUCache(ASSOCIATION_CACHE_SIZE)  # shared by every session's thread
+        self._lock = threading.RLock()  # the dashboard opens the aggregates, which open the source
+
+    @property
+    def source_opened(self) -> bool:
+        return self._source is not None
+
+    @property
+    def source(self):
+        with self._lock:
+            if self._source is None:
+                self._source = self._open_source()
+                self._reuse = None
+            return self._source
+
+    def _open_source(self):
+        if STORAGE_MODE == "memmap":
+            from components.column_store import open_column_store
+
+            return open_column_store(DATA_PATH)
+        if STORAGE_MODE == "sqlite":
+            from components.sqlite_store import open_sqlite_store
+
+            return open_sqlite_store(DATA_PATH)
+        if STORAGE_MODE == "partitioned":
+            from components.partitions import open_partition_store
+
+            return open_partition_store(DATA_PATH)
+
+        # the base CSV is only re-parsed when its size / mtime moved
+        previous_version, previous_base, reusable = self._reuse or (None, None, {})
+        if previous_base is not None and previous_version[:2] == self.version[:2]:
+            self.base = previous_base
+        else:
+            self.base = read_survey_csv(DATA_PATH)
+
+        # ingested segments never change once written, so each is parsed once
+        for path in segment_paths(read_log()):
+            key = (path.name, tuple(file_stamp(path).values()))
+            self.segments[key] = reusable[key] if key in reusable else read_segment(path)
+
+        if self.segments:
+            arrays = {
+                col: np.concatenate([self.base[col]] + [seg[col] for seg in self.segments.values()])
+                for col in SURVEY_COLUMNS
+            }
+            for values in arrays.values():
+                values.flags.writeable = False
+        else:
+            arrays = dict(self.base)
+        arrays.update(derive_columns(arrays))
+        return arrays
+
+    @property
+    def aggregates(self) -> SurveyAggregates:
+        with self._lock:
+            if self._aggregates is None:
+                if self._dashboard is not None:
+                    agg = self._dashboard.aggregates
+                elif STORAGE_MODE == "sqlite":
+                    # the sums stored next to the rows, no column is loaded into the process
+                    agg = self.source.aggregates()
+                else:
+                    # the ingest CLI keeps aggregates.npz in step with every batch; fall
+                    # back to one pass over the rows when nothing has been ingested yet
+                    agg = saved_aggregates(DATA_PATH)
+                if agg is None:
+                    agg = SurveyAggregates.from_arrays(self.source)
+                self._aggregates = agg
+            return self._aggregates
+
+    @property
+    def bitmaps(self) -> BitmapIndex:
+        with self._lock:
+            if self._bitmaps is None:
+                self._bitmaps = BitmapIndex.from_arrays(self.source)
+            return self._bitmaps
+
+    @property
+    def dashboard(self) -> DashboardSnapshot:
+        with self._lock:
+            if self._dashboard is None:
+                # the previous version's dashboard or the prebuilt file, with the batches
+                # appended since folded in (only their rows are read); computed from all
+                # the rows only when neither was built from the current base CSV
+                dashboard = None
+                if self._previous_dashboard is not None:
+                    dashboard = update_snapshot(self._previous_dashboard, DATA_PATH)
+                    self._previous_dashboard = None
+                if dashboard is None:
+                    dashboard = load_current_snapshot(SNAPSHOT_PATH, DATA_PATH)
+                if dashboard is None:
+                    if STORAGE_MODE in ("memmap", "sqlite"):
+                        logger.warning(
+                            "No current dashboard snapshot; computing it in batches from the %s store "
+                            "(run python -m components.dashboard to prebuild it)",
+                            STORAGE_MODE,
+                        )
+                    # a batch at a time next to the aggregates, so the out-of-core stores
+                    # never load every column and the in-memory rows are counted in bounded passes
+                    meta = source_meta(DATA_PATH, digest=False)
+                    dashboard = compute_dashboard_chunks(_chunks(self.source, SURVEY_COLUMNS), self.aggregates, meta)
+                dashboard.version = self.version
+                self._dashboard = dashboard
+            return self._dashboard
+
+    def associations(self, filters, weights: SurveyWeights = None) -> PairTables:
+        # pairwise tables of the rows matching filters, counted a batch at a time on first
+        # use; the cache builds each cohort once, and other cohorts are not held up meanwhile
+        key = (
+            tuple(sorted((col, tuple(sorted(codes))) for col, codes in filters.items())),
+            None if weights is None else weights.key,
+        )
+
+        def count():
+            tables = None
+            for rows in _row_batches(self.source, SURVEY_COLUMNS, filters):
+                part = PairTables.from_arrays(rows, SURVEY_COLUMNS, None if weights is None else weights.rows(rows))
+                tables = part if tables is None else tables.merge(part)
+            return tables
+
+        return self._associations.get(key, count)
+
+
+def _build_snapshot(version, previous):
+    snapshot = SurveySnapshot(version, previous)
+    if previous is not None:
+        # background reload: have what the previous version served ready before the swap
+        snapshot.dashboard
+        if previous.source_opened:
+            snapshot.source
+    return snapshot
+
+
+def _swapped(version, snapshot):
+    # figures of the replaced version are only asked for by reruns already under way
+    retain_version(version)
+
+
+@st.cache_resource(show_spinner=False)
+def _reloader() -> HotReloader:
+    # one per process; holds the current snapshot and at most one reload in flight
+    return HotReloader(_build_snapshot, name="survey", on_swap=_swapped)
+
+
+def _snapshot() -> SurveySnapshot:
+    # two stat() calls per rerun; a replaced CSV or an appended batch starts a
+    # background reload and shows up on a rerun once it is ready
+    return _reloader().get(data_version(DATA_PATH, log_version()))
+
+
+def dataset_version():
+    """
+    Version token of the data the current rerun is served. Key any cache of
+    results computed from the survey (figures, tables) on it.
+    """
+    return _snapshot().version
+
+
+def _select_rows(source, columns, filters) -> dict:
+    # row mask over the shared arrays; derived columns are rebuilt on the subset
+    mask = np.ones(len(source[SURVEY_COLUMNS[0]]), dtype=bool)
+    for col, codes in filters.items():
+        mask &= np.isin(source[col], list(codes))
+
+    raw = {}
+    for col in columns:
+        for name in DERIVED_SOURCES.get(col, [col]):
+            if name not in raw:
+                values = np.asarray(source[name])[mask]
+                values.flags.writeable = False
+                raw[name] = values
+    return {col: raw[col] if col in raw else derive_column(col, raw) for col in columns}
+
+
+def _chunks(source, columns):
+    # every row as batches of CHUNK_ROWS; the stores read them from disk, in-memory arrays are sliced
+    if hasattr(source, "chunks"):
+        return source.chunks(columns, CHUNK_ROWS)
+    rows = len(source[columns[0]])
+    return (
+        {col: source[col][start:start + CHUNK_ROWS] for col in columns} for start in range(0, max(rows, 1), CHUNK_ROWS)
+    )
+
+
+def _row_batches(source, columns, filters):
+    # the rows matching filters in one or more batches; the SQLite store filters
+    # in its query and hands over a batch at a time, so no column is kept in the process
+    if STORAGE_MODE == "sqlite":
+        yield from source.chunks(columns, filters=filters)
+    elif STORAGE_MODE == "partitioned":
+        yield source.select(columns, filters)
+    else:
+        yield _select_rows(source, columns, filters)
+
+
+def load_columns(columns, filters=None) -> pd.DataFrame:
+    """
+    Return only the requested survey / derived columns as a read-only frame.
+
+    Nothing is copied: the frame wraps the shared arrays. In "memmap" mode a
+    column is paged in from disk the first time a chart touches it, so resident
+    memory follows the columns a tab actually uses.
+
+    filters (column -> allowed codes) keeps only matching rows. In
+    "partitioned" mode only the partitions that can match are read.
+    """
+    source = _snapshot().source
+    if not filters:
+        return frame_from_arrays({col: source[col] for col in columns})
+    if STORAGE_MODE == "partitioned":
+        return frame_from_arrays(source.select(columns, filters))
+    return frame_from_arrays(_select_rows(source, columns, filters))
+
+
+def count_responses(filters=None) -> int:
+    """Number of responses matching filters (column -> allowed codes)."""
+    snapshot = _snapshot()
+    source = snapshot.source
+    if STORAGE_MODE == "partitioned":
+        return source.count(filters)
+    if STORAGE_MODE == "sqlite" and all(col in SURVEY_COLUMNS for col in filters or ()):
+        # COUNT(*) on the indexed table; derived columns only exist in the process
+        return source.count(filters)
+    if not filters:
+        return len(source[SURVEY_COLUMNS[0]])
+    if all(col in INDEXED_COLUMNS for col in filters):
+        # AND / OR of bitsets plus a popcount (components/bitmap_index.py)
+        bitmaps = snapshot.bitmaps
+        return bitmaps.count(bitmaps.select(filters))
+    first = next(iter(filters))
+    return len(_select_rows(source, [first], filters)[first])
+
+
+def load_survey() -> pd.DataFrame:
+    """
+    Return the cleaned survey, raw codes plus derived label columns.
+
+    Every session shares the same arrays (st.cache_resource, no pickling), so
+    tabs must only read from it; label and helper columns the charts need
+    (see components/features.py) are already there.
+    """
+    return load_columns(ALL_COLUMNS)
+
+
+def load_dashboard() -> DashboardSnapshot:
+    """
+    Everything the analytics tabs draw, precomputed (see components/dashboard.py).
+    Treat as read-only: the object is shared by all sessions.
+    """
+    return _snapshot().dashboard
+
+
+def load_bitmap_index() -> BitmapIndex:
+    """
+    Bitsets per (column, code) over the rows of load_columns() (see
+    components/bitmap_index.py), for cohort counts and row selection.
+    Treat as read-only: the object is shared by all sessions.
+    """
+    return _snapshot().bitmaps
+
+
+def load_aggregates() -> SurveyAggregates:
+    """
+    Counts, sums and cross-products over every response (see components/aggregates.py).
+    Treat as read-only: the object is shared by all sessions.
+    """
+    return _snapshot().aggregates
+
+
+def load_moments(filters=None) -> Moments:
+    """
+    n, sums and cross-products of the responses matching filters (column ->
+    allowed codes), for Pearson correlations of any cohort via .corr() /
+    .corrwith(). Filters on the sidebar columns are answered from the cohort
+    cells of the dashboard snapshot, partition filters from the partition
+    manifest; anything else makes one pass over the matching rows.
+    """
+    snapshot = _snapshot()
+    if not filters:
+        return snapshot.aggregates
+    if all(col in FILTER_DIMS for col in filters):
+        cohort = snapshot.dashboard.cohort
+        return cohort.moments(cohort.select(filters))
+    if STORAGE_MODE == "partitioned":
+        return snapshot.source.moments(filters)
+    moments = Moments()
+    for rows in _row_batches(snapshot.source, SURVEY_COLUMNS, filters):
+        moments.update(rows)
+    return moments
+
+
+def load_associations(filters=None, weights: SurveyWeights = None) -> PairTables:
+    """
+    Contingency tables of every pair of survey columns for the responses
+    matching filters (see components/association.py), from which Spearman,
+    Kendall, Cramér's V and mutual information are computed; weighted counts
+    with survey weights. Filters on the sidebar columns are summed from the
+    cohort cells of the dashboard snapshot (DashboardView.associations);
+    anything else is counted from the matching rows once per data version.
+    """
+    snapshot = _snapshot()
+    filters = filters or {}
+    if all(col in FILTER_DIMS for col in filters):
+        return snapshot.dashboard.view(filters, weights).associations()
+    return snapshot.associations(filters, weights)
+
+
+def _aggregates_nbytes(agg: SurveyAggregates) -> int:
+    tables = sum(table.nbytes for table in agg.crosstabs.values())
+    sketches = sum(level.nbytes for sketch in agg.sketches.values() for level in sketch.levels)
+    return agg.sums.nbytes + agg.cross.nbytes + agg.counts.nbytes + tables + sketches
+
+
+def memory_report() -> pd.DataFrame:
+    """
+    Bytes held by each cached object of the current dataset version, with the
+    survey columns broken down one row per column. Columns that were never
+    opened are not listed; memory-mapped ones are marked (their pages live in
+    the OS page cache, not the process heap).
+    """
+    snapshot = _snapshot()
+    rows = []
+    if snapshot.source_opened:
+        source = snapshot.source
+        names = source.loaded_columns() if hasattr(source, "loaded_columns") else list(source)
+        columns = column_memory_report({name: source[name] for name in names})
+        for row in columns.itertuples(index=False):
+            rows.append({"object": "survey columns", **row._asdict()})
+        if snapshot.segments:
+            # memory mode with ingested batches: the parsed parts behind the concatenated columns
+            rows.append({"object": "base CSV arrays", "bytes": sum(nbytes(v) for v in snapshot.base.values())})
+            rows.append({
+                "object": "ingested segments",
+                "bytes": sum(nbytes(v) for seg in snapshot.segments.values() for v in seg.values()),
+            })
+    if snapshot._aggregates is not None:
+        rows.append({"object": "aggregates", "bytes": _aggregates_nbytes(snapshot._aggregates)})
+    if snapshot._bitmaps is not None:
+        rows.append({"object": "bitmap index", "bytes": snapshot._bitmaps.nbytes()})
+    if snapshot._dashboard is not None:
+        dashboard = snapshot._dashboard
+        rows.append({"object": "dashboard", "bytes": sum(v.nbytes for v in dashboard.arrays.values())})
+        if dashboard.aggregates is not snapshot._aggregates:
+            rows.append({"object": "dashboard aggregates", "bytes": _aggregates_nbytes(dashboard.aggregates)})
+    return pd.DataFrame(rows, columns=["object", "column", "dtype", "rows", "bytes", "default_bytes", "memmap"])
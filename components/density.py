@@ -0,0 +1,104 @@
+# density.py
+# Gaussian kernel density curves computed from value counts instead of raw rows.
+#
+# Both estimators take (distinct values, count of each), so a curve can be
+# rebuilt from stored histograms without touching the responses, and both give
+# the curve scipy.stats.gaussian_kde(np.repeat(values, counts)) would:
+#   - gaussian_kde_counts: one kernel per distinct value, exact, O(values x grid).
+#     Coded (Likert) columns have a handful of values, so this is the cheap one.
+#   - binned_kde: linear binning onto the grid plus one FFT convolution,
+#     O(values + grid log grid); for columns with many distinct values.
+# density_curve() picks between them.
+
+from numbers import Real
+
+import numpy as np
+
+
+# above this many (values x grid points) kernel evaluations, bin and convolve
+DIRECT_LIMIT = 1 << 16
+
+
+def bandwidth(values, counts, bw_method="scott"):
+    """
+    Kernel standard deviation for values repeated counts times: the sample
+    standard deviation times Scott's (n^-1/5) or Silverman's ((3n/4)^-1/5)
+    factor, or times bw_method when it is a number. None when fewer than 2
+    responses or all on one value.
+    """
+    n = counts.sum()
+    if n <= 1:
+        return None
+    mean = counts @ values / n
+    var = counts @ (values - mean) ** 2 / (n - 1)
+    if var <= 0:
+        return None
+    if bw_method == "scott":
+        factor = n ** (-1 / 5)
+    elif bw_method == "silverman":
+        factor = (n * 3 / 4) ** (-1 / 5)
+    elif isinstance(bw_method, Real):
+        factor = float(bw_method)
+    else:
+        raise ValueError("bw_method must be 'scott', 'silverman' or a number")
+    return np.sqrt(var) * factor
+
+
+def _gaussian(offsets, bw):
+    return np.exp(-0.5 * (offsets / bw) ** 2) / (bw * np.sqrt(2 * np.pi))
+
+
+def gaussian_kde_counts(values, counts, grid, bw_method="scott"):
+    """Exact KDE of values repeated counts times on grid (one kernel per distinct value), or None."""
+    values = np.asarray(values, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.float64)
+    bw = bandwidth(values, counts, bw_method)
+    if bw is None:
+        return None
+    grid = np.asarray(grid, dtype=np.float64)
+    return _gaussian(grid[:, None] - values[None, :], bw) @ (counts / counts.sum())
+
+
+def binned_kde(values, counts, grid, bw_method="scott"):
+    """
+    KDE of values repeated counts times on an evenly spaced grid, by linear
+    binning and FFT convolution; or None. Values outside the grid are binned
+    on an extension of it, so their tails are still counted.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.float64)
+    bw = bandwidth(values, counts, bw_method)
+    if bw is None:
+        return None
+    grid = np.asarray(grid, dtype=np.float64)
+    step = (grid[-1] - grid[0]) / (len(grid) - 1)
+    if not np.allclose(np.diff(grid), step):
+        raise ValueError("binned_kde needs an evenly spaced grid")
+
+    # extend the grid by whole steps until it covers every value
+    below = int(np.ceil(max(grid[0] - values.min(), 0) / step))
+    above = int(np.ceil(max(values.max() - grid[-1], 0) / step))
+    start = grid[0] - below * step
+    size = below + len(grid) + above
+
+    # linear binning: each value's count is split between its two grid neighbours
+    pos = (values - start) / step
+    left = np.clip(np.floor(pos).astype(np.int64), 0, size - 1)
+    frac = pos - left
+    bins = np.bincount(left, weights=counts * (1 - frac), minlength=size + 1)
+    bins += np.bincount(left + 1, weights=counts * frac, minlength=size + 1)
+    bins = bins[:size]
+
+    # the kernel reaches across the whole extended grid, so nothing is truncated
+    kernel = _gaussian(np.arange(-(size - 1), size) * step, bw)
+    length = 1 << int(np.ceil(np.log2(len(bins) + len(kernel) - 1)))
+    smoothed = np.fft.irfft(np.fft.rfft(bins, length) * np.fft.rfft(kernel, length), length)
+    density = smoothed[size - 1 + below : size - 1 + below + len(grid)]
+    return np.maximum(density, 0) / counts.sum()
+
+
+def density_curve(values, counts, grid, bw_method="scott"):
+    """Density of values repeated counts times on grid, or None; exact when that is cheap."""
+    if np.size(values) * np.size(grid) <= DIRECT_LIMIT:
+        return gaussian_kde_counts(values, counts, grid, bw_method)
+    return binned_kde(values, counts, grid, bw_method)
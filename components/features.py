@@ -0,0 +1,95 @@
+# features.py
+# Derived label / helper columns, computed once per data version next to the raw codes.
+
+import numpy as np
+import pandas as pd
+
+from components.groupby import row_counts
+
+
+# ---------- CODE -> LABEL MAPS (shared by every tab) ----------
+GENDER_LABELS = {1: "Female", 2: "Male"}
+
+STUDY_LEVEL_LABELS = {1: "Degree", 2: "Diploma", 3: "Foundation"}
+
+FIELD_LABELS = {
+    1: "Arts and Humanities",
+    2: "Business",
+    3: "Health Sciences",
+    4: "STEM",
+    5: "Social Sciences",
+}
+
+INSTITUTION_LABELS = {1: "Private", 2: "Public"}
+
+WELLNESS_LABELS = {
+    1: "Minimal and Mild",
+    2: "Moderate",
+    3: "Severe",
+}
+
+# derived column -> (source column, label map)
+LABEL_COLUMNS = {
+    "Gender_Label": ("Gender", GENDER_LABELS),
+    "Study_Level_Label": ("Current_Level_of_Studies", STUDY_LEVEL_LABELS),
+    "Field_Label": ("Field_of_Study", FIELD_LABELS),
+    "Wellness_Label": ("Depressed_Anxious", WELLNESS_LABELS),
+}
+
+# derived column -> raw columns it is computed from
+DERIVED_SOURCES = {name: [source] for name, (source, _) in LABEL_COLUMNS.items()}
+DERIVED_SOURCES["bubble_size"] = ["Sleep_Hours_Per_Night", "Depressed_Anxious"]
+
+DERIVED_COLUMNS = list(DERIVED_SOURCES)
+
+
+def label_column(codes: np.ndarray, mapping: dict) -> pd.Categorical:
+    """
+    Turn survey codes into a categorical of labels.
+
+    Only the small int8 code array is stored (categories are shared), and codes
+    without a label become NaN, the same as Series.map() did before.
+    """
+    lookup = np.full(int(max(mapping)) + 1, -1, dtype=np.int8)
+    for position, code in enumerate(mapping):
+        lookup[code] = position
+
+    codes = np.asarray(codes)
+    valid = (codes >= 0) & (codes < len(lookup))
+    cat_codes = np.where(valid, lookup[np.where(valid, codes, 0)], -1).astype(np.int8)
+    cat_codes.flags.writeable = False
+    return pd.Categorical.from_codes(cat_codes, categories=list(mapping.values()))
+
+
+def pair_counts(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    For every row, how many rows share its (a, b) pair.
+    Same result as df.groupby([a, b])[a].transform('count').
+    """
+    return row_counts({"a": a, "b": b}, ["a", "b"]).astype(np.int32)
+
+
+def derive_column(name: str, arrays) -> np.ndarray:
+    """
+    Build one derived column from the raw survey arrays (any mapping of
+    column name -> array, e.g. a dict or a ColumnStore). The result is read-only,
+    like the raw columns.
+    """
+    if name in LABEL_COLUMNS:
+        source, mapping = LABEL_COLUMNS[name]
+        return label_column(arrays[source], mapping)
+
+    if name == "bubble_size":
+        # students per (sleep hours, wellness level), for the Sleep Factor chart
+        bubble_size = pair_counts(arrays["Sleep_Hours_Per_Night"], arrays["Depressed_Anxious"])
+        bubble_size.flags.writeable = False
+        return bubble_size
+
+    raise KeyError(f"Unknown derived column: {name}")
+
+
+def derive_columns(arrays) -> dict:
+    """
+    Build every derived column from the raw survey arrays.
+    """
+    return {name: derive_column(name, arrays) for name in DERIVED_COLUMNS}
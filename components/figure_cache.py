@@ -0,0 +1,56 @@
+# figure_cache.py
+# Process-wide cache of the analytics tabs' Plotly figures.
+#
+# Every chart on WHO WE ARE and THE UNTOLD SIDE is a pure function of the
+# data version its snapshot was built from, the cohort picked in the filter
+# panel, the survey weighting and the chart's own options (e.g. the association measure). Building a
+# figure, which validates every trace, shape and layout property, costs far
+# more than reading its inputs from the snapshot, so each figure is built
+# once per key and then shared by every session and rerun:
+#
+#     fig = cached_figure("age", view, age_figure)
+#     st.plotly_chart(fig, use_container_width=True)
+#
+# Figures are kept as figures rather than as serialised JSON because
+# st.plotly_chart only takes a figure (or a dict it validates into a new
+# figure on every call) and serialises it itself. Treat a cached figure as
+# read-only: it is shared by all sessions. The least recently used figures
+# are dropped beyond FIGURE_CACHE_SIZE, and those of older data versions as
+# soon as a reload is swapped in (components/dataset.py calls retain_version).
+
+from components.lru import LRUCache
+
+
+# figures kept per process: a dozen charts, times the cohorts / weightings / measures in use
+FIGURE_CACHE_SIZE = 256
+
+_FIGURES = LRUCache(FIGURE_CACHE_SIZE)
+
+# the version the last reload swapped in (None until one has)
+_live_version = None
+
+
+def cached_figure(name: str, view, build, options=()):
+    """
+    Figure `name` for a DashboardView (its data version, cohort and
+    weighting), with the chart's options (hashable): built by build() the
+    first time this process needs it, shared afterwards. The version is the
+    view's own, so a rerun that straddles a reload never files a figure of
+    the old data under the new version.
+    """
+    if _live_version is not None and view.version != _live_version:
+        # a rerun still on the version a reload replaced: nobody will ask for this figure again
+        return build()
+    return _FIGURES.get((name, view.version, view.key, options), build)
+
+
+def retain_version(version):
+    """Drop the cached figures of every data version but version, and cache no others from now on."""
+    global _live_version
+    _live_version = version
+    _FIGURES.evict(lambda key: key[1] != version)
+
+
+def figure_cache() -> LRUCache:
+    """The process-wide cache behind cached_figure() (for stats or clearing)."""
+    return _FIGURES
@@ -0,0 +1,77 @@
+# fileio.py
+# Small file helpers for the data folder: atomic writes and a cross-platform lock file.
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def file_stamp(path) -> dict:
+    """Size + modification time of a file; changes whenever the file is replaced."""
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def file_digest(path, block_size=1 << 20) -> str:
+    """SHA-256 of a file's content; unlike file_stamp it survives a copy or a fresh checkout."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def atomic_write_json(path, obj):
+    """Write JSON to a temp file and swap it in, so readers never see half a file."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2)
+    os.replace(tmp, path)
+
+
+def read_json(path, default=None):
+    path = Path(path)
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@contextmanager
+def file_lock(path, timeout=60.0, poll=0.05):
+    """
+    Hold an exclusive lock file while writing to the data folder.
+
+    Uses O_CREAT | O_EXCL so it behaves the same on Windows and Linux. A lock
+    older than `timeout` seconds is assumed to be left over from a crashed
+    writer and is taken over.
+    """
+    path = Path(path)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(path).st_mtime > timeout:
+                    os.remove(path)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Could not lock {path}")
+            time.sleep(poll)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        yield
+    finally:
+        os.close(fd)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
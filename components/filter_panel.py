@@ -0,0 +1,117 @@
+# filter_panel.py
+# Sidebar cohort filters shared by the analytics tabs.
+#
+# Both WHO WE ARE and THE UNTOLD SIDE call render_filter_panel() and
+# render_weighting_panel(), and draw every chart from
+# load_dashboard().view(filters, weights). The widgets use the same keys on
+# both tabs, so the chosen cohort and weighting carry over when switching tabs.
+
+import streamlit as st
+
+from components.dataset import load_dashboard
+from components.features import FIELD_LABELS, GENDER_LABELS, INSTITUTION_LABELS, STUDY_LEVEL_LABELS
+from components.weighting import RAKING_DIMS, SurveyWeights
+
+
+# column -> (widget label, code -> label map)
+CHOICE_FILTERS = {
+    "Gender": ("Gender", GENDER_LABELS),
+    "Current_Level_of_Studies": ("Level of study", STUDY_LEVEL_LABELS),
+    "Field_of_Study": ("Field of study", FIELD_LABELS),
+    "Type_of_Institution": ("Type of institution", INSTITUTION_LABELS),
+}
+
+KEY_PREFIX = "cohort_filter_"
+AGE_KEY = KEY_PREFIX + "Age"
+
+WEIGHTING_KEY = "survey_weighting"
+TARGET_PREFIX = "weighting_target_"
+
+
+def _reset_filters():
+    for col in CHOICE_FILTERS:
+        st.session_state[KEY_PREFIX + col] = []
+    st.session_state.pop(AGE_KEY, None)
+
+
+def render_filter_panel() -> dict:
+    """
+    Draw the filter widgets in the sidebar and return the chosen cohort as
+    column -> allowed codes. Columns left at "all" are not included, so no
+    selection returns {}.
+    """
+    dashboard = load_dashboard()
+    ages = dashboard.cube.value_counts("Age").index
+    age_min, age_max = int(ages.min()), int(ages.max())
+    if AGE_KEY in st.session_state:
+        # the data may have been reloaded with a different age span
+        lo, hi = (min(max(v, age_min), age_max) for v in st.session_state[AGE_KEY])
+        if (lo, hi) != tuple(st.session_state[AGE_KEY]):
+            st.session_state[AGE_KEY] = (lo, hi)
+
+    filters = {}
+    with st.sidebar:
+        st.markdown("### 🔎 Filter respondents")
+        for col, (label, labels) in CHOICE_FILTERS.items():
+            chosen = st.multiselect(
+                label,
+                options=list(labels),
+                format_func=labels.get,
+                key=KEY_PREFIX + col,
+                placeholder="All",
+            )
+            if chosen:
+                filters[col] = chosen
+
+        lo, hi = st.slider("Age", age_min, age_max, (age_min, age_max), key=AGE_KEY)
+        if (lo, hi) != (age_min, age_max):
+            filters["Age"] = list(range(lo, hi + 1))
+
+        cohort = dashboard.cohort
+        selected = cohort.count(cohort.select(filters))
+        st.caption(f"Showing {selected:,} of {dashboard.cube.n:,} respondents")
+        st.button("Reset filters", on_click=_reset_filters, key=KEY_PREFIX + "reset")
+    return filters
+
+
+def render_weighting_panel(filters: dict) -> SurveyWeights:
+    """
+    Draw the survey-weighting controls in the sidebar and return the weights
+    raking the respondents to the chosen target shares, or None when
+    weighting is off or the targets cannot be met.
+    """
+    dashboard = load_dashboard()
+    with st.sidebar:
+        st.markdown("### ⚖️ Survey weighting")
+        if not st.toggle("Weight to target shares", key=WEIGHTING_KEY):
+            return None
+
+        targets = {}
+        with st.expander("Target shares (%)", expanded=True):
+            for col in RAKING_DIMS:
+                label, labels = CHOICE_FILTERS[col]
+                st.markdown(f"**{label}**")
+                targets[col] = [
+                    st.number_input(
+                        name,
+                        min_value=0.0,
+                        max_value=100.0,
+                        value=round(100 / len(labels), 1),
+                        step=1.0,
+                        key=f"{TARGET_PREFIX}{col}_{code}",
+                    )
+                    for code, name in labels.items()
+                ]
+        try:
+            weights = dashboard.weights(targets)
+        except ValueError as error:
+            st.warning(f"Showing unweighted results: {error}")
+            return None
+
+        effective = dashboard.view(filters, weights).effective_n
+        st.caption(
+            f"Counts, shares, correlations and curves are weighted to these shares (shares within each "
+            f"group are rescaled to 100%). Effective sample size: {effective:,.0f}. "
+            "Significance tests use the unweighted responses."
+        )
+    return weights
@@ -0,0 +1,200 @@
+# groupby.py
+# Group-by for small-alphabet survey codes with np.bincount instead of pandas.
+#
+# Every survey column takes a handful of values, so a multi-column key can be
+# packed into one integer by mixed-radix encoding (code of the first column,
+# times the number of values of the second, plus its code, ...). Counting,
+# summing and squaring per group are then one np.bincount each over that
+# integer, with no hashing or sorting of the rows:
+#
+#     stats = group_stats(arrays, ["Academic_Engagement"], "Depressed_Anxious")
+#     stats[["mean", "count"]]          # df.groupby(by)[col].agg(["mean", "count"])
+#     row_counts(arrays, ["Sleep_Hours_Per_Night", "Depressed_Anxious"])
+#                                       # df.groupby(by)[by[0]].transform("count")
+#
+#     python -m components.groupby --rows 100000 1000000     # timings against pandas
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from components.schema import SURVEY_COLUMNS, read_survey_csv
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_CSV = BASE_DIR / "assets" / "data" / "Cleaned_Form_Responses.csv"
+
+# at most this many possible keys are counted densely; beyond that the occupied ones are found by np.unique
+DENSE_KEYS = 1 << 22
+
+# float columns whose values are all whole multiples of 1 / FLOAT_SCALE are coded like integers
+FLOAT_SCALE = 8
+
+
+def _column_codes(values):
+    # (code of each row from 0, value of each code). Integers, and floats on an
+    # eighth grid (half-hour sleep hours), are offset by their minimum, so
+    # codes that never occur still get a slot; anything else is sorted.
+    values = np.asarray(values)
+    if len(values) and np.issubdtype(values.dtype, np.integer):
+        lo, hi = int(values.min()), int(values.max())
+        return values.astype(np.intp) - lo, np.arange(lo, hi + 1).astype(values.dtype)
+    if len(values) and np.issubdtype(values.dtype, np.floating) and np.isfinite(values).all():
+        scaled = values * FLOAT_SCALE
+        codes = scaled.astype(np.intp)
+        if np.array_equal(codes, scaled):
+            lo, hi = int(codes.min()), int(codes.max())
+            if hi - lo < DENSE_KEYS:
+                return codes - lo, (np.arange(lo, hi + 1) / FLOAT_SCALE).astype(values.dtype)
+    distinct, index = np.unique(values, return_inverse=True)
+    return index.reshape(-1), distinct
+
+
+def _encode(arrays, by):
+    # (mixed-radix key of each row, values of each column's codes)
+    flat = 0
+    axes = []
+    for col in by:
+        codes, values = _column_codes(arrays[col])
+        flat = flat * len(values) + codes
+        axes.append(values)
+    if np.prod([len(values) for values in axes], dtype=np.float64) > DENSE_KEYS:
+        # too many possible keys to count densely: renumber the ones that occur
+        occupied, flat = np.unique(flat, return_inverse=True)
+        return flat.reshape(-1), axes, occupied
+    return flat, axes, None
+
+
+def _keys(axes, by, occupied) -> pd.DataFrame:
+    positions = np.unravel_index(occupied, [len(values) for values in axes])
+    return pd.DataFrame({col: values[pos] for col, values, pos in zip(by, axes, positions)})
+
+
+def _bincounts(flat, axes, occupied, weights=None):
+    # per-key totals, and the mixed-radix key of each
+    size = int(np.prod([len(values) for values in axes])) if occupied is None else len(occupied)
+    totals = np.bincount(flat, weights=weights, minlength=size)
+    return totals, (np.arange(size) if occupied is None else occupied)
+
+
+def group_index(arrays, by):
+    """
+    (group of each row, keys) for the rows of arrays (column name -> values)
+    grouped by the columns `by`. Groups are numbered in sorted key order,
+    like pandas; keys is a DataFrame with one row per group.
+    """
+    flat, axes, occupied = _encode(arrays, by)
+    if occupied is not None:
+        return flat, _keys(axes, by, occupied)
+    counts, _ = _bincounts(flat, axes, None)
+    present = np.flatnonzero(counts)
+    slot = np.zeros(len(counts), dtype=np.intp)
+    slot[present] = np.arange(len(present))
+    return slot[flat], _keys(axes, by, present)
+
+
+def group_stats(arrays, by, column=None) -> pd.DataFrame:
+    """
+    count per group of `by`, plus sum, mean and var (ddof=1, NaN for single
+    rows) of `column`; indexed by the group keys, in sorted order.
+    """
+    flat, axes, occupied = _encode(arrays, by)
+    if column is None:
+        count, keys = _bincounts(flat, axes, occupied)
+        present = count > 0
+        out = {"count": count[present]}
+    else:
+        # the column is one more radix digit: a (group, value) table gives every
+        # total with one bincount and no float weights
+        codes, values = _column_codes(arrays[column])
+        groups = int(np.prod([len(v) for v in axes])) if occupied is None else len(occupied)
+        if groups * len(values) <= DENSE_KEYS:
+            table = np.bincount(flat * len(values) + codes, minlength=groups * len(values)).reshape(groups, -1)
+            values = values.astype(np.float64)
+            count, total, squares = table.sum(axis=1), table @ values, table @ (values * values)
+        else:
+            values = np.asarray(arrays[column], dtype=np.float64)
+            count = np.bincount(flat, minlength=groups)
+            total = np.bincount(flat, weights=values, minlength=groups)
+            squares = np.bincount(flat, weights=values * values, minlength=groups)
+        keys = np.arange(groups) if occupied is None else occupied
+        present = count > 0
+        n, total, squares = count[present], total[present], squares[present]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = np.where(n > 1, np.maximum(squares - total * total / n, 0) / (n - 1), np.nan)
+        out = {"count": n, "sum": total, "mean": total / n, "var": var}
+    keys = _keys(axes, by, keys[present])
+    index = pd.MultiIndex.from_frame(keys) if len(by) > 1 else pd.Index(keys[by[0]], name=by[0])
+    return pd.DataFrame(out, index=index)
+
+
+def row_counts(arrays, by) -> np.ndarray:
+    """For every row, how many rows share its `by` key."""
+    flat, axes, occupied = _encode(arrays, by)
+    return _bincounts(flat, axes, occupied)[0][flat]
+
+
+# -------------------------------------------------------------------
+# BENCHMARK
+# -------------------------------------------------------------------
+BUBBLE_KEYS = ["Sleep_Hours_Per_Night", "Depressed_Anxious"]
+ENGAGEMENT_KEY = "Academic_Engagement"
+
+
+def _pandas_charts(df: pd.DataFrame):
+    # the two chart groupings as the tabs used to run them on every rerun
+    bubbles = df.groupby(BUBBLE_KEYS)[BUBBLE_KEYS[0]].transform("count").to_numpy()
+    engagement = df.groupby(ENGAGEMENT_KEY).agg({"Depressed_Anxious": ["mean", "count", "var"]})
+    return bubbles, engagement
+
+
+def _kernel_charts(arrays: dict):
+    bubbles = row_counts(arrays, BUBBLE_KEYS)
+    engagement = group_stats(arrays, [ENGAGEMENT_KEY], "Depressed_Anxious")
+    return bubbles, engagement
+
+
+def _best_of(fn, arg, repeats=3) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark(sizes, csv_path=DEFAULT_CSV, seed=0):
+    """Resample the real survey to each size and time the chart groupings: pandas vs the kernel."""
+    survey = read_survey_csv(csv_path)
+    rng = np.random.default_rng(seed)
+    print(f"{'rows':>12} {'pandas ms':>10} {'kernel ms':>10} {'speed-up':>9}")
+    for n in sizes:
+        idx = rng.integers(0, len(survey["Age"]), size=n)
+        arrays = {col: survey[col][idx] for col in SURVEY_COLUMNS}
+        df = pd.DataFrame(arrays)
+
+        (bubbles, engagement), (kernel_bubbles, kernel_engagement) = _pandas_charts(df), _kernel_charts(arrays)
+        assert np.array_equal(bubbles, kernel_bubbles)
+        expected = engagement["Depressed_Anxious"]
+        assert np.array_equal(expected["count"].to_numpy(), kernel_engagement["count"].to_numpy())
+        assert np.allclose(
+            expected[["mean", "var"]].to_numpy(), kernel_engagement[["mean", "var"]].to_numpy(), equal_nan=True
+        )
+
+        pandas_s, kernel_s = _best_of(_pandas_charts, df), _best_of(_kernel_charts, arrays)
+        print(f"{n:>12,} {pandas_s * 1e3:>10.1f} {kernel_s * 1e3:>10.1f} {pandas_s / kernel_s:>8.1f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the bincount group-by against pandas groupby.")
+    parser.add_argument("--csv", default=str(DEFAULT_CSV), help="cleaned survey CSV to resample")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args(argv)
+    benchmark(args.rows, args.csv)
+
+
+if __name__ == "__main__":
+    main()
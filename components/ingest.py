@@ -0,0 +1,178 @@
+# ingest.py
+# Append-only ingestion of new survey responses.
+#
+# Every accepted batch becomes an immutable segment file in assets/data/ingest/,
+# listed in log.json, and the running aggregates (aggregates.npz) are updated
+# with that batch only. The cleaned CSV itself is never rewritten.
+#
+#     python -m components.ingest new_responses.csv
+#     python -m components.ingest --rebuild            # recompute aggregates from scratch
+
+import argparse
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from components.aggregates import AGGREGATES_FORMAT, SurveyAggregates
+from components.fileio import atomic_write_json, file_lock, file_stamp, read_json
+from components.schema import SURVEY_COLUMNS, read_survey_csv, to_compact_arrays
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_CSV = BASE_DIR / "assets" / "data" / "Cleaned_Form_Responses.csv"
+INGEST_DIR = BASE_DIR / "assets" / "data" / "ingest"
+LOG_NAME = "log.json"
+AGGREGATES_NAME = "aggregates.npz"
+LOCK_NAME = ".ingest.lock"
+
+# rows per chunk when aggregates have to be rebuilt from the full CSV
+CHUNK_ROWS = 250_000
+
+
+# -------------------------------------------------------------------
+# READING THE LOG
+# -------------------------------------------------------------------
+def read_log(ingest_dir=INGEST_DIR) -> dict:
+    return read_json(Path(ingest_dir) / LOG_NAME, default={"segments": []})
+
+
+def log_version(ingest_dir=INGEST_DIR):
+    """
+    Cheap token that changes whenever a batch is appended (one stat call).
+    None while nothing has been ingested.
+    """
+    try:
+        stamp = file_stamp(Path(ingest_dir) / LOG_NAME)
+    except FileNotFoundError:
+        return None
+    return (stamp["size"], stamp["mtime_ns"])
+
+
+def segment_paths(log: dict, ingest_dir=INGEST_DIR):
+    return [Path(ingest_dir) / seg["file"] for seg in log["segments"]]
+
+
+def read_segment(path) -> dict:
+    """Column name -> compact read-only array for one ingested batch."""
+    return read_survey_csv(path)
+
+
+def _base_meta(csv_path) -> dict:
+    stamp = file_stamp(csv_path)
+    return {"base_size": stamp["size"], "base_mtime_ns": stamp["mtime_ns"]}
+
+
+def saved_aggregates(csv_path=DEFAULT_CSV, ingest_dir=INGEST_DIR):
+    """
+    The persisted running aggregates (base CSV + every segment), or None when
+    they are missing or out of step with the log / the base CSV.
+    """
+    path = Path(ingest_dir) / AGGREGATES_NAME
+    if not path.exists():
+        return None
+    agg, meta = SurveyAggregates.load(path)
+    expected = dict(
+        _base_meta(csv_path), segments=len(read_log(ingest_dir)["segments"]), format=AGGREGATES_FORMAT
+    )
+    if any(meta.get(k) != v for k, v in expected.items()):
+        return None
+    return agg
+
+
+def rebuild_aggregates(csv_path=DEFAULT_CSV, ingest_dir=INGEST_DIR) -> SurveyAggregates:
+    """Full O(history) recompute: base CSV in chunks, then every segment."""
+    agg = SurveyAggregates()
+    for chunk in pd.read_csv(csv_path, chunksize=CHUNK_ROWS):
+        agg.update(to_compact_arrays(chunk))
+    for path in segment_paths(read_log(ingest_dir), ingest_dir):
+        agg.update(read_segment(path))
+    return agg
+
+
+# -------------------------------------------------------------------
+# APPENDING
+# -------------------------------------------------------------------
+def append_batch(batch: pd.DataFrame, csv_path=DEFAULT_CSV, ingest_dir=INGEST_DIR) -> dict:
+    """
+    Validate a batch of cleaned responses and append it to the dataset.
+
+    The batch is checked against the survey schema before anything is written.
+    Then, under the ingest lock: the segment file is written, the running
+    aggregates are updated with the batch (O(batch)), and finally log.json is
+    replaced, which is the commit point readers key on.
+    """
+    arrays = to_compact_arrays(batch)
+    rows = len(batch)
+    if rows == 0:
+        raise ValueError("Batch has no rows")
+
+    ingest_dir = Path(ingest_dir)
+    ingest_dir.mkdir(parents=True, exist_ok=True)
+
+    with file_lock(ingest_dir / LOCK_NAME):
+        log = read_log(ingest_dir)
+        agg = saved_aggregates(csv_path, ingest_dir)
+        if agg is None:
+            agg = rebuild_aggregates(csv_path, ingest_dir)
+
+        seq = len(log["segments"]) + 1
+        name = f"batch-{seq:06d}.csv"
+        tmp = ingest_dir / (name + ".tmp")
+        batch[SURVEY_COLUMNS].to_csv(tmp, index=False)
+        os.replace(tmp, ingest_dir / name)
+
+        agg.update(arrays)
+        agg_tmp = ingest_dir / "aggregates.tmp.npz"
+        agg.save(agg_tmp, segments=seq, **_base_meta(csv_path))
+        os.replace(agg_tmp, ingest_dir / AGGREGATES_NAME)
+
+        log["segments"].append(
+            {
+                "file": name,
+                "rows": rows,
+                "ingested_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            }
+        )
+        atomic_write_json(ingest_dir / LOG_NAME, log)
+
+    return {"segment": name, "rows": rows, "total_rows": agg.n}
+
+
+def write_rebuilt_aggregates(csv_path=DEFAULT_CSV, ingest_dir=INGEST_DIR) -> SurveyAggregates:
+    ingest_dir = Path(ingest_dir)
+    ingest_dir.mkdir(parents=True, exist_ok=True)
+    with file_lock(ingest_dir / LOCK_NAME):
+        agg = rebuild_aggregates(csv_path, ingest_dir)
+        segments = len(read_log(ingest_dir)["segments"])
+        agg_tmp = ingest_dir / "aggregates.tmp.npz"
+        agg.save(agg_tmp, segments=segments, **_base_meta(csv_path))
+        os.replace(agg_tmp, ingest_dir / AGGREGATES_NAME)
+    return agg
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Append cleaned survey responses to the dashboard dataset.")
+    parser.add_argument("batch", nargs="?", help="CSV with the 22 cleaned survey columns")
+    parser.add_argument("--csv", default=str(DEFAULT_CSV), help="base cleaned survey CSV")
+    parser.add_argument("--ingest-dir", default=str(INGEST_DIR), help="segment / aggregate folder")
+    parser.add_argument("--rebuild", action="store_true", help="recompute the running aggregates")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        agg = write_rebuilt_aggregates(args.csv, args.ingest_dir)
+        print(f"Rebuilt aggregates over {agg.n} responses")
+        return
+    if not args.batch:
+        parser.error("a batch CSV is required (or use --rebuild)")
+
+    summary = append_batch(pd.read_csv(args.batch), args.csv, args.ingest_dir)
+    print(
+        f"Appended {summary['rows']} responses as {summary['segment']} "
+        f"({summary['total_rows']} in total)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# lru.py
+# Bounded least-recently-used cache shared by the Streamlit session threads.
+#
+# Results kept per data version (resampling results, raked weights, figures)
+# are looked up by every session at once. All reads, writes and evictions
+# happen under one lock, and a missing entry is built by a single thread
+# while the others wait for it, so an expensive result is never computed
+# twice, and a build does not hold up lookups of other keys:
+#
+#     cache = LRUCache(64)
+#     intervals = cache.get(("intervals", cohort), compute)
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """At most `size` values by key; the least recently used is dropped first."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._building = {}  # key -> lock held by the thread building it
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key):
+        # (found, value); call with self._lock held
+        if key in self._items:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return True, self._items[key]
+        return False, None
+
+    def _store(self, key, value):
+        # call with self._lock held
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.size:
+            self._items.popitem(last=False)
+
+    def get(self, key, build):
+        """The value for key, calling build() to make it on a miss (once, whichever thread asks)."""
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            building = self._building.setdefault(key, threading.Lock())
+        with building:
+            with self._lock:
+                # another thread may have built it while this one waited
+                found, value = self._lookup(key)
+                if found:
+                    return value
+                self.misses += 1
+            try:
+                value = build()
+                with self._lock:
+                    self._store(key, value)
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+        return value
+
+    def evict(self, predicate):
+        """Drop every entry whose key satisfies predicate(key)."""
+        with self._lock:
+            for key in [key for key in self._items if predicate(key)]:
+                del self._items[key]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
@@ -0,0 +1,307 @@
+# partitions.py
+# Partitioned survey layout: one folder of column files per (institution, field).
+#
+# Build (or rebuild) it from the cleaned CSV with:
+#     python -m components.partitions [--csv PATH] [--store DIR]
+#     WELLNESS_STORAGE=partitioned streamlit run app.py
+#
+# partitions.json lists every partition with its row count and the min / max of
+# each column, so a filtered load (e.g. STEM students at one institution type)
+# opens only the partitions that can hold matching rows. Each partition also
+# keeps its correlation moments, so per-institution / per-field correlations
+# are merged from the manifest without reading any rows.
+
+import argparse
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from components.aggregates import Moments
+from components.features import DERIVED_SOURCES, derive_column
+from components.fileio import atomic_write_json, file_lock, file_stamp, read_json
+from components.groupby import group_index
+from components.ingest import INGEST_DIR, read_log, read_segment, segment_paths
+from components.schema import SURVEY_COLUMNS, column_dtype, to_compact_arrays
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_CSV = BASE_DIR / "assets" / "data" / "Cleaned_Form_Responses.csv"
+STORE_DIR = BASE_DIR / "assets" / "data" / "partitions"
+MANIFEST_NAME = "partitions.json"
+LOCK_NAME = ".partitions.lock"
+
+# per-faculty views filter on these, so rows are split by them
+PARTITION_COLUMNS = ["Type_of_Institution", "Field_of_Study"]
+
+CHUNK_ROWS = 250_000
+
+
+def _partition_dir(key) -> str:
+    return "/".join(f"{col}={code}" for col, code in zip(PARTITION_COLUMNS, key))
+
+
+def _split(arrays: dict):
+    """Yield (partition key, rows of that partition) for a chunk of compact arrays."""
+    group, keys = group_index(arrays, PARTITION_COLUMNS)
+    for i, key in enumerate(keys.itertuples(index=False)):
+        rows = np.flatnonzero(group == i)
+        yield tuple(int(k) for k in key), {col: arrays[col][rows] for col in SURVEY_COLUMNS}
+
+
+def _append(store_dir: Path, manifest: dict, arrays: dict):
+    """
+    Append a chunk to its partitions and fold it into their statistics.
+    File lengths are cut back to the manifest's row count first, which drops
+    bytes left behind by an append that crashed before the manifest update.
+    """
+    for key, part_arrays in _split(arrays):
+        name = _partition_dir(key)
+        entry = manifest["partitions"].get(name)
+        if entry is None:
+            entry = {"key": list(key), "rows": 0, "stats": {}, "moments": Moments().to_dict()}
+            manifest["partitions"][name] = entry
+            (store_dir / name).mkdir(parents=True, exist_ok=True)
+
+        for col in SURVEY_COLUMNS:
+            values = part_arrays[col]
+            with open(store_dir / name / f"{col}.bin", "ab") as f:
+                f.truncate(entry["rows"] * column_dtype(col).itemsize)
+                f.write(values.tobytes())
+            lo, hi = values.min().item(), values.max().item()
+            if col in entry["stats"]:
+                lo = min(lo, entry["stats"][col][0])
+                hi = max(hi, entry["stats"][col][1])
+            entry["stats"][col] = [lo, hi]
+        entry["rows"] += len(part_arrays[SURVEY_COLUMNS[0]])
+        if "moments" in entry:
+            moments = Moments.from_dict(entry["moments"]).update(part_arrays)
+            entry["moments"] = moments.to_dict()
+
+
+def build_partitions(csv_path=DEFAULT_CSV, store_dir=STORE_DIR, chunksize=CHUNK_ROWS) -> Path:
+    """
+    Stream the cleaned CSV in chunks and split every chunk into its partitions.
+    Built in a temp folder and swapped in at the end, like the column store.
+    """
+    store_dir = Path(store_dir)
+    tmp_dir = store_dir.with_name(store_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    manifest = {
+        "partition_columns": PARTITION_COLUMNS,
+        "columns": {col: column_dtype(col).str for col in SURVEY_COLUMNS},
+        "source": file_stamp(csv_path),
+        "segments": 0,
+        "partitions": {},
+    }
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+        _append(tmp_dir, manifest, to_compact_arrays(chunk))
+    atomic_write_json(tmp_dir / MANIFEST_NAME, manifest)
+
+    shutil.rmtree(store_dir, ignore_errors=True)
+    os.replace(tmp_dir, store_dir)
+    return store_dir
+
+
+def is_store_current(csv_path=DEFAULT_CSV, store_dir=STORE_DIR) -> bool:
+    manifest = read_json(Path(store_dir) / MANIFEST_NAME)
+    return manifest is not None and manifest.get("source") == file_stamp(csv_path)
+
+
+def sync_segments(store_dir=STORE_DIR, ingest_dir=INGEST_DIR) -> int:
+    """Split ingested batches the store does not hold yet into their partitions."""
+    store_dir = Path(store_dir)
+    manifest = read_json(store_dir / MANIFEST_NAME)
+    pending = segment_paths(read_log(ingest_dir), ingest_dir)[manifest["segments"]:]
+    for path in pending:
+        _append(store_dir, manifest, read_segment(path))
+        manifest["segments"] += 1
+        atomic_write_json(store_dir / MANIFEST_NAME, manifest)
+    return len(pending)
+
+
+class PartitionStore:
+    """
+    Read-only view of one partitioned store.
+
+    select() / count() prune partitions first: by their key for the partition
+    columns, and by the per-column min / max for any other filter. Only the
+    surviving partitions' files are opened (np.memmap). As a plain column
+    name -> array mapping it serves every partition concatenated, in manifest
+    order, for the unfiltered charts.
+    """
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = Path(store_dir)
+        self.manifest = read_json(self.store_dir / MANIFEST_NAME)
+        self.partitions = sorted(self.manifest["partitions"].items())
+        self.rows = sum(entry["rows"] for _, entry in self.partitions)
+        self._columns = {}
+        self._lock = threading.RLock()  # derived columns re-enter to open their sources
+
+    # ---------- PRUNING ----------
+    def matching_partitions(self, filters=None):
+        """(name, entry) of every partition that can hold rows matching filters (column -> codes)."""
+        filters = {col: set(codes) for col, codes in (filters or {}).items()}
+        matches = []
+        for name, entry in self.partitions:
+            if entry["rows"] == 0:
+                continue
+            keep = True
+            for col, codes in filters.items():
+                if col in PARTITION_COLUMNS:
+                    keep = entry["key"][PARTITION_COLUMNS.index(col)] in codes
+                else:
+                    lo, hi = entry["stats"][col]
+                    keep = any(lo <= code <= hi for code in codes)
+                if not keep:
+                    break
+            if keep:
+                matches.append((name, entry))
+        return matches
+
+    def _read(self, name, entry, col):
+        return np.memmap(
+            self.store_dir / name / f"{col}.bin",
+            dtype=np.dtype(self.manifest["columns"][col]),
+            mode="r",
+            shape=(entry["rows"],),
+        )
+
+    def _row_filters(self, filters):
+        # key columns are settled by pruning; only the others need a row mask
+        return {col: codes for col, codes in (filters or {}).items() if col not in PARTITION_COLUMNS}
+
+    def select(self, columns, filters=None) -> dict:
+        """
+        Column name -> read-only array for the rows matching filters, reading
+        only the partitions that survive pruning. Derived columns are computed
+        on the selected rows.
+        """
+        columns = list(columns)
+        row_filters = self._row_filters(filters)
+        raw = [c for c in SURVEY_COLUMNS if c in columns or c in row_filters
+               or any(c in DERIVED_SOURCES.get(d, []) for d in columns)]
+
+        parts = {col: [] for col in raw}
+        for name, entry in self.matching_partitions(filters):
+            mask = None
+            for col, codes in row_filters.items():
+                hit = np.isin(self._read(name, entry, col), list(codes))
+                mask = hit if mask is None else mask & hit
+            for col in raw:
+                values = self._read(name, entry, col)
+                parts[col].append(values[mask] if mask is not None else np.asarray(values))
+
+        arrays = {}
+        for col in raw:
+            values = np.concatenate(parts[col]) if parts[col] else np.empty(0, column_dtype(col))
+            values.flags.writeable = False
+            arrays[col] = values
+        for col in columns:
+            if col in DERIVED_SOURCES:
+                arrays[col] = derive_column(col, arrays)
+        return {col: arrays[col] for col in columns}
+
+    def chunks(self, columns, chunksize=CHUNK_ROWS):
+        """
+        Every row as batches of at most chunksize (column name -> array),
+        one partition at a time, each copied out of the mapped files; a
+        single empty batch when there are no rows.
+        """
+        empty = True
+        for name, entry in self.matching_partitions():
+            for start in range(0, entry["rows"], chunksize):
+                empty = False
+                yield {col: np.array(self._read(name, entry, col)[start:start + chunksize]) for col in columns}
+        if empty:
+            yield {col: np.empty(0, column_dtype(col)) for col in columns}
+
+    def count(self, filters=None) -> int:
+        """Rows matching filters; answered from the manifest when only partition columns are filtered."""
+        row_filters = self._row_filters(filters)
+        matches = self.matching_partitions(filters)
+        if not row_filters:
+            return sum(entry["rows"] for _, entry in matches)
+        first = next(iter(row_filters))
+        return len(self.select([first], filters)[first])
+
+    def moments(self, filters=None) -> Moments:
+        """
+        Correlation moments of the rows matching filters. With filters on the
+        partition columns only, the matching partitions' stored moments are
+        merged; other filters read the surviving partitions' rows.
+        """
+        if self._row_filters(filters):
+            return Moments.from_arrays(self.select(SURVEY_COLUMNS, filters))
+        moments = Moments()
+        for name, entry in self.matching_partitions(filters):
+            if "moments" in entry:
+                moments.merge(Moments.from_dict(entry["moments"]))
+            else:
+                # stores written before moments were kept
+                moments.update({col: self._read(name, entry, col) for col in SURVEY_COLUMNS})
+        return moments
+
+    # ---------- COLUMN MAPPING ----------
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, name):
+        return name in self.manifest["columns"] or name in DERIVED_SOURCES
+
+    def __getitem__(self, name):
+        column = self._columns.get(name)
+        if column is None:
+            with self._lock:
+                column = self._columns.get(name)
+                if column is None:
+                    column = self._open(name)
+                    self._columns[name] = column
+        return column
+
+    def _open(self, name):
+        if name in self.manifest["columns"]:
+            return self.select([name])[name]
+        if name in DERIVED_SOURCES:
+            return derive_column(name, self)
+        raise KeyError(name)
+
+    def loaded_columns(self):
+        return list(self._columns)
+
+
+def open_partition_store(csv_path=DEFAULT_CSV, store_dir=STORE_DIR, ingest_dir=INGEST_DIR) -> PartitionStore:
+    """
+    Open the partitioned store for csv_path, (re)building it first when it is
+    missing or older than the CSV, and adding any newly ingested batches.
+    """
+    store_dir = Path(store_dir)
+    store_dir.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(store_dir.with_name(LOCK_NAME)):
+        if not is_store_current(csv_path, store_dir):
+            build_partitions(csv_path, store_dir)
+        sync_segments(store_dir, ingest_dir)
+    return PartitionStore(store_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the partitioned survey store.")
+    parser.add_argument("--csv", default=str(DEFAULT_CSV), help="cleaned survey CSV")
+    parser.add_argument("--store", default=str(STORE_DIR), help="output folder")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="rows per CSV chunk")
+    args = parser.parse_args(argv)
+
+    store_dir = build_partitions(args.csv, args.store, args.chunksize)
+    sync_segments(store_dir)
+    store = PartitionStore(store_dir)
+    print(f"Wrote {store.rows} rows in {len(store.partitions)} partitions to {store_dir}")
+
+
+if __name__ == "__main__":
+    main()
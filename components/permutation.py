@@ -0,0 +1,115 @@
+# permutation.py
+# Permutation-test p-values for correlations with the wellness level, from joint counts.
+#
+# Shuffling the wellness labels across responses keeps how many responses
+# have each predictor value and each wellness level, and spreads the labels at
+# random over them. The shuffled (value, level) table is therefore a random
+# table with those margins, drawn value by value with vectorised hypergeometric
+# draws for a whole batch of shuffles at once, at a cost set by the number of
+# distinct values rather than the number of responses. Predictors stop being
+# shuffled as soon as their p-value is clearly above or below the threshold.
+
+import numpy as np
+import pandas as pd
+
+
+ALPHA = 0.05
+
+# shuffles per batch, and the most any predictor gets (p-values resolve to 1 / MAX_PERMUTATIONS)
+BATCH = 1000
+MAX_PERMUTATIONS = 20_000
+
+# width (in standard errors) of the Wilson interval used for early stopping
+STOP_Z = 3.0
+
+
+def _cross_sums(x, y, counts) -> float:
+    return float(np.asarray(x, dtype=np.float64) @ counts @ np.asarray(y, dtype=np.float64))
+
+
+def shuffled_cross_sums(x, y, counts, permutations, rng) -> np.ndarray:
+    """
+    Σ x·y over the responses for `permutations` shuffles of the y labels,
+    where counts[i, j] responses have (x[i], y[j]).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.int64)
+    remaining = np.tile(counts.sum(axis=0), (permutations, 1))
+    sums = np.zeros(permutations)
+    for value, size in zip(x, counts.sum(axis=1)):
+        left = np.full(permutations, size)
+        for j in range(len(y) - 1):
+            # how many of this value's responses draw label j from what is left
+            drawn = rng.hypergeometric(remaining[:, j], remaining[:, j + 1:].sum(axis=1), left)
+            remaining[:, j] -= drawn
+            left -= drawn
+            sums += value * y[j] * drawn
+        remaining[:, -1] -= left
+        sums += value * y[-1] * left
+    return sums
+
+
+def _wilson(hits, trials, z=STOP_Z):
+    p = hits / trials
+    centre = (p + z * z / (2 * trials)) / (1 + z * z / trials)
+    half = z * np.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / (1 + z * z / trials)
+    return centre - half, centre + half
+
+
+def holm(p_values: pd.Series) -> pd.Series:
+    """Holm step-down adjusted p-values (family-wise error control over all tests)."""
+    order = np.argsort(p_values.to_numpy(), kind="stable")
+    m = len(order)
+    scaled = p_values.to_numpy()[order] * (m - np.arange(m))
+    adjusted = np.empty(m)
+    adjusted[order] = np.minimum(np.maximum.accumulate(scaled), 1.0)
+    return pd.Series(adjusted, index=p_values.index)
+
+
+def permutation_pvalues(tables: dict, alpha=ALPHA, max_permutations=MAX_PERMUTATIONS, seed=0) -> pd.DataFrame:
+    """
+    Two-sided permutation p-value of the correlation for every
+    name -> (x, y, counts) in tables, Holm-adjusted across them.
+
+    Shuffles run in batches; a predictor stops once the Wilson interval of
+    its p-value lies below alpha / len(tables) (significant at any Holm step)
+    or above alpha (significant at none). Returns p_value, p_adjusted,
+    significant and permutations (the number used) per name.
+    """
+    rng = np.random.default_rng(seed)
+    names = list(tables)
+    m = len(names)
+    hits = dict.fromkeys(names, 0)
+    trials = dict.fromkeys(names, 0)
+
+    # Σ x·y under independence, and how far the observed table is from it
+    centres, observed = {}, {}
+    for name, (x, y, counts) in tables.items():
+        counts = np.asarray(counts)
+        n = counts.sum()
+        if n < 2:
+            continue
+        centres[name] = (np.asarray(x, dtype=np.float64) @ counts.sum(axis=1)) * (
+            counts.sum(axis=0) @ np.asarray(y, dtype=np.float64)
+        ) / n
+        observed[name] = abs(_cross_sums(x, y, counts) - centres[name])
+
+    active = set(centres)
+    while active:
+        for name in sorted(active, key=names.index):
+            x, y, counts = tables[name]
+            shuffled = np.abs(shuffled_cross_sums(x, y, counts, BATCH, rng) - centres[name])
+            hits[name] += int((shuffled >= observed[name] * (1 - 1e-12)).sum())
+            trials[name] += BATCH
+
+            low, high = _wilson(hits[name] + 1, trials[name] + 1)
+            if high < alpha / m or low > alpha or trials[name] >= max_permutations:
+                active.discard(name)
+
+    result = pd.DataFrame(index=names)
+    result["p_value"] = [(hits[name] + 1) / (trials[name] + 1) for name in names]
+    result["p_adjusted"] = holm(result["p_value"])
+    result["significant"] = result["p_adjusted"] < alpha
+    result["permutations"] = [trials[name] for name in names]
+    return result
@@ -0,0 +1,170 @@
+# preprocessing.py
+# Streaming port of "Student Wellness Classification/Data_Preprocessing.ipynb":
+# raw Google Form export -> Cleaned_Form_Responses.csv, in fixed-size chunks.
+#
+#     python -m components.preprocessing Form_Responses.csv Cleaned_Form_Responses.csv
+#
+# Same steps as the notebook:
+#   1. drop the phq / gad items and the score columns
+#   2. drop the free-text feelings column
+#   3. replace out-of-range Age (< 10 or > 80) with the median age
+#   4. label-encode the categorical columns (codes start at 1)
+#
+# Pass 1 streams the export to collect the age histogram (exact median) and
+# the category sets; pass 2 streams it again and writes the cleaned chunks.
+# Memory is one chunk plus the histogram / category sets.
+
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from components.fileio import atomic_write_json, read_json
+from components.schema import AGE_MAX, AGE_MIN, SURVEY_COLUMNS, validate_columns
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+ENCODINGS_PATH = BASE_DIR / "assets" / "data" / "category_encodings.json"
+
+CHUNK_ROWS = 100_000
+
+DROP_COLUMNS = (
+    [f"phq{i}" for i in range(1, 10)]
+    + [f"gad{i}" for i in range(1, 8)]
+    + ["Total_Score", "Depression_Score", "Anxiety_Score"]
+)
+FREE_TEXT_COLUMN = "Feelings_Emotions_Over_Past_2_Weeks"
+
+# pinned so every chunk parses the same way (a chunk of whole hours would otherwise read as int)
+READ_DTYPES = {"Sleep_Hours_Per_Night": "float64"}
+
+CATEGORICAL_COLUMNS = [
+    "Gender",
+    "Current_Level_of_Studies",
+    "Field_of_Study",
+    "Type_of_Institution",
+    "Academic_Satisfaction",
+    "Academic_Engagement",
+    "Academic_Workload",
+    "Coursework_Pressure",
+    "Academic_Performance",
+    "Eating_Nutrition_Habits",
+    "Physical_Activity_Freq",
+    "Social_Support",
+    "Romantic_Satisfaction",
+    "Financial_Stress",
+    "CoCurricular_Involvement",
+    "Isolation_Frequency",
+    "Family_History_Mental_Illness",
+    "Recent_Suicidal_Thoughts",
+    "Depressed_Anxious",
+]
+
+
+# -------------------------------------------------------------------
+# PASS 1: AGE HISTOGRAM + CATEGORY SETS
+# -------------------------------------------------------------------
+def scan_export(raw_path, chunksize=CHUNK_ROWS):
+    """
+    Return (age value -> count, column -> set of category strings) for the export.
+    """
+    age_counts = {}
+    categories = {col: set() for col in CATEGORICAL_COLUMNS}
+
+    for chunk in pd.read_csv(raw_path, chunksize=chunksize, dtype=READ_DTYPES):
+        for age, count in chunk["Age"].value_counts().items():
+            age_counts[age] = age_counts.get(age, 0) + int(count)
+        for col in CATEGORICAL_COLUMNS:
+            # astype(str) like the notebook, so a blank answer becomes the category "nan"
+            categories[col].update(chunk[col].astype(str).unique())
+
+    return age_counts, categories
+
+
+def median_from_counts(counts: dict) -> float:
+    """Exact median of the values described by a value -> count histogram."""
+    values = np.array(sorted(counts), dtype=np.float64)
+    cum = np.cumsum([counts[v] for v in sorted(counts)])
+    total = int(cum[-1])
+    lower = values[np.searchsorted(cum, (total + 1) // 2)]
+    upper = values[np.searchsorted(cum, total // 2 + 1)]
+    return (lower + upper) / 2
+
+
+def build_encodings(categories: dict, existing: dict = None) -> dict:
+    """
+    Column -> ordered category list; a category's code is its position + 1.
+
+    A fresh dictionary is sorted, which gives exactly the notebook's
+    LabelEncoder codes. With an existing dictionary, known categories keep
+    their codes and unseen ones are appended at the end, so every chunk and
+    every later export maps categories the same way.
+    """
+    encodings = {}
+    for col in CATEGORICAL_COLUMNS:
+        known = list((existing or {}).get(col, []))
+        new = sorted(set(categories[col]) - set(known))
+        encodings[col] = known + new
+    return encodings
+
+
+# -------------------------------------------------------------------
+# PASS 2: CLEAN + ENCODE
+# -------------------------------------------------------------------
+def clean_chunk(chunk: pd.DataFrame, age_fill: int, encodings: dict) -> pd.DataFrame:
+    chunk = chunk.drop(columns=DROP_COLUMNS + [FREE_TEXT_COLUMN])
+
+    out_of_range = (chunk["Age"] < AGE_MIN) | (chunk["Age"] > AGE_MAX)
+    chunk["Age"] = chunk["Age"].mask(out_of_range, age_fill).astype(np.int64)
+
+    for col in CATEGORICAL_COLUMNS:
+        codes = {category: i + 1 for i, category in enumerate(encodings[col])}
+        chunk[col] = chunk[col].astype(str).map(codes)
+
+    chunk = chunk[SURVEY_COLUMNS]
+    validate_columns(chunk.columns)
+    return chunk
+
+
+def preprocess_export(raw_path, out_path, encodings_path=ENCODINGS_PATH, chunksize=CHUNK_ROWS) -> dict:
+    """
+    Clean a raw export into the dashboard CSV with bounded memory.
+    The encoding dictionary at encodings_path is reused and extended.
+    """
+    age_counts, categories = scan_export(raw_path, chunksize)
+    age_median = median_from_counts(age_counts)
+    # Age stays whole years in the cleaned file
+    age_fill = int(np.round(age_median))
+
+    encodings = build_encodings(categories, read_json(encodings_path))
+    atomic_write_json(encodings_path, encodings)
+
+    out_path = Path(out_path)
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    rows = 0
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        for chunk in pd.read_csv(raw_path, chunksize=chunksize, dtype=READ_DTYPES):
+            cleaned = clean_chunk(chunk, age_fill, encodings)
+            cleaned.to_csv(f, index=False, header=(rows == 0))
+            rows += len(cleaned)
+    os.replace(tmp, out_path)
+
+    return {"rows": rows, "age_median": age_median}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clean a raw survey export for the dashboard.")
+    parser.add_argument("raw", help="raw Google Form export (Form_Responses.csv)")
+    parser.add_argument("out", help="cleaned CSV to write")
+    parser.add_argument("--encodings", default=str(ENCODINGS_PATH), help="category encoding dictionary (JSON)")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="rows per chunk")
+    args = parser.parse_args(argv)
+
+    summary = preprocess_export(args.raw, args.out, args.encodings, args.chunksize)
+    print(f"Wrote {summary['rows']} cleaned rows to {args.out} (median age {summary['age_median']:g})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+# schema.py
+# Column layout of the cleaned survey and the compact in-memory form of each column.
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+
+# Column order of Cleaned_Form_Responses.csv (output of Data_Preprocessing.ipynb)
+SURVEY_COLUMNS = [
+    "Age",
+    "Gender",
+    "Current_Level_of_Studies",
+    "Field_of_Study",
+    "Type_of_Institution",
+    "Academic_Satisfaction",
+    "Study_Hours_Per_Week",
+    "Academic_Engagement",
+    "Academic_Workload",
+    "Coursework_Pressure",
+    "Academic_Performance",
+    "Sleep_Hours_Per_Night",
+    "Eating_Nutrition_Habits",
+    "Physical_Activity_Freq",
+    "Social_Support",
+    "Romantic_Satisfaction",
+    "Financial_Stress",
+    "CoCurricular_Involvement",
+    "Isolation_Frequency",
+    "Family_History_Mental_Illness",
+    "Recent_Suicidal_Thoughts",
+    "Depressed_Anxious",
+]
+
+# Every column is a small integer code except sleep hours (e.g. 6.5)
+FLOAT_COLUMNS = ["Sleep_Hours_Per_Night"]
+
+# preprocessing replaces ages outside this range with the median
+AGE_MIN, AGE_MAX = 10, 80
+
+# Valid values per column (inclusive), checked whenever data is loaded.
+# Codes follow assets/data/category_encodings.json (1 = first category).
+LIKERT = (1, 5)
+COLUMN_RANGES = {
+    "Age": (AGE_MIN, AGE_MAX),
+    "Gender": (1, 2),
+    "Current_Level_of_Studies": (1, 3),
+    "Field_of_Study": (1, 5),
+    "Type_of_Institution": (1, 2),
+    "Academic_Satisfaction": LIKERT,
+    "Study_Hours_Per_Week": (0, 127),
+    "Academic_Engagement": LIKERT,
+    "Academic_Workload": LIKERT,
+    "Coursework_Pressure": LIKERT,
+    "Academic_Performance": LIKERT,
+    "Sleep_Hours_Per_Night": (0, 24),
+    "Eating_Nutrition_Habits": LIKERT,
+    "Physical_Activity_Freq": LIKERT,
+    "Social_Support": LIKERT,
+    "Romantic_Satisfaction": LIKERT,
+    "Financial_Stress": LIKERT,
+    "CoCurricular_Involvement": LIKERT,
+    "Isolation_Frequency": LIKERT,
+    "Family_History_Mental_Illness": (1, 2),
+    "Recent_Suicidal_Thoughts": (1, 2),
+    "Depressed_Anxious": (1, 3),
+}
+
+# rows parsed at a time by read_survey_csv
+CHUNK_ROWS = 250_000
+
+
+def column_dtype(col: str):
+    return np.dtype(np.float32) if col in FLOAT_COLUMNS else np.dtype(np.int8)
+
+
+def validate_columns(columns):
+    """
+    Make sure a parsed file has exactly the 22 survey columns, in order.
+    """
+    columns = list(columns)
+    if columns == SURVEY_COLUMNS:
+        return
+
+    missing = [c for c in SURVEY_COLUMNS if c not in columns]
+    extra = [c for c in columns if c not in SURVEY_COLUMNS]
+    raise ValueError(
+        f"Survey file does not match the expected {len(SURVEY_COLUMNS)}-column schema "
+        f"(missing: {missing or 'none'}, unexpected: {extra or 'none'})"
+    )
+
+
+def to_compact_arrays(raw: pd.DataFrame) -> dict:
+    """
+    Convert a freshly parsed frame into one compact, read-only array per column
+    (int8 codes, float32 sleep hours). Missing values, fractional codes and
+    values outside COLUMN_RANGES raise ValueError.
+    """
+    validate_columns(raw.columns)
+
+    arrays = {}
+    for col in SURVEY_COLUMNS:
+        values = raw[col].to_numpy()
+        if np.isnan(values.astype(np.float64)).any():
+            raise ValueError(f"Column {col} has missing values")
+
+        lo, hi = COLUMN_RANGES[col]
+        out_of_range = (values < lo) | (values > hi)
+        if out_of_range.any():
+            raise ValueError(
+                f"Column {col} has {int(out_of_range.sum())} values outside {lo}..{hi} "
+                f"(e.g. {values[out_of_range][0]})"
+            )
+
+        dtype = column_dtype(col)
+        compact = values.astype(dtype)
+        if dtype == np.int8 and not np.array_equal(compact, values):
+            raise ValueError(f"Column {col} has non-integer codes")
+
+        compact.flags.writeable = False
+        arrays[col] = compact
+    return arrays
+
+
+def read_survey_csv(path, chunksize=CHUNK_ROWS) -> dict:
+    """
+    Parse a cleaned survey CSV straight into compact arrays.
+
+    pandas infers int64 for every code column, so the file is parsed one chunk
+    at a time and each chunk is validated and compacted before the next one is
+    read; only the 1-byte (4-byte for sleep hours) columns are kept. Parsing
+    with dtype=int8 directly is not an option: out-of-range values silently
+    wrap around instead of raising.
+    """
+    parts = [to_compact_arrays(chunk) for chunk in pd.read_csv(path, chunksize=chunksize)]
+    if not parts:
+        validate_columns(pd.read_csv(path, nrows=0).columns)
+        parts = [{col: np.empty(0, dtype=column_dtype(col)) for col in SURVEY_COLUMNS}]
+
+    arrays = {}
+    for col in SURVEY_COLUMNS:
+        values = np.concatenate([part[col] for part in parts])
+        values.flags.writeable = False
+        arrays[col] = values
+    return arrays
+
+
+# -------------------------------------------------------------------
+# MEMORY ACCOUNTING
+# -------------------------------------------------------------------
+def nbytes(values) -> int:
+    """Bytes held by one column (array, memmap or categorical); 0 for anything else."""
+    if isinstance(values, pd.Categorical):
+        return values.codes.nbytes + values.categories.memory_usage(deep=True)
+    if isinstance(values, np.ndarray):
+        return values.nbytes
+    return 0
+
+
+def column_memory_report(arrays) -> pd.DataFrame:
+    """
+    Bytes per column of a column name -> array mapping, next to what the same
+    column costs as pandas' default int64 / float64.
+    """
+    rows = []
+    for col in list(arrays):
+        values = arrays[col]
+        rows.append(
+            {
+                "column": col,
+                "dtype": str(values.dtype),
+                "rows": len(values),
+                "bytes": nbytes(values),
+                "default_bytes": len(values) * 8,
+                "memmap": isinstance(values, np.memmap),
+            }
+        )
+    return pd.DataFrame(rows, columns=["column", "dtype", "rows", "bytes", "default_bytes", "memmap"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate a cleaned survey CSV and report its memory use.")
+    parser.add_argument("csv", help="cleaned survey CSV")
+    args = parser.parse_args(argv)
+
+    report = column_memory_report(read_survey_csv(args.csv))
+    print(report.to_string(index=False))
+    print(
+        f"\ncompact: {report['bytes'].sum() / 1e6:.1f} MB, "
+        f"pandas default: {report['default_bytes'].sum() / 1e6:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
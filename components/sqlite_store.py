@@ -0,0 +1,401 @@
+# sqlite_store.py
+# Optional on-disk backend: the survey in a local SQLite database (stdlib sqlite3).
+#
+# Build (or rebuild) it from the cleaned CSV with:
+#     python -m components.sqlite_store [--csv PATH] [--db PATH]
+#     WELLNESS_STORAGE=sqlite streamlit run app.py
+#
+# The grouping columns the tabs use are indexed, so filtered counts and row
+# batches are indexed queries instead of a pass over a frame held in each
+# process. The correlation sums (one row-wise pass over every column pair) are
+# kept in the database next to the rows and updated in the same transaction.
+# The charts themselves are summed from the dashboard's cohort cells, which
+# are built from this store one batch of rows at a time (components/dashboard.py).
+# Compare it with the pandas path on synthetic cohorts with:
+#     python -m components.sqlite_store --benchmark 10000 1000000 10000000
+
+import argparse
+import io
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from components.aggregates import AGGREGATES_FORMAT, SurveyAggregates
+from components.features import DERIVED_SOURCES, derive_column
+from components.fileio import file_lock, file_stamp
+from components.ingest import INGEST_DIR, read_log, read_segment, segment_paths
+from components.schema import FLOAT_COLUMNS, SURVEY_COLUMNS, column_dtype, read_survey_csv, to_compact_arrays
+
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_CSV = BASE_DIR / "assets" / "data" / "Cleaned_Form_Responses.csv"
+DB_PATH = BASE_DIR / "assets" / "data" / "survey.sqlite"
+LOCK_NAME = ".survey_sqlite.lock"
+TABLE = "responses"
+
+# columns the tabs group or filter by
+INDEXED_COLUMNS = [
+    "Age",
+    "Gender",
+    "Field_of_Study",
+    "Current_Level_of_Studies",
+    "Type_of_Institution",
+    "Depressed_Anxious",
+    "Academic_Engagement",
+    "Sleep_Hours_Per_Night",
+]
+
+WELLNESS_COLUMN = "Depressed_Anxious"
+
+CHUNK_ROWS = 250_000
+
+
+def _sql_type(col: str) -> str:
+    return "REAL" if col in FLOAT_COLUMNS else "INTEGER"
+
+
+def _create_schema(conn):
+    columns = ", ".join(f'"{col}" {_sql_type(col)} NOT NULL' for col in SURVEY_COLUMNS)
+    conn.execute(f"CREATE TABLE {TABLE} ({columns})")
+    conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    conn.execute("CREATE TABLE aggregates (id INTEGER PRIMARY KEY CHECK (id = 1), data BLOB NOT NULL)")
+
+
+def _create_indexes(conn):
+    # (column, wellness level) covers both the plain counts and the per-level
+    # breakdowns the charts draw, so neither query touches the table itself
+    for col in INDEXED_COLUMNS:
+        keys = f'"{col}"' if col == WELLNESS_COLUMN else f'"{col}", "{WELLNESS_COLUMN}"'
+        conn.execute(f'CREATE INDEX "idx_{col}" ON {TABLE} ({keys})')
+
+
+def _insert_arrays(conn, arrays: dict):
+    placeholders = ", ".join("?" for _ in SURVEY_COLUMNS)
+    # tolist() hands sqlite plain Python ints / floats
+    rows = zip(*(arrays[col].tolist() for col in SURVEY_COLUMNS))
+    conn.executemany(f"INSERT INTO {TABLE} VALUES ({placeholders})", rows)
+
+
+def _set_meta(conn, **values):
+    conn.executemany(
+        "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+        [(k, json.dumps(v)) for k, v in values.items()],
+    )
+
+
+def _read_meta(conn) -> dict:
+    return {k: json.loads(v) for k, v in conn.execute("SELECT key, value FROM meta")}
+
+
+def _save_aggregates(conn, agg: SurveyAggregates):
+    buffer = io.BytesIO()
+    agg.save(buffer)
+    conn.execute("INSERT OR REPLACE INTO aggregates VALUES (1, ?)", (buffer.getvalue(),))
+
+
+def _load_aggregates(conn) -> SurveyAggregates:
+    (data,) = conn.execute("SELECT data FROM aggregates WHERE id = 1").fetchone()
+    agg, _ = SurveyAggregates.load(io.BytesIO(data))
+    return agg
+
+
+def _write_database(db_path, chunks, **meta) -> Path:
+    """
+    Fill a fresh database from an iterable of compact-array chunks, index it,
+    and swap it in, so readers never see a half-written file.
+    """
+    db_path = Path(db_path)
+    tmp = db_path.with_name(db_path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        _create_schema(conn)
+        agg = SurveyAggregates()
+        for arrays in chunks:
+            _insert_arrays(conn, arrays)
+            agg.update(arrays)
+        _save_aggregates(conn, agg)
+        # indexing once at the end is much cheaper than maintaining them per insert
+        _create_indexes(conn)
+        _set_meta(conn, **meta)
+        conn.commit()
+    finally:
+        conn.close()
+
+    # open connections to an older database keep reading the unlinked file
+    os.replace(tmp, db_path)
+    return db_path
+
+
+def build_sqlite_store(csv_path=DEFAULT_CSV, db_path=DB_PATH, chunksize=CHUNK_ROWS) -> Path:
+    """
+    Stream the cleaned CSV into <db_path> in chunks, validated and compacted
+    with the same rules as the in-memory loader.
+    """
+    chunks = (to_compact_arrays(chunk) for chunk in pd.read_csv(csv_path, chunksize=chunksize))
+    return _write_database(
+        db_path, chunks, source=file_stamp(csv_path), segments=0, aggregates_format=AGGREGATES_FORMAT
+    )
+
+
+def is_store_current(csv_path=DEFAULT_CSV, db_path=DB_PATH) -> bool:
+    if not Path(db_path).exists():
+        return False
+    conn = sqlite3.connect(db_path)
+    try:
+        meta = _read_meta(conn)
+        return meta.get("source") == file_stamp(csv_path) and meta.get("aggregates_format") == AGGREGATES_FORMAT
+    except sqlite3.DatabaseError:
+        return False
+    finally:
+        conn.close()
+
+
+def sync_segments(db_path=DB_PATH, ingest_dir=INGEST_DIR) -> int:
+    """
+    Insert ingested batches the database does not hold yet. Each batch, the
+    updated aggregates and the segment counter go in one transaction, so a
+    crash never half-applies one.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        done = _read_meta(conn).get("segments", 0)
+        pending = segment_paths(read_log(ingest_dir), ingest_dir)[done:]
+        for seq, path in enumerate(pending, start=done + 1):
+            arrays = read_segment(path)
+            with conn:
+                _insert_arrays(conn, arrays)
+                _save_aggregates(conn, _load_aggregates(conn).update(arrays))
+                _set_meta(conn, segments=seq)
+    finally:
+        conn.close()
+    return len(pending)
+
+
+def _where(filters):
+    """filters: column -> allowed codes. Returns (sql, params)."""
+    if not filters:
+        return "", []
+    clauses, params = [], []
+    for col, codes in filters.items():
+        codes = list(codes)
+        clauses.append(f'"{col}" IN ({", ".join("?" for _ in codes)})')
+        params.extend(codes)
+    return " WHERE " + " AND ".join(clauses), params
+
+
+class SqliteStore:
+    """
+    Read-only view of one survey database.
+
+    Works as a column name -> array mapping like ColumnStore (columns are
+    fetched on first access and kept), hands out filtered row batches and
+    counts rows with indexed queries.
+    """
+
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = Path(db_path)
+        # one connection shared by the app's script threads, serialised by the lock
+        self._conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._lock = threading.RLock()  # derived columns re-enter to open their sources
+        self.rows = self._query(f"SELECT COUNT(*) FROM {TABLE}")[0][0]
+        self._columns = {}
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # ---------- COLUMN MAPPING ----------
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, name):
+        return name in SURVEY_COLUMNS or name in DERIVED_SOURCES
+
+    def __getitem__(self, name):
+        column = self._columns.get(name)
+        if column is None:
+            with self._lock:
+                column = self._columns.get(name)
+                if column is None:
+                    column = self._open(name)
+                    self._columns[name] = column
+        return column
+
+    def _open(self, name):
+        if name in SURVEY_COLUMNS:
+            with self._lock:
+                cursor = self._conn.execute(f'SELECT "{name}" FROM {TABLE} ORDER BY rowid')
+                values = np.fromiter(
+                    (row[0] for row in cursor), dtype=column_dtype(name), count=self.rows
+                )
+            values.flags.writeable = False
+            return values
+        if name in DERIVED_SOURCES:
+            return derive_column(name, self)
+        raise KeyError(name)
+
+    def loaded_columns(self):
+        return list(self._columns)
+
+    def chunks(self, columns, chunksize=CHUNK_ROWS, filters=None):
+        """
+        The rows matching filters (survey column -> allowed codes) as batches
+        of chunksize (column name -> array), read with one query per batch and
+        not kept; a single empty batch when no row matches.
+        """
+        columns = list(columns)
+        cols = ", ".join(f'"{c}"' for c in columns)
+        where, params = _where(filters)
+        where = f"{where} AND rowid > ?" if where else " WHERE rowid > ?"
+        last = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT rowid, {cols} FROM {TABLE}{where} ORDER BY rowid LIMIT ?",
+                    (*params, last, chunksize),
+                ).fetchall()
+            if rows or last == 0:
+                yield {
+                    col: np.fromiter((row[i + 1] for row in rows), dtype=column_dtype(col), count=len(rows))
+                    for i, col in enumerate(columns)
+                }
+            if len(rows) < chunksize:
+                return
+            last = rows[-1][0]
+
+    # ---------- QUERIES ----------
+    def count(self, filters=None) -> int:
+        """Rows matching filters (survey column -> allowed codes), counted in the database."""
+        where, params = _where(filters)
+        return self._query(f"SELECT COUNT(*) FROM {TABLE}{where}", params)[0][0]
+
+    def aggregates(self) -> SurveyAggregates:
+        """
+        Counts, sums and cross-products over every row, as stored alongside
+        them (see sync_segments), so no table scan is needed.
+        """
+        with self._lock:
+            return _load_aggregates(self._conn)
+
+    def close(self):
+        self._conn.close()
+
+
+def open_sqlite_store(csv_path=DEFAULT_CSV, db_path=DB_PATH, ingest_dir=INGEST_DIR) -> SqliteStore:
+    """
+    Open the database for csv_path, (re)building it first when it is missing
+    or older than the CSV, and inserting any newly ingested batches.
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(db_path.with_name(LOCK_NAME)):
+        if not is_store_current(csv_path, db_path):
+            build_sqlite_store(csv_path, db_path)
+        sync_segments(db_path, ingest_dir)
+    return SqliteStore(db_path)
+
+
+# -------------------------------------------------------------------
+# BENCHMARK
+# -------------------------------------------------------------------
+def _pandas_tab_aggregates(df: pd.DataFrame):
+    # what the tabs computed per rerun before the shared aggregates existed
+    for col in ["Gender", "Current_Level_of_Studies", "Field_of_Study", "Type_of_Institution", "Age"]:
+        df[col].value_counts()
+    pd.crosstab(df["Gender"], df["Depressed_Anxious"])
+    df.groupby(["Academic_Engagement", "Depressed_Anxious"]).size()
+    df.groupby(["Sleep_Hours_Per_Night", "Depressed_Anxious"]).size()
+    df.loc[df["Field_of_Study"] == 4, "Gender"].value_counts()
+    df.corr()
+
+
+def _group_counts(store: SqliteStore, columns, filters=None):
+    # the same counts as GROUP BY queries on the indexed table
+    cols = ", ".join(f'"{c}"' for c in columns)
+    where, params = _where(filters)
+    return store._query(f"SELECT {cols}, COUNT(*) FROM {TABLE}{where} GROUP BY {cols}", params)
+
+
+def _sqlite_tab_aggregates(store: SqliteStore):
+    for col in ["Gender", "Current_Level_of_Studies", "Field_of_Study", "Type_of_Institution", "Age"]:
+        _group_counts(store, [col])
+    _group_counts(store, ["Gender", "Depressed_Anxious"])
+    _group_counts(store, ["Academic_Engagement", "Depressed_Anxious"])
+    _group_counts(store, ["Sleep_Hours_Per_Night", "Depressed_Anxious"])
+    _group_counts(store, ["Gender"], {"Field_of_Study": [4]})
+    store.aggregates().corr()
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def benchmark(sizes, csv_path=DEFAULT_CSV, seed=0):
+    """
+    Resample the real survey to each size and time the tab aggregations:
+    pandas on an in-memory frame vs GROUP BY queries on a fresh database.
+    """
+    survey = read_survey_csv(csv_path)
+    rng = np.random.default_rng(seed)
+    print(f"{'rows':>12} {'pandas s':>10} {'frame MB':>9} {'sqlite build s':>15} {'sqlite s':>9} {'db MB':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            idx = rng.integers(0, len(survey["Age"]), size=n)
+            arrays = {col: survey[col][idx] for col in SURVEY_COLUMNS}
+
+            df = pd.DataFrame(arrays)
+            pandas_s, _ = _timed(_pandas_tab_aggregates, df)
+            frame_mb = df.memory_usage(deep=True).sum() / 1e6
+            del df
+
+            db_path = Path(tmp) / f"bench-{n}.sqlite"
+            chunks = (
+                {col: values[start:start + CHUNK_ROWS] for col, values in arrays.items()}
+                for start in range(0, n, CHUNK_ROWS)
+            )
+            build_s, _ = _timed(_write_database, db_path, chunks)
+            store = SqliteStore(db_path)
+            sqlite_s, _ = _timed(_sqlite_tab_aggregates, store)
+            store.close()
+            db_mb = db_path.stat().st_size / 1e6
+
+            print(f"{n:>12,} {pandas_s:>10.3f} {frame_mb:>9.1f} {build_s:>15.2f} {sqlite_s:>9.3f} {db_mb:>8.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the SQLite survey database.")
+    parser.add_argument("--csv", default=str(DEFAULT_CSV), help="cleaned survey CSV")
+    parser.add_argument("--db", default=str(DB_PATH), help="database file to write")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="rows per CSV chunk")
+    parser.add_argument("--benchmark", type=int, nargs="+", metavar="ROWS",
+                        help="compare against pandas on resampled cohorts of these sizes")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark, args.csv)
+        return
+
+    db_path = build_sqlite_store(args.csv, args.db, args.chunksize)
+    sync_segments(db_path)
+    store = SqliteStore(db_path)
+    print(f"Wrote {store.rows} rows x {len(SURVEY_COLUMNS)} columns to {db_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# versioning.py
+# Hot reload of the shared dataset without restarting the server.
+#
+# Every rerun does a cheap stat check (data_version). When the token moves, the
+# new version is built on a background thread while sessions keep reading the
+# current one; the finished build is swapped in with a single assignment and
+# the old version is dropped, so at most two versions are ever alive.
+
+import logging
+import threading
+
+from components.fileio import file_stamp
+
+
+logger = logging.getLogger(__name__)
+
+
+def data_version(csv_path, log_version=None):
+    """
+    Token for the data a session sees: size + mtime of the base CSV plus the
+    ingest log token. Any replaced CSV or appended batch changes it.
+    """
+    stamp = file_stamp(csv_path)
+    return (stamp["size"], stamp["mtime_ns"], log_version)
+
+
+class HotReloader:
+    """
+    Holds the current build of a versioned resource.
+
+    get() never blocks once a first version exists: a new token starts a
+    background build (one at a time) and the caller gets the current build
+    until the new one is ready. A build that raises keeps the old version
+    and is not retried for the same token.
+    """
+
+    def __init__(self, build, name="dataset", on_swap=None):
+        # build(version, previous) -> value; previous is the current value (or
+        # None) so unchanged parts can be reused instead of re-read;
+        # on_swap(version, value) runs once a reloaded version has replaced the old one
+        self._build = build
+        self._name = name
+        self._on_swap = on_swap
+        self._lock = threading.Lock()
+        self._current = None  # (version, value), replaced as a whole
+        self._pending = None
+        self._failed = None
+        self._thread = None
+
+    @property
+    def version(self):
+        current = self._current
+        return current[0] if current else None
+
+    @property
+    def reloading(self) -> bool:
+        return self._pending is not None
+
+    def get(self, version):
+        current = self._current
+        if current is None:
+            # nothing to serve yet: the very first build runs in the caller
+            with self._lock:
+                if self._current is None:
+                    self._current = (version, self._build(version, None))
+                return self._current[1]
+
+        if current[0] != version:
+            self._start_reload(version)
+        return current[1]
+
+    def _start_reload(self, version):
+        with self._lock:
+            if self._pending is not None or version in (self._failed, self.version):
+                return
+            self._pending = version
+            self._thread = threading.Thread(
+                target=self._reload, args=(version,), name=f"{self._name}-reload", daemon=True
+            )
+            self._thread.start()
+
+    def _reload(self, version):
+        try:
+            value = self._build(version, self._current[1])
+        except Exception:
+            logger.exception("Reloading %s for version %s failed; keeping %s",
+                             self._name, version, self.version)
+            with self._lock:
+                self._failed = version
+                self._pending = None
+            return
+        with self._lock:
+            # one assignment: readers see either the old or the new version, never a mix
+            self._current = (version, value)
+            self._pending = None
+            self._failed = None
+        logger.info("Reloaded %s at version %s", self._name, version)
+        if self._on_swap is not None:
+            self._on_swap(version, value)
+
+    def wait(self, timeout=None):
+        """Block until no reload is running (for the CLIs / scripts, not the app)."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
@@ -0,0 +1,128 @@
+# weighting.py
+# Survey weights: raking the respondents to target shares of gender, level of study and institution type.
+#
+# A respondent's weight depends only on their codes in RAKING_DIMS, so
+# iterative proportional fitting runs over the joint table of those codes
+# (a dozen cells) instead of over the rows, and converges in well under a
+# millisecond however many responses there are. The resulting weight per
+# combination is then applied wherever counts are summed: cube cells, cohort
+# cells, histograms, moments, or, for the few row-level computations, rows:
+#
+#     weights = SurveyWeights.from_cube(cube, {"Gender": [0.5, 0.5]})
+#     weights.cube(cube)                         # weight of each cube cell
+#     weights.cells(cohort.cells, FILTER_DIMS)   # weight of each cohort cell
+#     weights.rows(arrays)                       # weight of each response
+#
+# With a target on one dimension only, this is post-stratification: each
+# code's respondents are scaled to its share in one step. Weights are scaled so that the
+# weighted total equals the number of respondents, so weighted counts read
+# as "respondents, had the sample matched the targets".
+
+import numpy as np
+
+from components.schema import COLUMN_RANGES
+
+
+RAKING_DIMS = ["Gender", "Current_Level_of_Studies", "Type_of_Institution"]
+
+# sweeps over the margins before giving up, and how close (as a share of the total) counts as matched
+MAX_ITERATIONS = 200
+TOLERANCE = 1e-9
+
+
+def rake(counts, targets: dict, max_iterations=MAX_ITERATIONS, tolerance=TOLERANCE) -> np.ndarray:
+    """
+    Weight per cell of counts (respondents per combination of RAKING_DIMS
+    codes, one axis per dim) so that the weighted counts have the target
+    margins. targets maps a dim to its share per code (any scale; dims left
+    out are not constrained). Empty cells get weight 0. Raises ValueError for
+    a target on a code nobody has, or margins that cannot all be met.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    total = counts.sum()
+    margins = {}
+    for dim, shares in targets.items():
+        axis = RAKING_DIMS.index(dim)
+        shares = np.asarray(shares, dtype=np.float64)
+        if shares.shape != (counts.shape[axis],) or (shares < 0).any() or shares.sum() <= 0:
+            raise ValueError(f"Target shares for {dim} must be {counts.shape[axis]} non-negative numbers, not all 0")
+        observed = counts.sum(axis=tuple(i for i in range(counts.ndim) if i != axis))
+        if ((shares > 0) & (observed == 0)).any():
+            raise ValueError(f"A target share is set for a {dim} code no respondent has")
+        margins[axis] = shares / shares.sum() * total
+
+    fitted = counts.copy()
+    for _ in range(max_iterations):
+        for axis, target in margins.items():
+            others = tuple(i for i in range(counts.ndim) if i != axis)
+            current = fitted.sum(axis=others)
+            factor = np.divide(target, current, out=np.zeros_like(target), where=current > 0)
+            shape = [1] * counts.ndim
+            shape[axis] = -1
+            fitted *= factor.reshape(shape)
+        gap = max(
+            (np.abs(fitted.sum(axis=tuple(i for i in range(counts.ndim) if i != axis)) - target).max()
+             for axis, target in margins.items()),
+            default=0.0,
+        )
+        if gap <= tolerance * total:
+            break
+    else:
+        raise ValueError("The target shares cannot all be met by these respondents (raking did not converge)")
+    return np.divide(fitted, counts, out=np.zeros_like(fitted), where=counts > 0)
+
+
+def targets_key(targets: dict) -> tuple:
+    """Hashable form of targets, for caching results per weighting."""
+    return tuple(sorted((dim, tuple(float(s) for s in shares)) for dim, shares in targets.items()))
+
+
+class SurveyWeights:
+    """
+    Weight per combination of RAKING_DIMS codes (table, one axis per dim,
+    codes from each column's lowest), and the targets it was raked to.
+    """
+
+    def __init__(self, table: np.ndarray, targets: dict):
+        self.table = table
+        self.targets = targets
+        self.lows = np.array([COLUMN_RANGES[dim][0] for dim in RAKING_DIMS])
+
+    @classmethod
+    def from_cube(cls, cube, targets: dict) -> "SurveyWeights":
+        """Rake every respondent of cube (a CountCube) to targets, see rake()."""
+        axes = [cube._axis(dim) for dim in RAKING_DIMS]
+        others = tuple(i for i in range(cube.counts.ndim) if i not in axes)
+        counts = np.moveaxis(cube.counts.sum(axis=others, keepdims=True), axes, range(len(axes)))
+        counts = counts.reshape(counts.shape[: len(axes)])
+        return cls(rake(counts, targets), targets)
+
+    @property
+    def key(self) -> tuple:
+        return targets_key(self.targets)
+
+    def rows(self, arrays) -> np.ndarray:
+        """Weight of each response in arrays (column name -> codes)."""
+        index = tuple(np.asarray(arrays[dim]).astype(np.int64) - lo for dim, lo in zip(RAKING_DIMS, self.lows))
+        return self.table[index]
+
+    def cells(self, cells: np.ndarray, dims) -> np.ndarray:
+        """Weight of each cell of a (cells, len(dims)) code matrix, e.g. CohortStats.cells."""
+        return self.rows({dim: cells[:, list(dims).index(dim)] for dim in RAKING_DIMS})
+
+    def cube(self, cube) -> np.ndarray:
+        """Weights broadcastable against cube.counts (1 along the axes not raked on)."""
+        shape = [1] * cube.counts.ndim
+        axes = [cube._axis(dim) for dim in RAKING_DIMS]
+        for axis in axes:
+            shape[axis] = cube.counts.shape[axis]
+        order = np.argsort(axes)
+        return np.transpose(self.table, order).reshape(shape)
+
+
+def effective_n(weights, counts) -> float:
+    """Kish effective sample size of counts respondents with these weights: (Σ w n)² / Σ w² n."""
+    weights = np.asarray(weights, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.float64)
+    squares = (counts * weights**2).sum()
+    return float((counts * weights).sum() ** 2 / squares) if squares > 0 else 0.0
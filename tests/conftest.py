@@ -0,0 +1,64 @@
+# conftest.py
+# Shared fixtures: synthetic survey columns in the compact form the loaders produce.
+#
+#     python -m pytest tests
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from components import bootstrap  # noqa: E402
+from components.schema import COLUMN_RANGES, FLOAT_COLUMNS, SURVEY_COLUMNS, column_dtype  # noqa: E402
+
+
+def make_survey(rows: int, seed=0) -> dict:
+    """
+    Random survey columns (column name -> read-only compact array) within
+    COLUMN_RANGES. The wellness level leans on workload, sleep and social
+    support so that correlations and rankings are not all noise.
+    """
+    rng = np.random.default_rng(seed)
+    arrays = {}
+    for col in SURVEY_COLUMNS:
+        lo, hi = COLUMN_RANGES[col]
+        if col == "Age":
+            values = rng.integers(17, 31, rows)
+        elif col == "Study_Hours_Per_Week":
+            values = rng.integers(0, 60, rows)
+        elif col in FLOAT_COLUMNS:
+            values = rng.integers(8, 20, rows) / 2
+        else:
+            values = rng.integers(lo, hi + 1, rows)
+        arrays[col] = values
+    risk = (
+        arrays["Academic_Workload"] - arrays["Social_Support"] - arrays["Sleep_Hours_Per_Night"] / 3
+        + rng.normal(0, 1.5, rows)
+    )
+    arrays["Depressed_Anxious"] = np.digitize(risk, np.quantile(risk, [0.4, 0.75])) + 1
+    for col in SURVEY_COLUMNS:
+        arrays[col] = arrays[col].astype(column_dtype(col))
+        arrays[col].flags.writeable = False
+    return arrays
+
+
+@pytest.fixture(scope="session")
+def survey() -> dict:
+    return make_survey(3000)
+
+
+@pytest.fixture
+def serial_bootstrap(monkeypatch):
+    # bootstrap in this process: the same results as the pool (seeded per table), without spawning workers
+    monkeypatch.setattr(bootstrap, "WORKERS", 1)
+
+
+@pytest.fixture(scope="session")
+def dashboard(survey):
+    from components.aggregates import SurveyAggregates
+    from components.dashboard import compute_dashboard
+
+    return compute_dashboard(survey, SurveyAggregates.from_arrays(survey), {})
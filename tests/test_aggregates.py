@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from components.aggregates import Moments
+from components.schema import SURVEY_COLUMNS
+
+
+def residual_corr(frame: pd.DataFrame, a: str, b: str, held) -> float:
+    # partial correlation by definition: correlate what is left of a and b after regressing out the held columns
+    design = np.column_stack([np.ones(len(frame))] + [frame[col].to_numpy(float) for col in held])
+    residuals = [
+        frame[col].to_numpy(float) - design @ np.linalg.lstsq(design, frame[col].to_numpy(float), rcond=None)[0]
+        for col in (a, b)
+    ]
+    return np.corrcoef(*residuals)[0, 1]
+
+
+def test_merged_batches_give_the_pandas_correlations(survey):
+    moments = Moments.from_arrays({col: values[:1000] for col, values in survey.items()})
+    moments.merge(Moments.from_arrays({col: values[1000:] for col, values in survey.items()}))
+    frame = pd.DataFrame(survey)
+    pd.testing.assert_frame_equal(moments.corr(), frame.corr(), check_exact=False, atol=1e-9)
+    columns = ["Sleep_Hours_Per_Night", "Social_Support"]
+    np.testing.assert_allclose(
+        moments.corrwith(columns, "Depressed_Anxious"), frame[columns].corrwith(frame["Depressed_Anxious"]), atol=1e-9
+    )
+
+
+def test_partial_corr_holds_every_other_column_fixed(survey):
+    frame = pd.DataFrame(survey)
+    partial = Moments.from_arrays(survey).partial_corr()
+    for a, b in [("Sleep_Hours_Per_Night", "Depressed_Anxious"), ("Academic_Workload", "Coursework_Pressure")]:
+        held = [col for col in SURVEY_COLUMNS if col not in (a, b)]
+        np.testing.assert_allclose(partial.loc[a, b], residual_corr(frame, a, b, held), atol=1e-9)
+        np.testing.assert_allclose(partial.loc[b, a], partial.loc[a, b])
+
+
+def test_partial_corr_of_a_subset_only_holds_that_subset_fixed(survey):
+    frame = pd.DataFrame(survey)
+    columns = ["Academic_Workload", "Social_Support", "Sleep_Hours_Per_Night", "Depressed_Anxious"]
+    moments = Moments.from_arrays(survey)
+    subset = moments.partial_corr(columns)
+    held = ["Academic_Workload", "Sleep_Hours_Per_Night"]
+    expected = residual_corr(frame, "Social_Support", "Depressed_Anxious", held)
+    np.testing.assert_allclose(subset.loc["Social_Support", "Depressed_Anxious"], expected, atol=1e-9)
+    np.testing.assert_allclose(
+        moments.partial_corrwith(columns[:-1], "Depressed_Anxious"), subset["Depressed_Anxious"].iloc[:-1]
+    )
+
+
+def test_columns_that_do_not_vary_get_nan(survey):
+    arrays = dict(survey, Gender=np.ones_like(survey["Gender"]))
+    moments = Moments.from_arrays(arrays)
+    assert moments.corr()["Gender"].isna().all()
+    partial = moments.partial_corr()
+    assert partial["Gender"].isna().all()
+    assert not partial.drop(index="Gender", columns="Gender").isna().any().any()
+
+
+def test_a_column_constant_in_a_cohort_is_not_rounding_noise(survey):
+    # a cohort summed from smaller groups: its constant column's cross-products with
+    # the others do not cancel exactly in cross - n * mean^2
+    rows = (survey["Type_of_Institution"] == 1) & np.isin(survey["Age"], range(18, 22))
+    frame = pd.DataFrame({col: values[rows] for col, values in survey.items()})
+    moments = Moments()
+    for _, group in frame.groupby("Age"):
+        moments.merge(Moments.from_arrays({col: group[col].to_numpy() for col in SURVEY_COLUMNS}))
+    corr = moments.corr()
+    assert corr["Type_of_Institution"].isna().all()
+    pd.testing.assert_frame_equal(corr, frame.corr(), check_exact=False, atol=1e-9)
+    assert moments.partial_corr()["Type_of_Institution"].isna().all()
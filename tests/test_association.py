@@ -0,0 +1,128 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.association import MEASURES, PairTables, association
+from components.cohort import CohortStats
+from components.dashboard import HISTOGRAMS, PAIR_COLUMNS
+from components.dataset import SurveySnapshot
+from components.schema import SURVEY_COLUMNS
+
+COLUMNS = ["Academic_Workload", "Sleep_Hours_Per_Night", "Study_Hours_Per_Week", "Gender", "Depressed_Anxious"]
+
+
+def _matrix(arrays, measure, columns=COLUMNS):
+    return PairTables.from_arrays(arrays, SURVEY_COLUMNS).matrix(measure, columns)
+
+
+@pytest.mark.parametrize("measure", ["pearson", "spearman", "kendall"])
+def test_rank_measures_match_pandas(survey, measure):
+    pytest.importorskip("scipy")  # pandas' Kendall τ-b
+    frame = pd.DataFrame({col: survey[col].astype(np.float64) for col in COLUMNS})
+    expected = frame.corr(method=measure)
+    np.testing.assert_allclose(_matrix(survey, measure).to_numpy(), expected.to_numpy(), atol=1e-9)
+
+
+def test_cramers_v_matches_chi_square(survey):
+    stats = pytest.importorskip("scipy.stats")
+    table = pd.crosstab(survey["Field_of_Study"], survey["Depressed_Anxious"]).to_numpy()
+    chi2 = stats.chi2_contingency(table, correction=False).statistic
+    expected = np.sqrt(chi2 / (table.sum() * (min(table.shape) - 1)))
+    tables = PairTables.from_arrays(survey, SURVEY_COLUMNS)
+    assert tables.measure("cramers_v", "Field_of_Study", "Depressed_Anxious") == pytest.approx(expected)
+
+
+def test_mutual_information_of_a_copy_is_one_and_of_independent_columns_near_zero():
+    rng = np.random.default_rng(3)
+    x = rng.integers(1, 6, 20000)
+    assert association("mutual_info", range(5), range(5), np.eye(5) * 100) == pytest.approx(1)
+    independent = np.histogram2d(x, rng.integers(1, 6, 20000), bins=5)[0]
+    assert association("mutual_info", range(5), range(5), independent) < 0.01
+
+
+def test_unknown_measure_is_rejected():
+    with pytest.raises(ValueError):
+        association("gamma", [1, 2], [1, 2], np.ones((2, 2)))
+
+
+def _rows(arrays, filters):
+    mask = np.ones(len(arrays["Age"]), dtype=bool)
+    for col, codes in filters.items():
+        mask &= np.isin(arrays[col], list(codes))
+    return {col: arrays[col][mask] for col in SURVEY_COLUMNS}
+
+
+@pytest.mark.parametrize(
+    "filters, targets",
+    [
+        ({}, None),
+        ({"Gender": [1], "Age": range(18, 24)}, None),
+        ({"Field_of_Study": [2, 3]}, {"Gender": [1, 3]}),
+    ],
+)
+def test_cohort_tables_summed_from_cells_match_the_rows(dashboard, survey, filters, targets):
+    weights = None if targets is None else dashboard.weights(targets)
+    tables = dashboard.view(filters, weights).associations()
+    rows = _rows(survey, filters)
+    expected = PairTables.from_arrays(rows, SURVEY_COLUMNS, None if weights is None else weights.rows(rows))
+    assert tables.n == expected.n
+    for measure in MEASURES:
+        np.testing.assert_allclose(
+            tables.matrix(measure, SURVEY_COLUMNS).to_numpy(),
+            expected.matrix(measure, SURVEY_COLUMNS).to_numpy(),
+            rtol=1e-9,
+            atol=1e-12,
+        )
+
+
+def test_merged_batches_match_one_pass(survey):
+    def batches(size):
+        return [{col: values[i:i + size] for col, values in survey.items()} for i in range(0, len(survey["Age"]), size)]
+
+    tables = PairTables.from_arrays(survey, SURVEY_COLUMNS)
+    merged = batches(700)
+    pairs = PairTables.from_arrays(merged[0], SURVEY_COLUMNS)
+    for batch in merged[1:]:
+        pairs.merge(PairTables.from_arrays(batch, SURVEY_COLUMNS))
+    for measure in MEASURES:
+        np.testing.assert_allclose(pairs.matrix(measure, COLUMNS), tables.matrix(measure, COLUMNS))
+
+    cohort = CohortStats.from_arrays(survey, HISTOGRAMS, PAIR_COLUMNS)
+    parts = [CohortStats.from_arrays(batch, HISTOGRAMS, PAIR_COLUMNS) for batch in batches(1100)]
+    for part in parts[1:]:
+        parts[0].merge(part)
+    assert parts[0].arrays.keys() == cohort.arrays.keys()
+    for key, values in cohort.arrays.items():
+        np.testing.assert_array_equal(parts[0].arrays[key], values, err_msg=key)
+
+
+def test_row_counted_cohort_is_built_once_without_the_snapshot_lock(monkeypatch):
+    snapshot = SurveySnapshot(("test",))
+    snapshot.source
+    started, release, builds = threading.Event(), threading.Event(), []
+    count = PairTables.from_arrays
+
+    def slow_count(arrays, columns, weights=None):
+        builds.append(len(arrays["Age"]))
+        started.set()
+        release.wait(5)
+        return count(arrays, columns, weights)
+
+    monkeypatch.setattr(PairTables, "from_arrays", staticmethod(slow_count))
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(snapshot.associations({"Social_Support": [5]})))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    # other sessions can still open the dashboard / aggregates while the cohort is counted
+    assert snapshot._lock.acquire(timeout=1)
+    snapshot._lock.release()
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(builds) == 1 and len(results) == 4 and all(r is results[0] for r in results)
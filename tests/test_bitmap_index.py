@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.bitmap_index import BitmapIndex
+
+FILTERS = [{}, {"Gender": [1]}, {"Field_of_Study": [2, 5], "Age": list(range(20, 26)), "Recent_Suicidal_Thoughts": [2]}]
+
+
+@pytest.fixture(scope="module")
+def frame(survey):
+    return pd.DataFrame(survey)
+
+
+@pytest.fixture(scope="module")
+def index(survey):
+    return BitmapIndex.from_arrays(survey)
+
+
+def matching(frame, filters):
+    mask = np.ones(len(frame), dtype=bool)
+    for col, codes in filters.items():
+        mask &= frame[col].isin(codes).to_numpy()
+    return mask
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_select_matches_a_pandas_mask(index, frame, filters):
+    bits = index.select(filters)
+    expected = matching(frame, filters)
+    np.testing.assert_array_equal(index.mask(bits), expected)
+    assert index.count(bits) == expected.sum()
+    assert index.count(index.not_(bits)) == len(frame) - expected.sum()
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_counts_by_matches_value_counts(index, frame, filters):
+    expected = frame.loc[matching(frame, filters), "Academic_Workload"].value_counts()
+    assert index.counts_by("Academic_Workload", index.select(filters)) == expected.to_dict()
+
+
+def test_between_is_inclusive(index, frame):
+    expected = frame["Financial_Stress"].between(4, 5).to_numpy()
+    np.testing.assert_array_equal(index.mask(index.between("Financial_Stress", 4, 5)), expected)
+
+
+@pytest.mark.parametrize("split", [1, 63, 64, 1000])
+def test_appended_batches_equal_one_build(survey, index, split):
+    # batches that end inside a 64-bit word continue it
+    appended = BitmapIndex.from_arrays({col: values[:split] for col, values in survey.items()})
+    appended.update({col: values[split:] for col, values in survey.items()})
+    assert appended.rows == index.rows
+    for col, codes in index.bitsets.items():
+        for code, bits in codes.items():
+            np.testing.assert_array_equal(appended.bitsets[col][code], bits)
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components import bootstrap
+from components.bootstrap import bootstrap_corr, bootstrap_corrs, flag_ties, percentile_interval
+
+
+def table(x_codes, y_codes):
+    x, x_index = np.unique(x_codes, return_inverse=True)
+    y, y_index = np.unique(y_codes, return_inverse=True)
+    counts = np.zeros((len(x), len(y)), dtype=np.int64)
+    np.add.at(counts, (x_index, y_index), 1)
+    return x, y, counts
+
+
+def test_count_resamples_have_the_distribution_of_row_resamples(survey):
+    x_codes, y_codes = survey["Sleep_Hours_Per_Night"].astype(float), survey["Depressed_Anxious"].astype(float)
+    replicates = bootstrap_corr(*table(x_codes, y_codes), resamples=2000, seed=1)
+    rng = np.random.default_rng(2)
+    rows = np.array([np.corrcoef(x_codes[i], y_codes[i])[0, 1] for i in rng.integers(0, len(x_codes), (2000, 3000))])
+    assert replicates.mean() == pytest.approx(rows.mean(), abs=0.003)
+    assert replicates.std() == pytest.approx(rows.std(), rel=0.1)
+    np.testing.assert_allclose(percentile_interval(replicates), percentile_interval(rows), atol=0.005)
+
+
+def test_replicates_are_seeded(survey):
+    args = table(survey["Social_Support"], survey["Depressed_Anxious"])
+    first, again, other = (bootstrap_corr(*args, resamples=700, seed=seed) for seed in (3, 3, 4))
+    np.testing.assert_array_equal(first, again)
+    assert not np.array_equal(first, other)
+
+
+def test_pool_and_serial_runs_agree(survey, monkeypatch):
+    tables = {col: table(survey[col], survey["Depressed_Anxious"]) for col in ("Social_Support", "Academic_Workload")}
+    monkeypatch.setattr(bootstrap, "WORKERS", 2)
+    pooled = bootstrap_corrs(tables, resamples=300)
+    monkeypatch.setattr(bootstrap, "WORKERS", 1)
+    serial = bootstrap_corrs(tables, resamples=300)
+    for name in tables:
+        np.testing.assert_array_equal(pooled[name], serial[name])
+
+
+def test_interval_ignores_resamples_without_spread():
+    replicates = np.array([np.nan, 0.1, 0.2, 0.3, 0.4, np.nan])
+    np.testing.assert_allclose(percentile_interval(replicates, 0.5), np.percentile([0.1, 0.2, 0.3, 0.4], [25, 75]))
+    assert np.isnan(percentile_interval(np.full(5, np.nan))).all()
+    # one value everywhere: every resample lacks spread
+    assert np.isnan(bootstrap_corr([1, 2], [1, 2, 3], [[0, 40, 0], [0, 0, 0]], resamples=10)).all()
+
+
+def test_ties_mark_both_sides_of_an_overlap():
+    ranked = pd.DataFrame({"low": [0.5, 0.3, 0.1, 0.0], "high": [0.7, 0.55, 0.25, 0.05]}, index=list("abcd"))
+    assert flag_ties(ranked).tolist() == [True, True, False, False]
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.cohort import FILTER_DIMS, CohortStats
+from components.schema import SURVEY_COLUMNS
+
+HISTOGRAMS = {"sleep": ["Sleep_Hours_Per_Night"], "stress_3d": ["Coursework_Pressure", "Academic_Workload"]}
+FILTERS = [{}, {"Gender": [2]}, {"Type_of_Institution": [1], "Age": list(range(18, 22))}, {"Age": [80]}]
+
+
+@pytest.fixture(scope="module")
+def frame(survey):
+    return pd.DataFrame(survey)
+
+
+@pytest.fixture(scope="module")
+def stats(survey):
+    return CohortStats.from_arrays(survey, HISTOGRAMS)
+
+
+def select(frame, filters):
+    for col, codes in filters.items():
+        frame = frame[frame[col].isin(codes)]
+    return frame
+
+
+def test_cells_are_the_occupied_filter_combinations(stats, frame):
+    expected = frame.groupby(FILTER_DIMS).size()
+    np.testing.assert_array_equal(stats.cells, np.array(expected.index.tolist()))
+    np.testing.assert_array_equal(stats.arrays["n"], expected)
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_cohort_moments_and_histograms_match_pandas(stats, frame, filters):
+    rows = select(frame, filters)
+    cells = stats.select(filters)
+    assert stats.count(cells) == len(rows)
+    if len(rows) > 1:
+        pd.testing.assert_frame_equal(stats.moments(cells).corr(), rows.corr(), check_exact=False, atol=1e-9)
+    (hours,) = stats.axes("sleep")
+    expected = pd.crosstab(rows["Sleep_Hours_Per_Night"], rows["Depressed_Anxious"]).reindex(
+        index=hours, columns=[1, 2, 3], fill_value=0
+    )
+    np.testing.assert_array_equal(stats.histogram("sleep", cells), expected)
+    pressure, workload = stats.axes("stress_3d")
+    expected = rows.groupby(["Coursework_Pressure", "Academic_Workload", "Depressed_Anxious"]).size()
+    histogram = stats.histogram("stress_3d", cells)
+    for (p, w, level), count in expected.items():
+        assert histogram[np.searchsorted(pressure, p), np.searchsorted(workload, w), level - 1] == count
+    assert histogram.sum() == len(rows)
+
+
+def test_weighted_moments_give_the_weighted_correlation(stats, frame):
+    cell_weights = np.linspace(0.2, 3.0, len(stats.cells))
+    codes = frame.groupby(FILTER_DIMS).ngroup().to_numpy()  # same sorted cell order
+    cov = np.cov(frame[SURVEY_COLUMNS].to_numpy(float).T, aweights=cell_weights[codes])
+    std = np.sqrt(np.diag(cov))
+    np.testing.assert_allclose(stats.moments(stats.select(), cell_weights).corr(), cov / np.outer(std, std), atol=1e-9)
+
+
+def test_merged_batches_equal_one_pass(survey, stats):
+    # the second batch brings cells and sleep values the first has not seen
+    order = np.argsort(survey["Sleep_Hours_Per_Night"], kind="stable")
+    first = {col: values[order[:1000]] for col, values in survey.items()}
+    second = {col: values[order[1000:]] for col, values in survey.items()}
+    merged = CohortStats.from_arrays(first, HISTOGRAMS).merge(CohortStats.from_arrays(second, HISTOGRAMS))
+    assert merged.arrays.keys() == stats.arrays.keys()
+    for key, values in stats.arrays.items():
+        np.testing.assert_allclose(merged.arrays[key], values, err_msg=key)
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.cube import CountCube
+
+FILTERS = [{}, {"Gender": [2]}, {"Field_of_Study": [1, 3], "Age": list(range(18, 23))}]
+
+
+@pytest.fixture(scope="module")
+def frame(survey):
+    return pd.DataFrame(survey)
+
+
+@pytest.fixture(scope="module")
+def cube(survey):
+    return CountCube.from_arrays(survey)
+
+
+def select(frame, filters):
+    for col, codes in filters.items():
+        frame = frame[frame[col].isin(codes)]
+    return frame
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+@pytest.mark.parametrize("col", ["Age", "Gender", "Field_of_Study", "Depressed_Anxious"])
+def test_value_counts_match_pandas(cube, frame, filters, col):
+    expected = select(frame, filters)[col].value_counts().sort_index()
+    actual = cube.where(filters).value_counts(col)
+    np.testing.assert_array_equal(actual.index, expected.index)
+    np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_crosstab_matches_pandas(cube, frame, filters):
+    rows = select(frame, filters)
+    expected = pd.crosstab(rows["Depressed_Anxious"], rows["Current_Level_of_Studies"])
+    actual = cube.where(filters).crosstab("Depressed_Anxious", "Current_Level_of_Studies")
+    np.testing.assert_array_equal(actual, expected)
+    np.testing.assert_array_equal(actual.index, expected.index)
+    np.testing.assert_array_equal(actual.columns, expected.columns)
+
+
+def test_merged_batches_equal_one_pass(survey, cube):
+    merged = CountCube.from_arrays({col: values[:1234] for col, values in survey.items()})
+    merged.merge(CountCube.from_arrays({col: values[1234:] for col, values in survey.items()}))
+    np.testing.assert_array_equal(merged.counts, cube.counts)
+    assert merged.n == len(survey["Age"])
+
+
+def test_weighted_counts_are_rounded_weight_sums(survey, cube, frame):
+    # one weight per gender, broadcast over the gender axis
+    weights = np.array([0.5, 1.75]).reshape(1, 2, 1, 1, 1, 1)
+    expected = frame.assign(weight=np.where(frame["Gender"] == 1, 0.5, 1.75)).groupby("Field_of_Study")["weight"].sum()
+    actual = cube.weighted(weights).value_counts("Field_of_Study")
+    np.testing.assert_array_equal(actual, np.rint(expected).astype(np.int64))
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.aggregates import SurveyAggregates
+from components.dashboard import compute_dashboard, compute_dashboard_chunks, source_meta, update_snapshot
+from components.ingest import append_batch
+from components.schema import SURVEY_COLUMNS, read_survey_csv
+
+from conftest import make_survey
+
+
+@pytest.fixture
+def ingested(tmp_path):
+    # a base CSV, its dashboard as built before any ingest, and two batches appended afterwards
+    csv_path, ingest_dir = tmp_path / "survey.csv", tmp_path / "ingest"
+    pd.DataFrame(make_survey(2000, seed=1)).to_csv(csv_path, index=False)
+    base = read_survey_csv(csv_path)
+    snapshot = compute_dashboard(base, SurveyAggregates.from_arrays(base), source_meta(csv_path, ingest_dir))
+    batches = [pd.DataFrame(make_survey(rows, seed=rows)) for rows in (300, 45)]
+    for batch in batches:
+        append_batch(batch, csv_path, ingest_dir)
+    everything = read_survey_csv(csv_path)
+    parts = [everything] + [{col: batch[col].to_numpy() for col in SURVEY_COLUMNS} for batch in batches]
+    rows = {col: np.concatenate([part[col] for part in parts]).astype(everything[col].dtype) for col in SURVEY_COLUMNS}
+    return csv_path, ingest_dir, snapshot, rows
+
+
+def assert_same_dashboard(actual, expected):
+    assert actual.arrays.keys() == expected.arrays.keys()
+    for key, values in expected.arrays.items():
+        np.testing.assert_array_equal(actual.arrays[key], values, err_msg=key)
+    for name in ("n", "sums", "cross", "counts"):
+        np.testing.assert_allclose(getattr(actual.aggregates, name), getattr(expected.aggregates, name))
+
+
+def test_ingested_batches_are_folded_in_like_a_full_rebuild(ingested):
+    csv_path, ingest_dir, snapshot, rows = ingested
+    before = {key: values.copy() for key, values in snapshot.arrays.items()}
+
+    updated = update_snapshot(snapshot, csv_path, ingest_dir)
+    assert updated.meta["segments"] == 2
+    assert_same_dashboard(updated, compute_dashboard(rows, SurveyAggregates.from_arrays(rows), {}))
+    # the previous version keeps serving its sessions unchanged
+    for key, values in before.items():
+        np.testing.assert_array_equal(snapshot.arrays[key], values)
+    assert update_snapshot(updated, csv_path, ingest_dir) is updated
+
+
+def test_snapshot_of_another_base_csv_is_not_updated(ingested):
+    csv_path, ingest_dir, snapshot, _ = ingested
+    pd.DataFrame(make_survey(10, seed=9)).to_csv(csv_path, index=False)
+    assert update_snapshot(snapshot, csv_path, ingest_dir) is None
+
+
+def test_chunked_build_matches_one_pass(survey):
+    aggregates = SurveyAggregates.from_arrays(survey)
+    chunks = ({col: values[i:i + 777] for col, values in survey.items()} for i in range(0, len(survey["Age"]), 777))
+    assert_same_dashboard(compute_dashboard_chunks(chunks, aggregates, {}), compute_dashboard(survey, aggregates, {}))
+
+
+@pytest.mark.parametrize("max_rows", [10_000, 100])
+def test_stress_points_carry_the_count_of_each_point(dashboard, survey, max_rows):
+    frame = pd.DataFrame(survey)
+    filters = {"Gender": [1]}
+    frame = frame[frame["Gender"] == 1]
+    view = dashboard.view(filters)
+    columns = ["Coursework_Pressure", "Academic_Workload"]
+    for level in (1, 2, 3):
+        expected = frame[frame["Depressed_Anxious"] == level].groupby(columns).size()
+        points = view.points("stress_3d", level, max_rows=max_rows)
+        if len(frame) <= max_rows:
+            # one row per student, each knowing how many share its point
+            assert len(points) == expected.sum()
+            points = points.drop_duplicates()
+        assert len(points) == len(expected)
+        np.testing.assert_array_equal(points.set_index(columns)["count"].sort_index(), expected.sort_index())
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from components.density import bandwidth, binned_kde, density_curve, gaussian_kde_counts
+
+
+@pytest.fixture(scope="module")
+def hours(survey):
+    values, counts = np.unique(survey["Study_Hours_Per_Week"], return_counts=True)
+    return values, counts
+
+
+@pytest.mark.parametrize("bw_method", ["scott", "silverman", 0.3])
+def test_counts_kde_is_scipy_gaussian_kde(hours, bw_method):
+    values, counts = hours
+    grid = np.linspace(-5, 65, 141)
+    expected = stats.gaussian_kde(np.repeat(values, counts).astype(float), bw_method=bw_method)(grid)
+    np.testing.assert_allclose(gaussian_kde_counts(values, counts, grid, bw_method), expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("grid", [np.linspace(-5, 65, 701), np.linspace(10, 40, 301)])
+def test_binned_kde_is_close_to_scipy(hours, grid):
+    # the second grid leaves values outside it, whose tails must still be counted
+    values, counts = hours
+    expected = stats.gaussian_kde(np.repeat(values, counts).astype(float))(grid)
+    np.testing.assert_allclose(binned_kde(values, counts, grid), expected, atol=1e-3 * expected.max())
+
+
+def test_binned_kde_needs_an_even_grid(hours):
+    with pytest.raises(ValueError, match="evenly spaced"):
+        binned_kde(*hours, np.array([0.0, 1.0, 3.0]))
+
+
+def test_density_curve_picks_by_size(hours):
+    values, counts = hours
+    small, large = np.linspace(0, 60, 50), np.linspace(0, 60, 4001)
+    np.testing.assert_array_equal(density_curve(values, counts, small), gaussian_kde_counts(values, counts, small))
+    np.testing.assert_array_equal(density_curve(values, counts, large), binned_kde(values, counts, large))
+
+
+def test_no_curve_without_spread():
+    assert bandwidth(np.array([3.0]), np.array([1])) is None
+    assert gaussian_kde_counts([4.0], [250], np.linspace(0, 5, 11)) is None
+    assert binned_kde([4.0, 5.0], [0, 0], np.linspace(0, 5, 11)) is None
+    with pytest.raises(ValueError, match="bw_method"):
+        bandwidth(np.array([1.0, 2.0]), np.array([3, 4]), "wide")
@@ -0,0 +1,66 @@
+import threading
+
+from components import figure_cache as figures
+from components.figure_cache import cached_figure, figure_cache, retain_version
+from components.versioning import HotReloader
+
+
+def test_figures_are_keyed_on_the_views_own_data_version(dashboard, monkeypatch):
+    monkeypatch.setattr(figures, "_live_version", None)
+    figure_cache().clear()
+    view = dashboard.view({"Gender": [1]})
+    builds = []
+
+    def build():
+        builds.append(view.version)
+        return object()
+
+    old, new = ("v1",), ("v2",)
+    view.version = old
+    first = cached_figure("age", view, build)
+    assert cached_figure("age", view, build) is first
+    view.version = new
+    assert cached_figure("age", view, build) is not first
+    assert cached_figure("age", view, build, options=("kendall",)) is not first
+    assert builds == [old, new, new]
+
+    retain_version(new)
+    assert len(figure_cache()) == 2
+    # a rerun still on the replaced version gets its figure, but it is not kept
+    view.version = old
+    cached_figure("age", view, build)
+    assert builds[-1] == old and len(figure_cache()) == 2
+
+
+def test_reloader_swaps_in_the_new_version_and_reports_it():
+    swaps, release = [], threading.Event()
+
+    def build(version, previous):
+        if previous is not None:
+            release.wait(5)
+        return {"version": version, "previous": previous}
+
+    reloader = HotReloader(build, name="test", on_swap=lambda version, value: swaps.append(version))
+    first = reloader.get(1)
+    assert first["version"] == 1 and swaps == []
+    # a new token starts a background build; the current version is served meanwhile
+    assert reloader.get(2) is first
+    assert reloader.reloading
+    release.set()
+    reloader.wait(5)
+    current = reloader.get(2)
+    assert current["version"] == 2 and current["previous"] is first
+    assert swaps == [2]
+
+
+def test_failed_reload_keeps_the_old_version():
+    def build(version, previous):
+        if version == 2:
+            raise RuntimeError("bad batch")
+        return version
+
+    reloader = HotReloader(build, name="test", on_swap=lambda version, value: None)
+    assert reloader.get(1) == 1
+    reloader.get(2)
+    reloader.wait(5)
+    assert reloader.get(2) == 1 and not reloader.reloading
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components import groupby
+from components.groupby import group_index, group_stats, row_counts
+
+BY = [
+    ["Academic_Engagement"],
+    ["Sleep_Hours_Per_Night", "Depressed_Anxious"],
+    ["Age", "Gender", "Field_of_Study", "Study_Hours_Per_Week"],
+]
+
+
+@pytest.fixture(scope="module")
+def arrays(survey):
+    # plus a float column off the half-hour grid, which is coded by sorting
+    jitter = np.random.default_rng(8).normal(0, 0.01, len(survey["Age"]))
+    return dict(survey, Sleep_Measured=(survey["Sleep_Hours_Per_Night"] + jitter).astype(np.float32))
+
+
+@pytest.fixture(params=[1 << 22, 16], ids=["dense", "sparse"])
+def dense_keys(request, monkeypatch):
+    # a small limit sends every grouping through the occupied-keys path
+    monkeypatch.setattr(groupby, "DENSE_KEYS", request.param)
+
+
+@pytest.mark.parametrize("by", BY + [["Sleep_Measured"]])
+@pytest.mark.parametrize("column", ["Depressed_Anxious", "Sleep_Hours_Per_Night", "Sleep_Measured"])
+def test_group_stats_match_pandas(arrays, by, column, dense_keys):
+    # in float64: pandas sums float32 columns in float32
+    frame = pd.DataFrame(arrays).assign(value=arrays[column].astype(np.float64))
+    expected = frame.groupby(by)["value"].agg(["count", "sum", "mean", "var"])
+    actual = group_stats(arrays, by, column)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_exact=False, rtol=1e-6)
+
+
+@pytest.mark.parametrize("by", BY)
+def test_counts_groups_and_row_counts_match_pandas(arrays, by, dense_keys):
+    frame = pd.DataFrame(arrays)
+    grouped = frame.groupby(by)
+    np.testing.assert_array_equal(group_stats(arrays, by)["count"], grouped.size())
+    groups, keys = group_index(arrays, by)
+    np.testing.assert_array_equal(groups, grouped.ngroup())
+    pd.testing.assert_frame_equal(keys, grouped.size().index.to_frame(index=False), check_dtype=False)
+    np.testing.assert_array_equal(row_counts(arrays, by), grouped[by[0]].transform("count"))
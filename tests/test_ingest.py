@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.ingest import append_batch, log_version, read_log, saved_aggregates, segment_paths
+from components.schema import read_survey_csv
+
+from conftest import make_survey
+
+
+@pytest.fixture
+def paths(tmp_path):
+    csv_path = tmp_path / "survey.csv"
+    pd.DataFrame(make_survey(1000, seed=2)).to_csv(csv_path, index=False)
+    return csv_path, tmp_path / "ingest"
+
+
+def test_running_aggregates_cover_the_base_and_every_batch(paths):
+    csv_path, ingest_dir = paths
+    batches = [pd.DataFrame(make_survey(rows, seed=rows)) for rows in (120, 7)]
+    assert log_version(ingest_dir) is None
+    for batch in batches:
+        before = log_version(ingest_dir)
+        result = append_batch(batch, csv_path, ingest_dir)
+        assert log_version(ingest_dir) != before
+    assert result == {"segment": "batch-000002.csv", "rows": 7, "total_rows": 1127}
+
+    everything = pd.concat([pd.read_csv(csv_path)] + batches, ignore_index=True)
+    aggregates = saved_aggregates(csv_path, ingest_dir)
+    assert aggregates.n == len(everything)
+    pd.testing.assert_frame_equal(aggregates.corr(), everything.corr(), check_exact=False, atol=1e-9)
+    segments = [read_survey_csv(path) for path in segment_paths(read_log(ingest_dir), ingest_dir)]
+    for batch, segment in zip(batches, segments):
+        np.testing.assert_array_equal(pd.DataFrame(segment), batch)
+
+
+def test_invalid_batches_write_nothing(paths):
+    csv_path, ingest_dir = paths
+    batch = pd.DataFrame(make_survey(10, seed=3))
+    with pytest.raises(ValueError, match="Gender"):
+        append_batch(batch.assign(Gender=7), csv_path, ingest_dir)
+    with pytest.raises(ValueError, match="no rows"):
+        append_batch(batch.iloc[:0], csv_path, ingest_dir)
+    assert read_log(ingest_dir) == {"segments": []}
+
+
+def test_aggregates_of_another_base_csv_are_not_used(paths):
+    csv_path, ingest_dir = paths
+    append_batch(pd.DataFrame(make_survey(10, seed=3)), csv_path, ingest_dir)
+    assert saved_aggregates(csv_path, ingest_dir) is not None
+    pd.DataFrame(make_survey(20, seed=4)).to_csv(csv_path, index=False)
+    assert saved_aggregates(csv_path, ingest_dir) is None
+    # the next batch recomputes them from the new base
+    assert append_batch(pd.DataFrame(make_survey(5, seed=5)), csv_path, ingest_dir)["total_rows"] == 35
@@ -0,0 +1,76 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from components.lru import LRUCache
+
+
+def test_least_recently_used_is_dropped_first():
+    cache = LRUCache(2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    assert cache.get("a", lambda: -1) == 1  # a is now the most recent
+    cache.get("c", lambda: 3)
+    assert len(cache) == 2
+    assert cache.get("b", lambda: "rebuilt") == "rebuilt"
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_concurrent_requests_for_a_key_build_it_once():
+    cache = LRUCache(4)
+    calls = []
+
+    def build():
+        calls.append(threading.get_ident())
+        time.sleep(0.2)
+        return object()
+
+    with ThreadPoolExecutor(8) as pool:
+        values = list(pool.map(lambda _: cache.get("intervals", build), range(8)))
+    assert len(calls) == 1
+    assert all(value is values[0] for value in values)
+    assert (cache.hits, cache.misses) == (7, 1)
+
+
+def test_a_slow_build_does_not_hold_up_other_keys():
+    cache = LRUCache(4)
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    with ThreadPoolExecutor(1) as pool:
+        pending = pool.submit(cache.get, "slow", slow)
+        started.wait(5)
+        begin = time.perf_counter()
+        assert cache.get("fast", lambda: "fast") == "fast"
+        assert cache.get("fast", lambda: "again") == "fast"
+        assert time.perf_counter() - begin < 1
+        release.set()
+        assert pending.result() == "slow"
+
+
+def test_a_failed_build_is_not_cached():
+    cache = LRUCache(4)
+
+    def fail():
+        raise RuntimeError("no data")
+
+    with pytest.raises(RuntimeError):
+        cache.get("key", fail)
+    assert len(cache) == 0
+    assert cache.get("key", lambda: 1) == 1
+
+
+def test_evict_drops_matching_keys():
+    cache = LRUCache(8)
+    for version in (1, 2):
+        for name in ("top5", "heatmap"):
+            cache.get((name, version), lambda: name)
+    cache.evict(lambda key: key[1] != 2)
+    assert len(cache) == 2
+    assert cache.get(("top5", 2), lambda: "rebuilt") == "top5"
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from components.permutation import holm, permutation_pvalues, shuffled_cross_sums
+
+
+def table(x_codes, y_codes):
+    # (values, levels, responses per (value, level)) of two code arrays
+    x, x_index = np.unique(x_codes, return_inverse=True)
+    y, y_index = np.unique(y_codes, return_inverse=True)
+    counts = np.zeros((len(x), len(y)), dtype=np.int64)
+    np.add.at(counts, (x_index, y_index), 1)
+    return x, y, counts
+
+
+def holm_by_definition(p):
+    # step k (smallest p first) multiplies by m - k, never below an earlier step, capped at 1
+    order = sorted(range(len(p)), key=lambda i: p[i])
+    adjusted, running = [0.0] * len(p), 0.0
+    for k, i in enumerate(order):
+        running = max(running, min(1.0, (len(p) - k) * p[i]))
+        adjusted[i] = running
+    return adjusted
+
+
+def test_holm_matches_the_step_down_definition():
+    p = pd.Series([0.01, 0.04, 0.03, 0.005, 0.5, 0.04], index=list("abcdef"))
+    np.testing.assert_allclose(holm(p), holm_by_definition(p.tolist()))
+    assert holm(p).index.equals(p.index)
+
+
+def test_shuffled_tables_have_the_distribution_of_shuffled_rows(survey):
+    x_codes, y_codes = survey["Social_Support"], survey["Depressed_Anxious"]
+    x, y, counts = table(x_codes, y_codes)
+    sums = shuffled_cross_sums(x, y, counts, 2000, np.random.default_rng(1))
+    rng = np.random.default_rng(2)
+    x_float, y_float = x_codes.astype(float), y_codes.astype(float)
+    rows = np.array([x_float @ rng.permutation(y_float) for _ in range(2000)])
+    # same margins, so the same exact mean and variance of a permuted cross sum
+    n = len(x_codes)
+    mean = x_float.sum() * y_float.sum() / n
+    variance = ((x_float - x_float.mean()) ** 2).sum() * ((y_float - y_float.mean()) ** 2).sum() / (n - 1)
+    for draws in (sums, rows):
+        assert abs(draws.mean() - mean) < 4 * np.sqrt(variance / len(draws))
+        assert draws.var() == pytest.approx(variance, rel=0.1)
+    assert stats.ks_2samp(sums, rows).pvalue > 0.01
+
+
+def test_pvalues_agree_with_the_pearson_test(survey):
+    rng = np.random.default_rng(3)
+    noise = rng.integers(1, 6, len(survey["Age"]))
+    weak = np.where(rng.random(len(noise)) < 0.03, survey["Social_Support"], noise)
+    tables = {
+        "Social_Support": table(survey["Social_Support"], survey["Depressed_Anxious"]),
+        "weak": table(weak, survey["Depressed_Anxious"]),
+        "noise": table(noise, survey["Depressed_Anxious"]),
+    }
+    result = permutation_pvalues(tables, max_permutations=20_000)
+    for name, codes in [("Social_Support", survey["Social_Support"]), ("weak", weak), ("noise", noise)]:
+        expected = stats.pearsonr(codes, survey["Depressed_Anxious"]).pvalue
+        if expected < 1e-4:
+            # resolved to the fewest shuffles: no shuffle came close
+            assert result.loc[name, "p_value"] == 1 / (result.loc[name, "permutations"] + 1)
+        else:
+            assert result.loc[name, "p_value"] == pytest.approx(expected, abs=0.03)
+    np.testing.assert_allclose(result["p_adjusted"], holm(result["p_value"]))
+    assert result.loc["Social_Support", "significant"]
+    assert not result.loc["noise", "significant"]
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.schema import SURVEY_COLUMNS, column_memory_report, read_survey_csv, to_compact_arrays
+
+from conftest import make_survey
+
+
+@pytest.fixture
+def raw():
+    # what pandas parses from a cleaned CSV: int64 codes, float64 sleep hours
+    dtypes = {col: np.float64 if col == "Sleep_Hours_Per_Night" else np.int64 for col in SURVEY_COLUMNS}
+    return pd.DataFrame(make_survey(500, seed=4)).astype(dtypes)
+
+
+def test_compact_arrays_keep_every_value_in_one_byte_codes(raw):
+    arrays = to_compact_arrays(raw)
+    assert list(arrays) == SURVEY_COLUMNS
+    for col, values in arrays.items():
+        assert values.dtype == (np.float32 if col == "Sleep_Hours_Per_Night" else np.int8)
+        assert not values.flags.writeable
+        np.testing.assert_array_equal(values, raw[col].to_numpy())
+
+
+@pytest.mark.parametrize(
+    "column, value, message",
+    [
+        ("Gender", 3, "outside 1..2"),
+        ("Age", 200, "outside 10..80"),  # would wrap around to -56 as int8
+        ("Social_Support", 2.5, "non-integer"),
+        ("Field_of_Study", np.nan, "missing"),
+    ],
+)
+def test_invalid_values_are_rejected(raw, column, value, message):
+    raw[column] = raw[column].astype(np.float64)
+    raw.loc[7, column] = value
+    with pytest.raises(ValueError, match=message):
+        to_compact_arrays(raw)
+
+
+def test_columns_must_match_the_schema(raw):
+    with pytest.raises(ValueError, match="missing: \\['Gender'\\]"):
+        to_compact_arrays(raw.drop(columns="Gender"))
+    with pytest.raises(ValueError, match="unexpected: \\['Notes'\\]"):
+        to_compact_arrays(raw.assign(Notes=1))
+
+
+@pytest.mark.parametrize("chunksize", [64, 500, 10_000])
+def test_chunked_csv_parse_matches_pandas(raw, tmp_path, chunksize):
+    path = tmp_path / "survey.csv"
+    raw.to_csv(path, index=False)
+    arrays = read_survey_csv(path, chunksize=chunksize)
+    pd.testing.assert_frame_equal(pd.DataFrame(arrays).astype(raw.dtypes), pd.read_csv(path))
+
+
+def test_empty_csv_gives_empty_columns(tmp_path):
+    path = tmp_path / "survey.csv"
+    path.write_text(",".join(SURVEY_COLUMNS) + "\n")
+    arrays = read_survey_csv(path)
+    assert all(len(values) == 0 for values in arrays.values())
+
+
+def test_memory_report_against_pandas_defaults(raw):
+    report = column_memory_report(to_compact_arrays(raw)).set_index("column")
+    assert report["bytes"].sum() == 21 * 500 + 4 * 500
+    assert report["default_bytes"].sum() == raw.memory_usage(index=False).sum()
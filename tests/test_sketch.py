@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from components.sketch import K, QuantileSketch
+
+QS = np.linspace(0.01, 0.99, 99)
+
+
+@pytest.fixture(scope="module")
+def values():
+    rng = np.random.default_rng(5)
+    return np.concatenate([rng.normal(30, 8, 150_000), rng.exponential(10, 50_000)])
+
+
+def rank_errors(sketch, values):
+    # how far each reported quantile's true rank is from the fraction asked for
+    ordered = np.sort(values)
+    ranks = np.searchsorted(ordered, sketch.quantiles(QS), side="right") / len(values)
+    return np.abs(ranks - QS)
+
+
+def test_small_columns_are_exact():
+    values = np.random.default_rng(6).integers(0, 60, K // 2).astype(float)
+    sketch = QuantileSketch().update(values)
+    np.testing.assert_array_equal(sketch.quantiles(QS), np.quantile(values, QS, method="inverted_cdf"))
+    assert sketch.rank(np.median(values)) == np.mean(values <= np.median(values))
+
+
+def test_large_columns_stay_small_and_within_one_percent(values):
+    sketch = QuantileSketch()
+    for batch in np.array_split(values, 37):
+        sketch.update(batch)
+    retained = sum(len(level) for level in sketch.levels)
+    assert retained < 4 * K
+    assert sum(len(level) * 2**h for h, level in enumerate(sketch.levels)) == pytest.approx(len(values), rel=0.01)
+    assert rank_errors(sketch, values).max() < 0.015
+    assert (sketch.min, sketch.max) == (values.min(), values.max())
+    assert sketch.quantiles([0, 1]).tolist() == [values.min(), values.max()]
+
+
+def test_merged_sketches_are_as_accurate(values):
+    parts = [QuantileSketch().update(part) for part in np.array_split(values, 8)]
+    merged = QuantileSketch()
+    for part in parts:
+        merged.merge(part)
+    assert merged.n == len(values)
+    assert rank_errors(merged, values).max() < 0.015
+
+
+def test_round_trip_and_empty(values):
+    sketch = QuantileSketch().update(values[:5000])
+    restored = QuantileSketch.from_arrays(sketch.to_arrays())
+    np.testing.assert_array_equal(restored.quantiles(QS), sketch.quantiles(QS))
+    assert restored.n == sketch.n
+    assert np.isnan(QuantileSketch().quantiles(QS)).all()
+    assert np.isnan(QuantileSketch().rank(1.0))
+
+
+def test_box_stats_match_numpy_percentiles():
+    values = np.random.default_rng(7).integers(0, 60, 150).astype(float)
+    stats = QuantileSketch().update(values).box_stats()
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75], method="inverted_cdf")
+    assert (stats["q1"], stats["median"], stats["q3"]) == (q1, median, q3)
+    assert stats["lower_fence"] == max(values.min(), q1 - 1.5 * (q3 - q1))
+    assert stats["upper_fence"] == min(values.max(), q3 + 1.5 * (q3 - q1))
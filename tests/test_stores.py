@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.aggregates import SurveyAggregates
+from components.column_store import open_column_store
+from components.features import DERIVED_COLUMNS, derive_columns
+from components.ingest import append_batch
+from components.partitions import PARTITION_COLUMNS, open_partition_store
+from components.schema import SURVEY_COLUMNS, read_survey_csv
+from components.sqlite_store import SqliteStore, _write_database
+
+from conftest import make_survey
+
+
+@pytest.fixture(scope="module")
+def sqlite_store(survey, tmp_path_factory):
+    db_path = tmp_path_factory.mktemp("sqlite") / "survey.sqlite"
+    chunks = ({col: values[start:start + 700] for col, values in survey.items()} for start in range(0, 3000, 700))
+    store = SqliteStore(_write_database(db_path, chunks))
+    yield store
+    store.close()
+
+
+FILTERS = [None, {"Gender": [1]}, {"Field_of_Study": [2, 4], "Age": [19, 20, 21]}, {"Gender": [99]}]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_sqlite_count_matches_pandas(sqlite_store, survey, filters):
+    frame = pd.DataFrame(survey)
+    mask = np.ones(len(frame), dtype=bool)
+    for col, codes in (filters or {}).items():
+        mask &= frame[col].isin(codes).to_numpy()
+    assert sqlite_store.count(filters) == mask.sum()
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_sqlite_chunks_return_the_filtered_rows_in_order(sqlite_store, survey, filters):
+    frame = pd.DataFrame(survey)
+    for col, codes in (filters or {}).items():
+        frame = frame[frame[col].isin(codes)]
+    batches = list(sqlite_store.chunks(["Age", "Sleep_Hours_Per_Night"], chunksize=400, filters=filters))
+    assert all(len(batch["Age"]) <= 400 for batch in batches)
+    for col in ("Age", "Sleep_Hours_Per_Night"):
+        values = np.concatenate([batch[col] for batch in batches])
+        assert values.dtype == survey[col].dtype
+        np.testing.assert_array_equal(values, frame[col].to_numpy())
+
+
+def test_sqlite_columns_and_stored_aggregates(sqlite_store, survey):
+    assert len(sqlite_store) == 3000
+    for col in SURVEY_COLUMNS:
+        np.testing.assert_array_equal(sqlite_store[col], survey[col])
+    expected = SurveyAggregates.from_arrays(survey)
+    np.testing.assert_allclose(sqlite_store.aggregates().corr(), expected.corr())
+
+
+@pytest.fixture
+def survey_files(tmp_path):
+    # a base CSV with one ingested batch, and every row they hold, in order
+    csv_path, ingest_dir = tmp_path / "survey.csv", tmp_path / "ingest"
+    pd.DataFrame(make_survey(2000, seed=11)).to_csv(csv_path, index=False)
+    append_batch(pd.DataFrame(make_survey(150, seed=12)), csv_path, ingest_dir)
+    rows = {
+        col: np.concatenate([read_survey_csv(csv_path)[col], read_survey_csv(ingest_dir / "batch-000001.csv")[col]])
+        for col in SURVEY_COLUMNS
+    }
+    return csv_path, ingest_dir, rows
+
+
+def test_column_store_maps_the_base_and_ingested_rows(survey_files, tmp_path):
+    csv_path, ingest_dir, rows = survey_files
+    store = open_column_store(csv_path, tmp_path / "store", ingest_dir)
+    assert len(store) == 2150
+    assert isinstance(store["Age"], np.memmap)
+    assert store.loaded_columns() == ["Age"]
+    for col in SURVEY_COLUMNS:
+        np.testing.assert_array_equal(store[col], rows[col])
+    expected = derive_columns(rows)
+    for name in DERIVED_COLUMNS:
+        np.testing.assert_array_equal(np.asarray(store[name]), np.asarray(expected[name]))
+    batches = list(store.chunks(["Sleep_Hours_Per_Night"], chunksize=1000))
+    assert [len(batch["Sleep_Hours_Per_Night"]) for batch in batches] == [1000, 1000, 150]
+    hours = np.concatenate([batch["Sleep_Hours_Per_Night"] for batch in batches])
+    np.testing.assert_array_equal(hours, rows["Sleep_Hours_Per_Night"])
+
+
+def test_column_store_drops_bytes_of_a_crashed_append(survey_files, tmp_path):
+    csv_path, ingest_dir, rows = survey_files
+    store_dir = tmp_path / "store"
+    open_column_store(csv_path, store_dir, ingest_dir)
+    with open(store_dir / "Age.bin", "ab") as f:
+        f.write(b"\x7f" * 33)  # written before a crash, never recorded in the manifest
+    batch = pd.DataFrame(make_survey(40, seed=13))
+    append_batch(batch, csv_path, ingest_dir)
+    store = open_column_store(csv_path, store_dir, ingest_dir)
+    np.testing.assert_array_equal(store["Age"], np.concatenate([rows["Age"], batch["Age"]]))
+
+
+def test_column_store_is_rebuilt_for_a_new_csv(survey_files, tmp_path):
+    csv_path, ingest_dir, _ = survey_files
+    open_column_store(csv_path, tmp_path / "store", ingest_dir)
+    replacement = make_survey(300, seed=14)
+    pd.DataFrame(replacement).to_csv(csv_path, index=False)
+    store = open_column_store(csv_path, tmp_path / "store", tmp_path / "no_ingest")
+    np.testing.assert_array_equal(store["Gender"], replacement["Gender"])
+
+
+PARTITION_FILTERS = [
+    None,
+    {"Field_of_Study": [3]},
+    {"Type_of_Institution": [2], "Field_of_Study": [1, 5]},
+    {"Field_of_Study": [2], "Social_Support": [4, 5]},
+    {"Age": [80]},
+]
+
+
+def sorted_frame(arrays) -> pd.DataFrame:
+    # partitions hold the rows grouped by partition, so compare them as sets of rows
+    return pd.DataFrame(arrays).sort_values(SURVEY_COLUMNS, kind="stable").reset_index(drop=True)
+
+
+@pytest.fixture
+def partition_store(survey_files, tmp_path):
+    csv_path, ingest_dir, _ = survey_files
+    return open_partition_store(csv_path, tmp_path / "partitions", ingest_dir)
+
+
+@pytest.mark.parametrize("filters", PARTITION_FILTERS)
+def test_partition_queries_match_pandas(partition_store, survey_files, filters):
+    frame = pd.DataFrame(survey_files[2])
+    for col, codes in (filters or {}).items():
+        frame = frame[frame[col].isin(codes)]
+    selected = partition_store.select(SURVEY_COLUMNS, filters)
+    pd.testing.assert_frame_equal(sorted_frame(selected), sorted_frame(frame))
+    assert partition_store.count(filters) == len(frame)
+    if len(frame) > 1:
+        corr = partition_store.moments(filters).corr()
+        pd.testing.assert_frame_equal(corr, frame.corr(), check_exact=False, atol=1e-9)
+
+
+def test_partitions_are_pruned_by_key_and_column_ranges(partition_store, survey_files):
+    frame = pd.DataFrame(survey_files[2])
+    matches = partition_store.matching_partitions({"Field_of_Study": [3]})
+    assert {entry["key"][1] for _, entry in matches} == {3}
+    assert len(matches) == frame.loc[frame["Field_of_Study"] == 3, "Type_of_Institution"].nunique()
+    assert partition_store.matching_partitions({"Age": [80]}) == []
+    assert len(partition_store.matching_partitions()) == len(frame.groupby(PARTITION_COLUMNS))
+
+
+def test_partition_chunks_and_columns_cover_every_row(partition_store, survey_files):
+    batches = list(partition_store.chunks(SURVEY_COLUMNS, chunksize=200))
+    assert max(len(batch["Age"]) for batch in batches) <= 200
+    merged = {col: np.concatenate([batch[col] for batch in batches]) for col in SURVEY_COLUMNS}
+    pd.testing.assert_frame_equal(sorted_frame(merged), sorted_frame(survey_files[2]))
+    # whole columns are in the same partition order as the chunks
+    np.testing.assert_array_equal(partition_store["Social_Support"], merged["Social_Support"])
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components.bootstrap import bootstrap_corr
+from components.cube import CountCube
+from components.weighting import RAKING_DIMS, SurveyWeights, effective_n, rake
+
+
+def _margin(table, axis):
+    return table.sum(axis=tuple(i for i in range(table.ndim) if i != axis))
+
+
+def test_rake_meets_every_target_margin():
+    counts = np.random.default_rng(1).integers(1, 50, (2, 3, 2)).astype(float)
+    targets = {"Gender": [0.5, 0.5], "Current_Level_of_Studies": [6, 3, 1], "Type_of_Institution": [1, 3]}
+    weighted = counts * rake(counts, targets)
+    for dim, shares in targets.items():
+        axis = RAKING_DIMS.index(dim)
+        np.testing.assert_allclose(_margin(weighted, axis), np.array(shares) / sum(shares) * counts.sum())
+
+
+def test_rake_on_one_dim_is_post_stratification():
+    counts = np.random.default_rng(2).integers(1, 50, (2, 3, 2)).astype(float)
+    weights = rake(counts, {"Gender": [0.7, 0.3]})
+    shares = np.array([0.7, 0.3]) * counts.sum() / _margin(counts, 0)
+    np.testing.assert_allclose(weights, np.broadcast_to(shares[:, None, None], counts.shape))
+
+
+def test_rake_rejects_targets_it_cannot_meet():
+    counts = np.ones((2, 3, 2))
+    counts[1] = 0
+    with pytest.raises(ValueError):
+        rake(counts, {"Gender": [0.5, 0.5]})
+    with pytest.raises(ValueError):
+        rake(counts, {"Gender": [0, 0]})
+
+
+def test_row_cell_and_cube_weights_agree(survey):
+    cube = CountCube.from_arrays(survey)
+    weights = SurveyWeights.from_cube(cube, {"Gender": [2, 1], "Type_of_Institution": [1, 1]})
+    rows = weights.rows(survey)
+    assert rows.sum() == pytest.approx(len(rows))
+    assert cube.weighted(weights.cube(cube)).counts.sum() == pytest.approx(rows.sum())
+
+    frame = pd.DataFrame(survey)
+    shares = pd.Series(rows).groupby(frame["Gender"]).sum() / rows.sum()
+    np.testing.assert_allclose(shares.to_numpy(), [2 / 3, 1 / 3])
+
+
+def test_effective_n():
+    assert effective_n([1, 1], [10, 30]) == pytest.approx(40)
+    # Kish: (Σ w n)² / Σ w² n
+    assert effective_n([1, 3], [10, 10]) == pytest.approx(40**2 / 100)
+    assert effective_n([0, 0], [10, 10]) == 0
+
+
+def test_bootstrap_of_no_responses_is_nan():
+    replicates = bootstrap_corr([1, 2], [1, 2, 3], np.zeros((2, 3)), resamples=10)
+    assert replicates.shape == (10,) and np.isnan(replicates).all()
+
+
+def test_cohort_weighted_to_zero_has_no_intervals(dashboard, serial_bootstrap):
+    # only women selected, and a target share of 0 for women: nobody is left once weighted
+    weights = dashboard.weights({"Gender": [0, 1]})
+    view = dashboard.view({"Gender": [1]}, weights)
+    assert view.n > 0 and view.cube.n == 0 and view.moments.n == 0
+    intervals = view.correlation_intervals(resamples=20)
+    assert intervals[["low", "high"]].isna().all().all()